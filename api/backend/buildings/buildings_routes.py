@@ -1,7 +1,7 @@
 # api/backend/building/building_routes.py
 
 from flask import Blueprint, request, jsonify, make_response
-from backend.db_connection import db
+from backend.db_connection import db, ids
 
 building_bp = Blueprint('building', __name__, url_prefix='/buildings')
 
@@ -51,16 +51,18 @@ def create_building():
             {'error': 'Need address and managerID'}, 400
         )
 
+    # buildingID has no AUTO_INCREMENT, so take one from the id allocator
+    new_id = ids.next_id('building')
+
     cursor = db.get_db().cursor()
     cursor.execute(
         """
-        INSERT INTO building (address, managerID)
-        VALUES (%s, %s)
+        INSERT INTO building (buildingID, address, managerID)
+        VALUES (%s, %s, %s)
         """,
-        (address, manager_id)
+        (new_id, address, manager_id)
     )
     db.get_db().commit()
-    new_id = cursor.lastrowid
 
     return make_response({'buildingID': new_id}, 201)
 
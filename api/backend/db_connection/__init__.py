@@ -1,10 +1,29 @@
 #------------------------------------------------------------
 # This file creates a shared DB connection resource
 #------------------------------------------------------------
-from flaskext.mysql import MySQL
 from pymysql import cursors
 
+from backend.db_connection.idempotency import IdempotencyStore
+from backend.db_connection.ids import IdAllocator
+from backend.db_connection.pool import ConnectionPool, MySQLPool, PoolTimeout
+from backend.db_connection.schema import SchemaCapabilities
 
-# the parameter instructs the connection to return data 
-# as a dictionary object. 
-db = MySQL(cursorclass=cursors.DictCursor)
\ No newline at end of file
+
+# the parameter instructs the connection to return data
+# as a dictionary object. Connections are pooled (see pool.py),
+# so db.get_db() reuses an open connection instead of dialing MySQL.
+db = MySQLPool(cursorclass=cursors.DictCursor)
+
+# primary keys for new rows come from here, e.g. ids.next_id('part')
+ids = IdAllocator(db)
+
+# which optional tables/columns exist, e.g. schema.has_table('requestPhotos')
+schema = SchemaCapabilities(db)
+
+# Idempotency-Key handling for retried writes, e.g. @idempotency.idempotent
+idempotency = IdempotencyStore(db, schema)
+
+__all__ = [
+    'db', 'ids', 'schema', 'idempotency',
+    'ConnectionPool', 'IdAllocator', 'IdempotencyStore', 'MySQLPool', 'PoolTimeout', 'SchemaCapabilities',
+]
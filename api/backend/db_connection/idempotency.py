@@ -0,0 +1,182 @@
+#------------------------------------------------------------
+# Idempotency-Key support for non-idempotent POST/PUT routes.
+#
+# A client that may retry (Streamlit reruns, double clicks, timeouts)
+# sends the same Idempotency-Key header with every attempt. The first
+# attempt runs the route and its response is stored; later attempts
+# get that stored response back (Idempotent-Replayed: true) without
+# running the route again.
+#
+# Keys live in the idempotencyKey table, keyed by a SHA-256 of route
+# + key so rows are fixed-size, and expire after IDEMPOTENCY_TTL
+# seconds. The claim row is inserted on the request's own connection,
+# so it commits or rolls back together with the route's writes, and a
+# concurrent duplicate waits on its row lock instead of inserting
+# twice. A per-worker LRU answers most retries without a query.
+#------------------------------------------------------------
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+import pymysql
+from flask import request, make_response
+
+# MySQL duplicate-key error
+ER_DUP_ENTRY = 1062
+
+
+class IdempotencyStore:
+
+    def __init__(self, db, schema, ttl=24 * 3600, cache_size=1000):
+        self.db = db
+        self.schema = schema
+        self.ttl = ttl
+        self.cache_size = cache_size
+        self._cache = OrderedDict()   # keyHash -> (requestHash, status, body, expires)
+        self._lock = threading.Lock()
+        self._claims = 0
+
+    def init_app(self, app):
+        app.config.setdefault('IDEMPOTENCY_TTL', 24 * 3600)
+        app.config.setdefault('IDEMPOTENCY_CACHE_SIZE', 1000)
+        self.ttl = int(app.config['IDEMPOTENCY_TTL'])
+        self.cache_size = int(app.config['IDEMPOTENCY_CACHE_SIZE'])
+
+    def idempotent(self, view):
+        """Route decorator: honor an Idempotency-Key header on this route."""
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            key = request.headers.get('Idempotency-Key')
+            if key is None:
+                return view(*args, **kwargs)
+            if not key or len(key) > 255:
+                return make_response({'error': 'Idempotency-Key must be 1-255 characters'}, 400)
+            return self._run(view, key, args, kwargs)
+        return wrapper
+
+    # -------------------------
+    # internals
+    # -------------------------
+    def _run(self, view, key, args, kwargs):
+        key_hash = hashlib.sha256(f"{request.endpoint}\n{key}".encode()).digest()
+        request_hash = hashlib.sha256(
+            request.method.encode() + b' ' + request.path.encode() + b'\n' + request.get_data()
+        ).digest()
+
+        cached = self._cache_get(key_hash)
+        if cached is not None:
+            return self._replay(cached, request_hash)
+
+        if not self.schema.has_table('idempotencyKey'):
+            # not migrated yet: run normally rather than fail the write
+            return view(*args, **kwargs)
+
+        conn = self.db.get_db()
+        stored = self._lookup(conn, key_hash)
+        if stored is not None:
+            return self._replay(stored, request_hash)
+
+        try:
+            self._claim(conn, key_hash, request_hash)
+        except pymysql.IntegrityError as e:
+            if e.args[0] != ER_DUP_ENTRY:
+                raise
+            # another attempt with this key committed first; end our snapshot and read it
+            conn.rollback()
+            stored = self._lookup(conn, key_hash)
+            if stored is not None:
+                return self._replay(stored, request_hash)
+            return make_response({'error': 'a request with this Idempotency-Key is still in progress'}, 409)
+
+        try:
+            response = make_response(view(*args, **kwargs))
+        except Exception:
+            conn.rollback()   # releases the claim
+            raise
+
+        if response.status_code >= 500 or not response.is_json:
+            # not a result worth replaying; let the client retry for real
+            conn.rollback()
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM idempotencyKey WHERE keyHash = %s AND statusCode IS NULL", (key_hash,))
+            conn.commit()
+            return response
+
+        body = response.get_data(as_text=True)
+        cursor = conn.cursor()
+        cursor.execute(
+            "UPDATE idempotencyKey SET statusCode = %s, responseBody = %s WHERE keyHash = %s",
+            (response.status_code, body, key_hash)
+        )
+        conn.commit()
+        self._cache_put(key_hash, (request_hash, response.status_code, body, time.time() + self.ttl))
+        return response
+
+    def _lookup(self, conn, key_hash):
+        """Stored (requestHash, status, body, expires) for the key, or None if absent/expired."""
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT requestHash, statusCode, responseBody,
+                   TIMESTAMPDIFF(SECOND, NOW(), expiresAt) AS secondsLeft
+            FROM idempotencyKey
+            WHERE keyHash = %s
+            """,
+            (key_hash,)
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        if row['secondsLeft'] <= 0:
+            cursor.execute("DELETE FROM idempotencyKey WHERE keyHash = %s AND expiresAt <= NOW()", (key_hash,))
+            conn.commit()
+            return None
+        stored = (bytes(row['requestHash']), row['statusCode'], row['responseBody'], time.time() + row['secondsLeft'])
+        if row['statusCode'] is not None:
+            self._cache_put(key_hash, stored)
+        return stored
+
+    def _claim(self, conn, key_hash, request_hash):
+        cursor = conn.cursor()
+        self._claims += 1
+        if self._claims % 100 == 0:
+            # keep the table small: clear out a batch of expired keys now and then
+            cursor.execute("DELETE FROM idempotencyKey WHERE expiresAt <= NOW() LIMIT 500")
+        cursor.execute(
+            """
+            INSERT INTO idempotencyKey (keyHash, requestHash, expiresAt)
+            VALUES (%s, %s, NOW() + INTERVAL %s SECOND)
+            """,
+            (key_hash, request_hash, self.ttl)
+        )
+
+    def _replay(self, stored, request_hash):
+        stored_hash, status, body, _ = stored
+        if stored_hash != request_hash:
+            return make_response({'error': 'Idempotency-Key was already used with a different request'}, 422)
+        if status is None:
+            return make_response({'error': 'a request with this Idempotency-Key is still in progress'}, 409)
+        response = make_response(body, status)
+        response.mimetype = 'application/json'
+        response.headers['Idempotent-Replayed'] = 'true'
+        return response
+
+    def _cache_get(self, key_hash):
+        with self._lock:
+            cached = self._cache.get(key_hash)
+            if cached is None:
+                return None
+            if cached[3] <= time.time():
+                del self._cache[key_hash]
+                return None
+            self._cache.move_to_end(key_hash)
+            return cached
+
+    def _cache_put(self, key_hash, stored):
+        with self._lock:
+            self._cache[key_hash] = stored
+            self._cache.move_to_end(key_hash)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
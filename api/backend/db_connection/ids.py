@@ -0,0 +1,123 @@
+#------------------------------------------------------------
+# Block (hi-lo) ID allocation backed by the idSequence table.
+#
+# The tables use plain INT primary keys (no AUTO_INCREMENT), and
+# computing MAX(id) + 1 before each insert both races under
+# concurrent requests and scans the table. Instead each worker
+# reserves a block of IDs with one atomic UPDATE and hands them
+# out from memory until the block runs out.
+#------------------------------------------------------------
+import os
+import threading
+
+
+# sequence name -> (table, id column) used to seed a missing sequence row
+SEQUENCES = {
+    'maintenanceRequest': ('maintenanceRequest', 'requestID'),
+    'part': ('part', 'partID'),
+    'building': ('building', 'buildingID'),
+}
+
+
+class IdAllocator:
+    """
+    Hands out unique IDs per sequence, reserving block_size at a time.
+
+    Reservations run on their own pooled connection and commit
+    immediately, so they never hold the sequence row lock for the length
+    of a request's transaction. The connection is taken without holding
+    the allocator lock, so threads waiting for the pool don't also queue
+    behind each other. IDs from a block that is not fully used (worker
+    restart, rolled-back insert) are skipped, leaving gaps.
+    """
+
+    def __init__(self, db, block_size=20):
+        self.db = db
+        self.block_size = block_size
+        self._lock = threading.Lock()
+        self._blocks = {}   # name -> list of [next, end) ranges
+        self._pid = os.getpid()
+
+    def init_app(self, app):
+        app.config.setdefault('ID_BLOCK_SIZE', 20)
+        self.block_size = max(int(app.config['ID_BLOCK_SIZE']), 1)
+
+    def next_id(self, name):
+        return self.reserve(name, 1)[0]
+
+    def reserve(self, name, count):
+        """Return a list of count unused IDs for the sequence."""
+        if name not in SEQUENCES:
+            raise KeyError(f"unknown id sequence '{name}'")
+
+        ids = []
+        while True:
+            with self._lock:
+                if os.getpid() != self._pid:
+                    # blocks copied from the parent process are also used there
+                    self._blocks = {}
+                    self._pid = os.getpid()
+                self._take(name, ids, count)
+            if len(ids) >= count:
+                return ids
+            # big requests take one block sized to fit instead of many small ones
+            block = self._reserve_block(name, max(self.block_size, count - len(ids)))
+            with self._lock:
+                # threads that reserved at the same time each keep their
+                # leftovers for later calls
+                self._blocks.setdefault(name, []).append(block)
+
+    def _take(self, name, ids, count):
+        # self._lock held: move IDs from the cached blocks into ids
+        blocks = self._blocks.get(name, [])
+        while blocks and len(ids) < count:
+            start, end = blocks[0]
+            take = min(end - start, count - len(ids))
+            ids.extend(range(start, start + take))
+            if start + take >= end:
+                blocks.pop(0)
+            else:
+                blocks[0] = (start + take, end)
+
+    def _reserve_block(self, name, size):
+        conn = self.db.pool.acquire()
+        try:
+            cursor = conn.cursor()
+            # LAST_INSERT_ID(expr) makes the new value readable on this
+            # connection without a second locking read
+            cursor.execute(
+                "UPDATE idSequence SET nextID = LAST_INSERT_ID(nextID + %s) WHERE name = %s",
+                (size, name)
+            )
+            if cursor.rowcount == 0:
+                self._seed(cursor, name)
+                cursor.execute(
+                    "UPDATE idSequence SET nextID = LAST_INSERT_ID(nextID + %s) WHERE name = %s",
+                    (size, name)
+                )
+            cursor.execute("SELECT LAST_INSERT_ID() AS nextID")
+            end = int(_first_value(cursor.fetchone()))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self.db.pool.release(conn)
+        return end - size, end
+
+    @staticmethod
+    def _seed(cursor, name):
+        # first use against a database without a row for this sequence:
+        # continue after the current maximum
+        table, column = SEQUENCES[name]
+        cursor.execute(
+            f"INSERT IGNORE INTO idSequence (name, nextID) "
+            f"SELECT %s, COALESCE(MAX({column}), 0) + 1 FROM {table}",
+            (name,)
+        )
+
+
+def _first_value(row):
+    if isinstance(row, dict):
+        return list(row.values())[0]
+    return row[0]
@@ -0,0 +1,332 @@
+#------------------------------------------------------------
+# A small thread-safe pool of pymysql connections.
+#
+# flaskext.mysql opened (and closed) a brand new connection for
+# every request, so every route paid a TCP + auth handshake.
+# This pool keeps connections open between requests and hands
+# them back out through the same db.get_db() API.
+#------------------------------------------------------------
+import os
+import threading
+import time
+from collections import deque
+
+import pymysql
+from flask import g, jsonify, make_response
+
+
+class PoolTimeout(Exception):
+    """Raised when no connection became free within the checkout timeout."""
+
+
+class ConnectionPool:
+    """
+    Bounded pool of pymysql connections.
+
+    Args:
+        connect: zero-argument callable returning a new pymysql connection
+        min_size: connections kept open (and created by warm_up)
+        max_size: hard limit on open connections
+        idle_timeout: seconds an idle connection above min_size is kept
+        ping_after: seconds a connection may sit idle before it is pinged on checkout
+        timeout: seconds to wait for a free connection before raising PoolTimeout
+    """
+
+    def __init__(self, connect, min_size=2, max_size=10, idle_timeout=300,
+                 ping_after=5, timeout=10):
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max(max_size, 1)
+        self.idle_timeout = idle_timeout
+        self.ping_after = ping_after
+        self.timeout = timeout
+
+        self._lock = threading.Condition()
+        self._idle = deque()          # (connection, last_used) pairs, most recent on the right
+        self._size = 0                # open connections, idle + in use
+        self._waiting = 0
+        self._pid = os.getpid()
+
+        self._acquires = 0
+        self._timeouts = 0
+        self._created = 0
+        self._discarded = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    # -------------------------
+    # checkout / checkin
+    # -------------------------
+    def acquire(self, timeout=None):
+        self._check_fork()
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        deadline = started + timeout
+
+        while True:
+            conn = None
+            create = False
+            with self._lock:
+                while not self._idle and self._size >= self.max_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._timeouts += 1
+                        raise PoolTimeout(
+                            f"no database connection free after {timeout}s "
+                            f"({self._size} open, max {self.max_size})"
+                        )
+                    self._waiting += 1
+                    try:
+                        self._lock.wait(remaining)
+                    finally:
+                        self._waiting -= 1
+
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                else:
+                    # reserve the slot now, open the socket outside the lock
+                    self._size += 1
+                    create = True
+
+            if create:
+                try:
+                    conn = self._new_connection()
+                except Exception:
+                    with self._lock:
+                        self._size -= 1
+                        self._lock.notify()
+                    raise
+            elif not self._is_alive(conn, last_used):
+                self._discard(conn)
+                continue
+
+            self._record_wait(time.monotonic() - started)
+            return conn
+
+    def release(self, conn):
+        if conn is None:
+            return
+        if os.getpid() != self._pid:
+            # connection was inherited across a fork; never hand it back out
+            return
+        try:
+            # drop anything the route left uncommitted, like closing did before
+            if conn.open:
+                conn.rollback()
+            healthy = conn.open
+        except Exception:
+            healthy = False
+
+        if not healthy:
+            self._discard(conn)
+            return
+
+        with self._lock:
+            self._idle.append((conn, time.monotonic()))
+            self._lock.notify()
+        self._prune_idle()
+
+    # -------------------------
+    # lifecycle
+    # -------------------------
+    def warm_up(self):
+        """Open connections until at least min_size exist."""
+        self._check_fork()
+        opened = []
+        try:
+            while True:
+                with self._lock:
+                    if self._size >= min(self.min_size, self.max_size):
+                        break
+                    self._size += 1
+                try:
+                    opened.append(self._new_connection())
+                except Exception:
+                    with self._lock:
+                        self._size -= 1
+                    raise
+        finally:
+            now = time.monotonic()
+            with self._lock:
+                self._idle.extend((c, now) for c in opened)
+                self._lock.notify_all()
+        return len(opened)
+
+    def close_all(self):
+        """Close every idle connection (in-use ones are closed when released)."""
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._discarded += len(idle)
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    def reset_after_fork(self):
+        """
+        Forget connections inherited from a parent process.
+
+        The sockets are shared with the parent, so they are dropped without
+        sending COM_QUIT (which would kill the parent's session too). The
+        old lock is replaced rather than taken, since a parent thread may
+        have held it at fork time.
+        """
+        self._lock = threading.Condition()
+        self._idle = deque()
+        self._size = 0
+        self._waiting = 0
+        self._pid = os.getpid()
+
+    def stats(self):
+        with self._lock:
+            idle = len(self._idle)
+            return {
+                'size': self._size,
+                'inUse': self._size - idle,
+                'idle': idle,
+                'waiting': self._waiting,
+                'minSize': self.min_size,
+                'maxSize': self.max_size,
+                'acquires': self._acquires,
+                'timeouts': self._timeouts,
+                'created': self._created,
+                'discarded': self._discarded,
+                'waitTotalMs': round(self._wait_total * 1000, 3),
+                'waitAvgMs': round(self._wait_total * 1000 / self._acquires, 3) if self._acquires else 0.0,
+                'waitMaxMs': round(self._wait_max * 1000, 3),
+            }
+
+    # -------------------------
+    # internals
+    # -------------------------
+    def _new_connection(self):
+        conn = self._connect()
+        with self._lock:
+            self._created += 1
+        return conn
+
+    def _is_alive(self, conn, last_used):
+        if not conn.open:
+            return False
+        if time.monotonic() - last_used < self.ping_after:
+            return True
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, conn):
+        with self._lock:
+            self._size -= 1
+            self._discarded += 1
+            self._lock.notify()
+        self._close_quietly(conn)
+
+    def _prune_idle(self):
+        # oldest connections sit on the left; close them while above min_size
+        expired = []
+        cutoff = time.monotonic() - self.idle_timeout
+        with self._lock:
+            while (self._idle and self._size > self.min_size
+                   and self._idle[0][1] < cutoff):
+                expired.append(self._idle.popleft()[0])
+                self._size -= 1
+                self._discarded += 1
+        for conn in expired:
+            self._close_quietly(conn)
+
+    def _record_wait(self, waited):
+        with self._lock:
+            self._acquires += 1
+            self._wait_total += waited
+            if waited > self._wait_max:
+                self._wait_max = waited
+
+    def _check_fork(self):
+        if os.getpid() != self._pid:
+            self.reset_after_fork()
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+class MySQLPool:
+    """
+    Drop-in replacement for flaskext.mysql.MySQL backed by a ConnectionPool.
+
+    Routes keep calling db.get_db(); the first call in a request checks a
+    connection out and the app-context teardown hands it back.
+    """
+
+    def __init__(self, app=None, **connect_args):
+        self.connect_args = connect_args
+        self.app = None
+        self._pool = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.app = app
+        app.config.setdefault('MYSQL_DATABASE_HOST', 'localhost')
+        app.config.setdefault('MYSQL_DATABASE_PORT', 3306)
+        app.config.setdefault('MYSQL_DATABASE_USER', None)
+        app.config.setdefault('MYSQL_DATABASE_PASSWORD', None)
+        app.config.setdefault('MYSQL_DATABASE_DB', None)
+        app.config.setdefault('MYSQL_DATABASE_CHARSET', 'utf8')
+        app.config.setdefault('MYSQL_CONNECT_TIMEOUT', 10)
+        app.config.setdefault('MYSQL_POOL_MIN_SIZE', 2)
+        app.config.setdefault('MYSQL_POOL_MAX_SIZE', 12)
+        app.config.setdefault('MYSQL_POOL_IDLE_TIMEOUT', 300)
+        app.config.setdefault('MYSQL_POOL_PING_AFTER', 5)
+        app.config.setdefault('MYSQL_POOL_TIMEOUT', 10)
+
+        self._pool = ConnectionPool(
+            self.connect,
+            min_size=int(app.config['MYSQL_POOL_MIN_SIZE']),
+            max_size=int(app.config['MYSQL_POOL_MAX_SIZE']),
+            idle_timeout=float(app.config['MYSQL_POOL_IDLE_TIMEOUT']),
+            ping_after=float(app.config['MYSQL_POOL_PING_AFTER']),
+            timeout=float(app.config['MYSQL_POOL_TIMEOUT']),
+        )
+        app.extensions['mysql_pool'] = self._pool
+        app.teardown_appcontext(self.teardown)
+        app.register_error_handler(PoolTimeout, self._pool_timeout_response)
+
+    @property
+    def pool(self):
+        return self._pool
+
+    def connect(self):
+        """Open a new (unpooled) connection using the app's MYSQL_* config."""
+        config = self.app.config
+        args = dict(self.connect_args)
+        args['host'] = config['MYSQL_DATABASE_HOST']
+        args['port'] = int(config['MYSQL_DATABASE_PORT'])
+        args['user'] = config['MYSQL_DATABASE_USER']
+        args['password'] = config['MYSQL_DATABASE_PASSWORD'] or ''
+        args['database'] = config['MYSQL_DATABASE_DB']
+        args['charset'] = config['MYSQL_DATABASE_CHARSET']
+        args['connect_timeout'] = int(config['MYSQL_CONNECT_TIMEOUT'])
+        return pymysql.connect(**args)
+
+    def get_db(self):
+        if '_mysql_conn' not in g:
+            g._mysql_conn = self._pool.acquire()
+        return g._mysql_conn
+
+    def teardown(self, exception):
+        conn = g.pop('_mysql_conn', None)
+        if conn is not None:
+            self._pool.release(conn)
+
+    def stats(self):
+        return self._pool.stats()
+
+    @staticmethod
+    def _pool_timeout_response(error):
+        return make_response(jsonify({'error': 'Database busy, try again shortly'}), 503)
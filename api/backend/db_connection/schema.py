@@ -0,0 +1,62 @@
+#------------------------------------------------------------
+# Which optional tables/columns exist in the connected database.
+#
+# Routes used to find out by running a statement and catching the
+# error, on every call. The schema is read once from
+# information_schema at startup and routes ask this map instead.
+#------------------------------------------------------------
+import threading
+
+
+class SchemaCapabilities:
+    """Cached {table: set(columns)} for the current database."""
+
+    def __init__(self, db):
+        self.db = db
+        self._columns = None
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        # probe at startup; if MySQL isn't reachable yet, load on first use instead.
+        # Restart the API (or call refresh()) after adding tables to a live database.
+        try:
+            self.refresh()
+            app.logger.info("schema capabilities: %s tables", len(self._columns))
+        except Exception:
+            app.logger.warning("schema probe failed at startup; will retry on first use")
+
+    def refresh(self):
+        conn = self.db.pool.acquire()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT TABLE_NAME AS tableName, COLUMN_NAME AS columnName
+                FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE()
+                """
+            )
+            columns = {}
+            for row in cursor.fetchall():
+                columns.setdefault(row['tableName'], set()).add(row['columnName'])
+        finally:
+            self.db.pool.release(conn)
+        with self._lock:
+            self._columns = columns
+        return columns
+
+    def columns(self, table):
+        if self._columns is None:
+            self.refresh()
+        return self._columns.get(table, set())
+
+    def has_table(self, table):
+        return bool(self.columns(table))
+
+    def has_column(self, table, column):
+        return column in self.columns(table)
+
+    def as_dict(self):
+        if self._columns is None:
+            self.refresh()
+        return {table: sorted(cols) for table, cols in self._columns.items()}
@@ -0,0 +1,215 @@
+"""
+index_advisor.py checks that the API's read queries stay index-backed.
+
+It calls every GET route through Flask's test client, records the SQL each
+route actually sends to MySQL, runs EXPLAIN on every SELECT against the live
+schema and flags full table scans (and full index scans). It also compares
+the indexes in the database with the set shipped in huskyFixDDL.sql and can
+create the missing ones.
+
+Run it from the api/ folder (inside the api container or with api/.env set):
+
+    python -m backend.db_tools.index_advisor            # report only
+    python -m backend.db_tools.index_advisor --apply    # also create missing indexes
+
+Exit status is 1 when a scan or missing index was found, so it can gate CI.
+Note that on the small seed data MySQL may prefer a scan even when a usable
+index exists; use --min-rows to ignore tables below a size.
+"""
+import argparse
+import sys
+
+from pymysql import cursors
+
+from backend.db_connection import db
+
+
+# Indexes shipped in database-files/huskyFixDDL.sql (besides primary keys).
+EXPECTED_INDEXES = {
+    'maintenanceRequest': {
+        'idx_mr_requested': ('dateRequested', 'requestID'),
+        'idx_mr_student_requested': ('studentRequestingID', 'dateRequested', 'requestID'),
+        'idx_mr_status_requested': ('statusCode', 'dateRequested', 'requestID'),
+        'idx_mr_priority_requested': ('priority', 'dateRequested', 'requestID'),
+        'idx_mr_building_requested': ('buildingID', 'dateRequested'),
+        'idx_mr_completed': ('dateCompleted', 'buildingID'),
+        'idx_mr_last_modified': ('lastModified', 'requestID'),
+        'idx_mr_dispatch': ('statusCode', 'priority', 'dateRequested', 'requestID'),
+        'ft_mr_text': ('issueDescription', 'completionNotes'),
+    },
+    'partUsed': {
+        'idx_pu_request': ('requestID', 'partID'),
+    },
+    'employeeAssigned': {
+        'idx_ea_request': ('requestID', 'employeeID'),
+    },
+}
+
+# index columns stored in descending order
+DESCENDING_COLUMNS = {('maintenanceRequest', 'idx_mr_dispatch', 'priority')}
+
+# GET routes to exercise, with representative query strings.
+ROUTES = [
+    '/requests',
+    '/requests?student_id=1',
+    '/requests?employee_id=1',
+    '/requests?status=Completed',
+    '/requests?priority=3',
+    '/requests?start_date=2025-01-01&end_date=2025-12-31',
+    '/requests?cursor=',
+    '/requests?updated_since=2025-01-01',
+    '/requests/search?q=leak',
+    '/requests?sort=dispatch&employee_id=7&limit=50',
+    '/requests/1',
+    '/buildings/',
+    '/buildings/1/apartments',
+    '/buildings/1/apartments/1/vacancy',
+    '/employee/directory',
+    '/employee/workload',
+    '/employee/parts',
+    '/employee/parts/reorder',
+    '/employee/parts/1',
+    '/employee/reports/monthly-cost',
+    '/report/active_requests',
+    '/report/AVG_Monthly_Requests?from=2025-01-01&to=2025-12-31&desc=false',
+    '/report/building_requests?from=2025-01-01&to=2025-12-31&active=true&desc=false',
+    '/report/cost?by_build=true&from=2025-01-01&to=2025-12-31',
+    '/report/revenue?by_build=true&include_empty=false&interval=month',
+    '/report/vacancies?by_build=true',
+]
+
+# EXPLAIN access types that read the whole table / whole index
+SCAN_TYPES = {'ALL': 'full table scan', 'index': 'full index scan'}
+
+
+class RecordingCursor(cursors.DictCursor):
+    """DictCursor that remembers every statement it sends."""
+    statements = []
+
+    def execute(self, query, args=None):
+        RecordingCursor.statements.append(self.mogrify(query, args))
+        return super().execute(query, args)
+
+
+def capture_route_sql(app, routes=ROUTES):
+    """Call each route and return {route: [sql, ...]} plus {route: status_code}."""
+    captured = {}
+    statuses = {}
+    client = app.test_client()
+    for route in routes:
+        RecordingCursor.statements = []
+        try:
+            statuses[route] = client.get(route).status_code
+        except Exception as e:
+            statuses[route] = f'error: {e}'
+        captured[route] = [
+            sql for sql in RecordingCursor.statements
+            if sql.lstrip().upper().startswith('SELECT')
+        ]
+    return captured, statuses
+
+
+def explain(conn, sql):
+    cursor = conn.cursor(cursors.DictCursor)
+    cursor.execute('EXPLAIN ' + sql)
+    return cursor.fetchall()
+
+
+def find_scans(plan, min_rows=0):
+    problems = []
+    for step in plan:
+        kind = SCAN_TYPES.get(step.get('type'))
+        rows = step.get('rows') or 0
+        if kind and rows >= min_rows:
+            problems.append(f"{kind} on {step.get('table')} (~{rows} rows, key={step.get('key')})")
+        extra = step.get('Extra') or ''
+        if 'Using filesort' in extra and rows >= min_rows:
+            problems.append(f"filesort on {step.get('table')} (~{rows} rows)")
+    return problems
+
+
+def existing_indexes(conn):
+    cursor = conn.cursor(cursors.DictCursor)
+    cursor.execute(
+        """
+        SELECT TABLE_NAME, INDEX_NAME, COLUMN_NAME
+        FROM information_schema.STATISTICS
+        WHERE TABLE_SCHEMA = DATABASE()
+        ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+        """
+    )
+    found = {}
+    for row in cursor.fetchall():
+        found.setdefault(row['TABLE_NAME'], {}).setdefault(row['INDEX_NAME'], []).append(row['COLUMN_NAME'])
+    return found
+
+
+def missing_indexes(conn):
+    found = existing_indexes(conn)
+    missing = []
+    for table, indexes in EXPECTED_INDEXES.items():
+        present = {tuple(cols) for cols in found.get(table, {}).values()}
+        for name, cols in indexes.items():
+            if tuple(cols) not in present:
+                missing.append((table, name, cols))
+    return missing
+
+
+def apply_indexes(conn, missing):
+    cursor = conn.cursor()
+    for table, name, cols in missing:
+        kind = 'FULLTEXT INDEX' if name.startswith('ft_') else 'INDEX'
+        columns = ', '.join(f"{col} DESC" if (table, name, col) in DESCENDING_COLUMNS else col for col in cols)
+        cursor.execute(f"CREATE {kind} {name} ON {table} ({columns})")
+    conn.commit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='EXPLAIN the API routes and check their indexes.')
+    parser.add_argument('--apply', action='store_true', help='create missing shipped indexes')
+    parser.add_argument('--min-rows', type=int, default=0,
+                        help='ignore scans estimated to read fewer rows than this')
+    args = parser.parse_args(argv)
+
+    # build the app with the recording cursor so route SQL can be captured
+    from backend.rest_entry import create_app
+    db.connect_args['cursorclass'] = RecordingCursor
+    app = create_app()
+
+    conn = db.connect()
+    flagged = 0
+    try:
+        missing = missing_indexes(conn)
+        if missing and args.apply:
+            apply_indexes(conn, missing)
+            print(f"created {len(missing)} index(es)")
+            missing = missing_indexes(conn)
+        for table, name, cols in missing:
+            flagged += 1
+            print(f"MISSING  {table}.{name} ({', '.join(cols)})")
+
+        captured, statuses = capture_route_sql(app)
+        for route, statements in captured.items():
+            status = statuses[route]
+            print(f"\n{route}  [{status}]")
+            if not statements:
+                print("  (no SELECT issued)")
+            for sql in dict.fromkeys(statements):
+                try:
+                    problems = find_scans(explain(conn, sql), args.min_rows)
+                except Exception as e:
+                    problems = [f"EXPLAIN failed: {e}"]
+                summary = ' '.join(sql.split())
+                print(f"  {'SCAN' if problems else 'ok  '}  {summary[:110]}")
+                for problem in problems:
+                    flagged += 1
+                    print(f"        - {problem}")
+    finally:
+        conn.close()
+
+    print(f"\n{flagged} problem(s) found")
+    return 1 if flagged else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,3 +1,7 @@
 from .employee_routes import employee_bp
+from .inventory import PartsInventory, inventory
+from .forecast import PartsForecast, forecast
+from .directory import EmployeeDirectory, directory
 
-__all__ = ["employee_bp"]
\ No newline at end of file
+__all__ = ["employee_bp", "PartsInventory", "inventory", "PartsForecast", "forecast",
+           "EmployeeDirectory", "directory"]
@@ -0,0 +1,86 @@
+#------------------------------------------------------------
+# Employee directory behind GET /employee/directory.
+#
+# The columns a dropdown needs (never salary) are loaded once per
+# worker. Each requested field set is encoded to JSON once, with a
+# content-hash ETag, so pages that rerun on every click revalidate
+# with If-None-Match and get a 304 without MySQL being queried.
+# Routes that change employees call invalidate(); changes made
+# through other workers (or directly in MySQL) show up after
+# EMPLOYEE_DIRECTORY_TTL seconds.
+#------------------------------------------------------------
+import hashlib
+import json
+import threading
+import time
+
+from backend.db_connection import db
+
+
+# columns the directory may return, in output order (salary is never loaded)
+DIRECTORY_FIELDS = ('employeeID', 'firstName', 'lastName', 'employeeType', 'email')
+DEFAULT_FIELDS = ('employeeID', 'firstName', 'lastName', 'employeeType')
+
+
+class EmployeeDirectory:
+
+    def __init__(self, db, ttl=300):
+        self.db = db
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._rows = None       # None until loaded
+        self._encoded = {}      # field tuple -> (JSON body, ETag)
+        self._loaded_at = 0.0
+
+    def init_app(self, app):
+        app.config.setdefault('EMPLOYEE_DIRECTORY_TTL', 300)
+        self.ttl = float(app.config['EMPLOYEE_DIRECTORY_TTL'])
+        self.invalidate()
+
+    @staticmethod
+    def parse_fields(value):
+        """Field tuple (in DIRECTORY_FIELDS order) for a fields= list; raises ValueError."""
+        if not value:
+            return DEFAULT_FIELDS
+        wanted = {field.strip() for field in value.split(',') if field.strip()}
+        unknown = wanted - set(DIRECTORY_FIELDS)
+        if unknown:
+            raise ValueError(f"unknown fields: {', '.join(sorted(unknown))} "
+                             f"(choose from {', '.join(DIRECTORY_FIELDS)})")
+        return tuple(field for field in DIRECTORY_FIELDS if field in wanted)
+
+    def employees(self):
+        """Every employee's directory row, by employeeID (shared rows: don't modify them)."""
+        with self._lock:
+            self._ensure_loaded()
+            return self._rows
+
+    def snapshot(self, fields=DEFAULT_FIELDS):
+        """(JSON body, ETag) of every employee with just the given fields."""
+        with self._lock:
+            self._ensure_loaded()
+            encoded = self._encoded.get(fields)
+            if encoded is None:
+                rows = [{field: row[field] for field in fields} for row in self._rows]
+                body = json.dumps(rows, sort_keys=True, separators=(',', ':'), default=str).encode()
+                encoded = self._encoded[fields] = (body, hashlib.sha256(body).hexdigest()[:32])
+            return encoded
+
+    def invalidate(self):
+        """Call after committing a change to employee rows."""
+        with self._lock:
+            self._rows = None
+            self._encoded = {}
+
+    def _ensure_loaded(self):
+        if self._rows is not None and time.monotonic() - self._loaded_at < self.ttl:
+            return
+        cursor = self.db.get_db().cursor()
+        cursor.execute(f"SELECT {', '.join(DIRECTORY_FIELDS)} FROM employee ORDER BY employeeID")
+        self._rows = list(cursor.fetchall())
+        self._encoded = {}
+        self._loaded_at = time.monotonic()
+
+
+# shared by every blueprint in this worker
+directory = EmployeeDirectory(db)
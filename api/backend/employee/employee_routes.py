@@ -1,14 +1,14 @@
 from flask import Blueprint, request, jsonify, make_response, current_app
-from backend.db_connection import db
+from backend.db_connection import db, ids, idempotency, schema
+from backend.employee.directory import directory
+from backend.employee.forecast import forecast
+from backend.employee.inventory import inventory
+from backend.requests.paging import decode_cursor, encode_cursor
+from backend.requests.workload import COUNTER_NAMES, workload
 import pymysql
 
 employee_bp = Blueprint('employee', __name__, url_prefix='/employee')
 
-# Helper to convert rows to list[dict]
-def rows_to_dicts(cursor, rows):
-    col_names = [col[0] for col in cursor.description]
-    return [dict(zip(col_names, row)) for row in rows]
-
 @employee_bp.get('')
 def get_employees():
     cursor = db.get_db().cursor()
@@ -16,25 +16,101 @@ def get_employees():
     cursor.execute(query)
     return jsonify(cursor.fetchall()), 200
 
+# /employee/directory
+
+# GET: employees for pickers, without salary. ?fields= picks columns from
+# employeeID, firstName, lastName, employeeType, email (default: all but email).
+# Served from memory with an ETag; send If-None-Match to get 304.
+@employee_bp.get('/directory')
+def get_employee_directory():
+    try:
+        fields = directory.parse_fields(request.args.get('fields'))
+    except ValueError as e:
+        return make_response({'error': str(e)}, 400)
+    body, etag = directory.snapshot(fields)
+
+    response = make_response(body, 200)
+    response.mimetype = 'application/json'
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+# /employee/workload
+
+# GET: every employee's job counts (open, inProgress, enRoute, blocked,
+# completedThisWeek, plus active = the first four), fewest active jobs first.
+# Read from counters the request routes keep up to date (see requests/workload.py).
+@employee_bp.get('/workload')
+def get_employee_workload():
+    counts = workload.counts()
+    if counts is None:
+        return make_response({'error': 'Workload counters unavailable, try again shortly'}, 503)
+
+    results = []
+    for employee in directory.employees():
+        counters = counts.get(employee['employeeID']) or dict.fromkeys(COUNTER_NAMES, 0)
+        results.append({
+            'employeeID': employee['employeeID'],
+            'firstName': employee['firstName'],
+            'lastName': employee['lastName'],
+            'employeeType': employee['employeeType'],
+            **counters,
+            'active': sum(counters[name] for name in COUNTER_NAMES if name != 'completedThisWeek'),
+        })
+    results.sort(key=lambda row: (row['active'], row['employeeID']))
+    return make_response(jsonify(results), 200)
+
 # /employee/parts
-# GET: list parts inventory (quantities, cost)
+# GET: list parts inventory (quantities, cost), sorted by name
+# Served from the in-memory inventory (see inventory.py); send If-None-Match
+# with the last ETag to get 304 when nothing changed.
 @employee_bp.get('/parts')
 def get_parts_inventory():
-    
-    cursor = db.get_db().cursor()
-    cursor.execute(
-        """
-        SELECT partID, name, cost, quantity
-        FROM part
-        ORDER BY name
-        """
-    )
-    rows = cursor.fetchall()
+    body, etag = inventory.snapshot()
+
+    response = make_response(body, 200)
+    response.mimetype = 'application/json'
+    response.set_etag(etag)
+    # clients may keep the list but must revalidate it
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+# /employee/parts/search
+
+# most matches GET /employee/parts/search returns (?limit=)
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
+
+# GET: parts whose names match q, best first (whole name, name prefix, word
+# prefixes, then close spellings). Answered from the in-memory name index.
+@employee_bp.get('/parts/search')
+def search_parts():
+    q = request.args.get('q', '').strip()
+    if not q:
+        return make_response({'error': 'q is required'}, 400)
+    try:
+        limit = int(request.args.get('limit', SEARCH_DEFAULT_LIMIT))
+    except ValueError:
+        return make_response({'error': 'limit must be an integer'}, 400)
+    limit = max(1, min(limit, SEARCH_MAX_LIMIT))
 
-    return make_response(jsonify(rows), 200)
+    return make_response(jsonify(inventory.search(q, limit)), 200)
+
+# /employee/parts/reorder
+
+# GET: parts at or below their reorder point, fewest days of stock first
+# (?all=true lists every part). Demand, safety stock and reorder points come
+# from recent partUsed usage (see forecast.py).
+@employee_bp.get('/parts/reorder')
+def get_parts_reorder():
+    include_all = request.args.get('all', 'false').lower() == 'true'
+    report = forecast.report(inventory.parts(), include_all=include_all)
+    return make_response(jsonify(report), 200)
 
 # POST: add new part to inventory
+# (Idempotency-Key header supported: a retry returns the first partID)
 @employee_bp.post('/parts')
+@idempotency.idempotent
 def add_part():
     data = request.json or {}
 
@@ -49,27 +125,10 @@ def add_part():
     cursor = conn.cursor()
 
     try:
-        # If client supplied a partID, try to use it (but avoid duplicates).
-        provided_id = data.get('partID')
-        if provided_id is not None:
-            try:
-                provided_id = int(provided_id)
-            except Exception:
-                provided_id = None
-
-        if provided_id:
-            cursor.execute("SELECT 1 FROM part WHERE partID = %s", (provided_id,))
-            if cursor.fetchone():
-                # supplied id already exists -> fall back to generating a new id
-                provided_id = None
-
-        if not provided_id:
-            # Generate next partID (table doesn't have AUTO_INCREMENT)
-            cursor.execute("SELECT COALESCE(MAX(partID), 0) + 1 FROM part")
-            row = cursor.fetchone()
-            next_id = int(row[0]) if row and row[0] is not None else 1
-        else:
-            next_id = provided_id
+        # partID always comes from the id allocator (table doesn't have AUTO_INCREMENT).
+        # A client-supplied partID is ignored: it could collide with ids already
+        # reserved by another worker.
+        next_id = ids.next_id('part')
 
         cursor.execute(
             """
@@ -78,7 +137,9 @@ def add_part():
             """,
             (next_id, name, cost, quantity)
         )
+        rows = inventory.read_rows(cursor, [next_id])
         conn.commit()
+        inventory.put(rows)
 
         return make_response({'partID': next_id}, 201)
 
@@ -121,36 +182,44 @@ def update_part(part_id):
         """,
         tuple(values)
     )
+    rows = inventory.read_rows(cursor, [part_id])
     db.get_db().commit()
+    inventory.put(rows)
 
     return make_response({'message': 'Part updated'}, 200)
 
 # /employee/parts/{id}
 
-# GET: part detail including usage history
-@employee_bp.get('/parts/<int:part_id>')
-def get_part_detail(part_id):
-    cursor = db.get_db().cursor(dictionary=True)
+# usage rows per page of GET /employee/parts/<id> (?limit= up to the max)
+USAGE_PAGE_SIZE = 50
+USAGE_MAX_PAGE_SIZE = 500
+# rows fetched from the server-side cursor at a time in NDJSON mode
+USAGE_STREAM_CHUNK = 500
 
-    cursor.execute(
-        """
-        SELECT partID, name, cost, quantity
-        FROM part
-        WHERE partID = %s
-        """,
-        (part_id,)
-    )
-    row = cursor.fetchone()
-    if not row:
-        return make_response({'error': 'Part not found'}, 404)
 
-    col_names = [col[0] for col in cursor.description]
-    part = dict(zip(col_names, row))
+# Usage pages use the same keyset cursors as GET /requests (requests/paging.py).
 
-    cursor.execute(
-        """
+
+def usage_query(part_id, after=None):
+    """SQL and params for a part's usage, newest request first, starting after an optional cursor key."""
+    quantity = 'pu.quantity' if schema.has_column('partUsed', 'quantity') else '1'
+    where_clauses = ["pu.partID = %s"]
+    params = [part_id]
+    if after is not None:
+        after_date, after_id = after
+        if after_date is None:
+            # NULL dates sort last in DESC order, so only NULL-dated rows remain
+            where_clauses.append("(mr.dateRequested IS NULL AND pu.requestID < %s)")
+            params.append(after_id)
+        else:
+            where_clauses.append(
+                "(mr.dateRequested < %s OR (mr.dateRequested = %s AND pu.requestID < %s) OR mr.dateRequested IS NULL)"
+            )
+            params.extend([after_date, after_date, after_id])
+    sql = f"""
         SELECT
             pu.requestID,
+            {quantity} AS quantity,
             mr.issueType,
             mr.dateRequested,
             mr.dateCompleted,
@@ -159,18 +228,129 @@ def get_part_detail(part_id):
         FROM partUsed pu
         JOIN maintenanceRequest mr ON pu.requestID = mr.requestID
         JOIN building b ON mr.buildingID = b.buildingID
+        WHERE {' AND '.join(where_clauses)}
+        ORDER BY mr.dateRequested DESC, pu.requestID DESC
+    """
+    return sql, params
+
+
+def usage_summary(cursor, part_id):
+    """Totals for a part's whole usage history, aggregated by MySQL (per building plus a ROLLUP total)."""
+    quantity = 'pu.quantity' if schema.has_column('partUsed', 'quantity') else '1'
+    cursor.execute(
+        f"""
+        SELECT
+            GROUPING(mr.buildingID) AS isTotal,
+            mr.buildingID,
+            MAX(b.address) AS address,
+            COUNT(*) AS requests,
+            CAST(SUM({quantity}) AS SIGNED) AS units,
+            MAX(mr.dateRequested) AS lastUsed
+        FROM partUsed pu
+        JOIN maintenanceRequest mr ON pu.requestID = mr.requestID
+        JOIN building b ON mr.buildingID = b.buildingID
         WHERE pu.partID = %s
-        ORDER BY mr.dateRequested DESC
+        GROUP BY mr.buildingID WITH ROLLUP
         """,
         (part_id,)
     )
-    usage_rows = cursor.fetchall()
-    part['usage'] = rows_to_dicts(cursor, usage_rows)
+    summary = {'totalUsed': 0, 'requestCount': 0, 'lastUsed': None, 'byBuilding': []}
+    for row in cursor.fetchall():
+        if row['isTotal']:
+            summary.update(totalUsed=row['units'], requestCount=row['requests'], lastUsed=row['lastUsed'])
+        else:
+            summary['byBuilding'].append({
+                'buildingID': row['buildingID'],
+                'address': row['address'],
+                'requests': row['requests'],
+                'units': row['units'],
+            })
+    return summary
+
+
+def stream_usage(sql, params):
+    """
+    NDJSON response with every usage row. Rows are read through an unbuffered
+    (server-side) cursor on a connection of its own, so the API holds one
+    chunk at a time however long the history is.
+    """
+    conn = db.pool.acquire()
+    dumps = current_app.json.dumps
+
+    def lines():
+        cursor = conn.cursor(pymysql.cursors.SSDictCursor)
+        try:
+            cursor.execute(sql, tuple(params))
+            while True:
+                rows = cursor.fetchmany(USAGE_STREAM_CHUNK)
+                if not rows:
+                    break
+                yield ''.join(dumps(row) + '\n' for row in rows)
+        finally:
+            # reads off whatever is left if the client went away mid-stream
+            cursor.close()
+
+    response = current_app.response_class(lines(), mimetype='application/x-ndjson')
+    # runs even if the body is never iterated
+    response.call_on_close(lambda: db.pool.release(conn))
+    return response
+
+
+# GET: part detail including usage history
+# Query params:
+#   limit   usage rows per page (default 50, at most 500)
+#   cursor  next_cursor from the previous page
+#   format  ndjson -> stream every usage row (after cursor, if given) as
+#           newline-delimited JSON instead of the part object
+# The first page also carries usageSummary: totalUsed, requestCount,
+# lastUsed and per-building counts over the whole history.
+@employee_bp.get('/parts/<int:part_id>')
+def get_part_detail(part_id):
+    try:
+        limit = int(request.args.get('limit', USAGE_PAGE_SIZE))
+    except ValueError:
+        return make_response({'error': 'limit must be an integer'}, 400)
+    limit = max(1, min(limit, USAGE_MAX_PAGE_SIZE))
+
+    page_token = request.args.get('cursor')
+    after = None
+    if page_token:
+        try:
+            after = decode_cursor(page_token)
+        except ValueError:
+            return make_response({'error': 'invalid cursor'}, 400)
+
+    cursor = db.get_db().cursor()
+    cursor.execute(
+        """
+        SELECT partID, name, cost, quantity
+        FROM part
+        WHERE partID = %s
+        """,
+        (part_id,)
+    )
+    part = cursor.fetchone()
+    if not part:
+        return make_response({'error': 'Part not found'}, 404)
+
+    sql, params = usage_query(part_id, after)
+    if request.args.get('format') == 'ndjson':
+        return stream_usage(sql, params)
+
+    # one extra row tells whether there is another page
+    cursor.execute(sql + " LIMIT %s", tuple(params) + (limit + 1,))
+    rows = cursor.fetchall()
+    part['usage'] = rows[:limit]
+    part['next_cursor'] = encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    if not page_token:
+        part['usageSummary'] = usage_summary(cursor, part_id)
 
     return make_response(jsonify(part), 200)
 
 # PUT: adjust quantity or mark defective/returned
+# (Idempotency-Key header supported: a retried delta is applied once)
 @employee_bp.put('/parts/<int:part_id>/status')
+@idempotency.idempotent
 def adjust_part_status(part_id):
     data = request.json or {}
     quantity_delta = data.get('quantity_delta')
@@ -187,7 +367,9 @@ def adjust_part_status(part_id):
         """,
         (quantity_delta, part_id)
     )
+    rows = inventory.read_rows(cursor, [part_id])
     db.get_db().commit()
+    inventory.put(rows)
 
     return make_response({'message': 'Part quantity adjusted'}, 200)
 
@@ -220,6 +402,7 @@ def delete_part(part_id):
             (part_id,)
         )
         conn.commit()
+        inventory.remove([part_id])
         return make_response({'message': 'Part deleted'}, 200)
 
     except pymysql.err.IntegrityError:
@@ -242,13 +425,15 @@ def delete_part(part_id):
 # GET: monthly maintenance cost report
 @employee_bp.get('/reports/monthly-cost')
 def monthly_maintenance_cost():
-    cursor = db.get_db().cursor(dictionary=True)
+    cursor = db.get_db().cursor()
+    # each partUsed row is one part unless the table tracks quantities
+    cost = 'p.cost * pu.quantity' if schema.has_column('partUsed', 'quantity') else 'p.cost'
     cursor.execute(
-        """
+        f"""
         SELECT
             b.buildingID,
             b.address,
-            SUM(p.cost) AS totalCost
+            SUM({cost}) AS totalCost
         FROM maintenanceRequest m
         JOIN building b ON m.buildingID = b.buildingID
         JOIN partUsed pu ON m.requestID = pu.requestID
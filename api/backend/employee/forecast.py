@@ -0,0 +1,216 @@
+#------------------------------------------------------------
+# Reorder forecasting for parts (GET /employee/parts/reorder).
+#
+# A part is consumed on the day the request that used it was
+# completed, in the partUsed quantity. The last PARTS_FORECAST_WINDOW
+# days of that usage become one (parts x days) NumPy array, and every
+# part's figures come out of a handful of array operations:
+#
+#   daily rate     mean units used per day
+#   safety stock   z(service level) * std dev of daily use * sqrt(lead time)
+#   reorder point  daily rate * lead time + safety stock
+#
+# The usage behind the array is kept in memory per request. A refresh
+# re-reads only the requests whose lastModified moved past the last
+# one (touch_requests bumps it when partUsed changes), so checking for
+# new usage is a single indexed range read, and the array is rebuilt
+# only when something changed or the day rolled over.
+#------------------------------------------------------------
+import math
+import threading
+import time
+from datetime import date
+from statistics import NormalDist
+
+import numpy as np
+
+from backend.db_connection import db, schema
+
+
+# usage changed in the last SETTLE_SECONDS is read again by the next refresh,
+# so a transaction that commits late can't land behind the watermark
+SETTLE_SECONDS = 1
+
+
+class PartsForecast:
+
+    def __init__(self, db, schema, window_days=90, lead_time_days=7, service_level=0.95,
+                 refresh_interval=30):
+        self.db = db
+        self.schema = schema
+        self.window_days = window_days
+        self.lead_time_days = lead_time_days
+        self.service_level = service_level
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._request_usage = {}    # requestID -> [(partID, day ordinal, units)]
+        self._watermark = None      # lastModified read up to; None -> full load
+        self._next_check = 0.0      # time.monotonic() when the next refresh is due
+        self._stats = None          # (day ordinal, partIDs, rate, safety, reorder)
+
+    def init_app(self, app):
+        app.config.setdefault('PARTS_FORECAST_WINDOW', 90)
+        app.config.setdefault('PARTS_LEAD_TIME_DAYS', 7)
+        app.config.setdefault('PARTS_SERVICE_LEVEL', 0.95)
+        app.config.setdefault('PARTS_FORECAST_REFRESH', 30)
+        self.window_days = max(int(app.config['PARTS_FORECAST_WINDOW']), 2)
+        self.lead_time_days = float(app.config['PARTS_LEAD_TIME_DAYS'])
+        self.service_level = float(app.config['PARTS_SERVICE_LEVEL'])
+        if not 0.5 <= self.service_level < 1:
+            raise ValueError('PARTS_SERVICE_LEVEL must be at least 0.5 and below 1')
+        self.refresh_interval = float(app.config['PARTS_FORECAST_REFRESH'])
+        with self._lock:
+            self._request_usage = {}
+            self._watermark = None
+            self._next_check = 0.0
+            self._stats = None
+
+    def mark_stale(self):
+        """
+        Usage was just recorded in this worker: check for it on the next read instead
+        of waiting out the refresh interval (as soon as it is past SETTLE_SECONDS).
+        """
+        self._next_check = min(self._next_check, time.monotonic() + 2 * SETTLE_SECONDS)
+
+    # -------------------------
+    # reads
+    # -------------------------
+    def report(self, parts, include_all=False):
+        """
+        Reorder figures for parts (rows with partID, name and quantity), most urgent
+        (fewest days of stock left) first. Only parts at or below their reorder
+        point are listed unless include_all.
+        """
+        part_ids, part_rate, part_safety, part_reorder = self.stats()
+
+        ids = np.array([part['partID'] for part in parts], dtype=np.int64)
+        stock = np.array([part['quantity'] or 0 for part in parts], dtype=float)
+        # parts without usage in the window keep zeros
+        rate = np.zeros(len(ids))
+        safety = np.zeros(len(ids))
+        reorder = np.zeros(len(ids))
+        if len(part_ids):
+            slot = np.minimum(np.searchsorted(part_ids, ids), len(part_ids) - 1)
+            used = part_ids[slot] == ids
+            rate[used] = part_rate[slot[used]]
+            safety[used] = part_safety[slot[used]]
+            reorder[used] = part_reorder[slot[used]]
+        # whole units
+        safety = np.ceil(safety)
+        reorder = np.ceil(reorder)
+
+        days_left = np.full(len(ids), np.inf)
+        np.divide(stock, rate, out=days_left, where=rate > 0)
+        # order enough to be back above the reorder point for another lead time
+        suggested = np.maximum(np.ceil(reorder + rate * self.lead_time_days - stock), 0)
+        # an empty shelf needs attention even without recent usage
+        needs = (stock <= reorder) & ((reorder > 0) | (stock <= 0))
+
+        results = []
+        for i in np.argsort(days_left, kind='stable'):
+            if not include_all and not needs[i]:
+                continue
+            results.append({
+                'partID': int(ids[i]),
+                'name': parts[i]['name'],
+                'quantity': int(stock[i]),
+                'dailyRate': round(float(rate[i]), 3),
+                'safetyStock': int(safety[i]),
+                'reorderPoint': int(reorder[i]),
+                'daysOfStock': round(float(days_left[i]), 1) if math.isfinite(days_left[i]) else None,
+                'suggestedOrder': int(suggested[i]),
+                'needsReorder': bool(needs[i]),
+            })
+        return {
+            'asOf': date.today().isoformat(),
+            'windowDays': self.window_days,
+            'leadTimeDays': self.lead_time_days,
+            'serviceLevel': self.service_level,
+            'parts': results,
+        }
+
+    def stats(self):
+        """(partIDs, daily rate, safety stock, reorder point) arrays, partIDs ascending."""
+        with self._lock:
+            changed = self._refresh()
+            today = date.today().toordinal()
+            if changed or self._stats is None or self._stats[0] != today:
+                self._stats = (today,) + self._compute(today)
+            return self._stats[1:]
+
+    # -------------------------
+    # internals
+    # -------------------------
+    def _refresh(self):
+        """Pull usage changed since the last refresh if one is due; True if any was found."""
+        if time.monotonic() < self._next_check:
+            return False
+        self._next_check = time.monotonic() + self.refresh_interval
+
+        cursor = self.db.get_db().cursor()
+        cursor.execute(f"SELECT NOW(6) - INTERVAL {SETTLE_SECONDS} SECOND AS upTo")
+        up_to = cursor.fetchone()['upTo']
+        quantity = 'pu.quantity' if self.schema.has_column('partUsed', 'quantity') else '1'
+        usage_sql = f"""
+            SELECT m.requestID, m.dateCompleted, pu.partID, {quantity} AS units
+            FROM maintenanceRequest m
+            LEFT JOIN partUsed pu ON pu.requestID = m.requestID
+        """
+        full = self._watermark is None or not self.schema.has_column('maintenanceRequest', 'lastModified')
+        if full:
+            cursor.execute(
+                usage_sql + "WHERE m.dateCompleted >= CURDATE() - INTERVAL %s DAY",
+                (self.window_days,)
+            )
+        else:
+            # only requests changed since last time (idx_mr_last_modified)
+            cursor.execute(
+                usage_sql + "WHERE m.lastModified > %s AND m.lastModified <= %s",
+                (self._watermark, up_to)
+            )
+        rows = cursor.fetchall()
+
+        # a changed request's usage replaces what was kept for it, so reading
+        # a request twice (overlapping refreshes) is harmless
+        usage = {}
+        for row in rows:
+            entries = usage.setdefault(row['requestID'], [])
+            if row['partID'] is not None and row['dateCompleted'] is not None and row['units']:
+                entries.append((row['partID'], row['dateCompleted'].toordinal(), row['units']))
+        if full:
+            self._request_usage = {}
+        for request_id, entries in usage.items():
+            if entries:
+                self._request_usage[request_id] = entries
+            else:
+                self._request_usage.pop(request_id, None)
+        self._watermark = up_to
+        return full or bool(usage)
+
+    def _compute(self, today):
+        start = today - self.window_days + 1
+        # forget usage that has slid out of the window
+        self._request_usage = {
+            request_id: entries for request_id, entries in self._request_usage.items()
+            if any(day >= start for _, day, _ in entries)
+        }
+        usage = np.array(
+            [entry for entries in self._request_usage.values() for entry in entries],
+            dtype=np.int64
+        ).reshape(-1, 3)
+        usage = usage[(usage[:, 1] >= start) & (usage[:, 1] <= today)]
+
+        part_ids = np.unique(usage[:, 0])
+        daily = np.zeros((len(part_ids), self.window_days))
+        np.add.at(daily, (np.searchsorted(part_ids, usage[:, 0]), usage[:, 1] - start), usage[:, 2])
+
+        rate = daily.mean(axis=1)
+        spread = daily.std(axis=1, ddof=1)
+        z = NormalDist().inv_cdf(self.service_level)
+        safety = z * spread * math.sqrt(self.lead_time_days)
+        reorder = rate * self.lead_time_days + safety
+        return part_ids, rate, safety, reorder
+
+
+# shared by every blueprint in this worker
+forecast = PartsForecast(db, schema)
@@ -0,0 +1,140 @@
+#------------------------------------------------------------
+# In-memory copy of the part table behind GET /employee/parts.
+#
+# The parts are loaded once, kept in a by-ID map plus a list sorted
+# by name, and the list is kept pre-encoded as JSON with an ETag, so
+# reloading the parts page doesn't query MySQL (or, with
+# If-None-Match, even send the list). Routes that write part rows
+# read the changed rows back in their transaction and hand them to
+# the cache once they have committed (write-through). Writes made by
+# other workers are picked up when the copy is older than
+# PARTS_CACHE_TTL seconds. The name search index (search.py) follows
+# the same changes part by part.
+#------------------------------------------------------------
+import hashlib
+import json
+import threading
+import time
+
+from backend.db_connection import db
+from backend.employee.search import PartNameIndex
+
+
+PART_COLUMNS = 'partID, name, cost, quantity'
+
+
+class PartsInventory:
+
+    def __init__(self, db, ttl=10):
+        self.db = db
+        self.ttl = ttl
+        # held while loading too, so a write-through can't be overwritten by an older load
+        self._lock = threading.Lock()
+        self._by_id = None    # partID -> row; None until loaded
+        self._sorted = []
+        self._body = b'[]'
+        self._etag = None
+        self._loaded_at = 0.0
+        self._names = PartNameIndex()
+
+    def init_app(self, app):
+        app.config.setdefault('PARTS_CACHE_TTL', 10)
+        self.ttl = float(app.config['PARTS_CACHE_TTL'])
+        self.invalidate()
+
+    # -------------------------
+    # reads
+    # -------------------------
+    def snapshot(self):
+        """(JSON body, ETag) of the parts list sorted by name, loading it if stale."""
+        with self._lock:
+            self._ensure_loaded()
+            return self._body, self._etag
+
+    def parts(self):
+        """The parts sorted by name (shared rows: don't modify them)."""
+        with self._lock:
+            self._ensure_loaded()
+            return self._sorted
+
+    def get(self, part_id):
+        with self._lock:
+            self._ensure_loaded()
+            return self._by_id.get(part_id)
+
+    def search(self, query, limit):
+        """Parts whose names match query (see PartNameIndex.search), best match first."""
+        with self._lock:
+            self._ensure_loaded()
+            return [self._by_id[part_id] for part_id in self._names.search(query, limit)]
+
+    def read_rows(self, cursor, part_ids):
+        """Current rows for part_ids, for a write route to pass to put() after it commits."""
+        part_ids = list(part_ids)
+        if not part_ids:
+            return []
+        cursor.execute(
+            f"SELECT {PART_COLUMNS} FROM part WHERE partID IN ({', '.join(['%s'] * len(part_ids))})",
+            tuple(part_ids)
+        )
+        return list(cursor.fetchall())
+
+    # -------------------------
+    # write-through
+    # -------------------------
+    def put(self, rows):
+        """Add or replace committed part rows."""
+        with self._lock:
+            if self._by_id is None:
+                return
+            for row in rows:
+                self._by_id[row['partID']] = dict(row)
+                self._names.add(row['partID'], row['name'])
+            self._rebuild()
+
+    def remove(self, part_ids):
+        with self._lock:
+            if self._by_id is None:
+                return
+            for part_id in part_ids:
+                self._by_id.pop(part_id, None)
+                self._names.remove(part_id)
+            self._rebuild()
+
+    def invalidate(self):
+        """Drop the copy; the next read loads it again."""
+        with self._lock:
+            self._by_id = None
+
+    # -------------------------
+    # internals
+    # -------------------------
+    def _ensure_loaded(self):
+        if self._by_id is not None and time.monotonic() - self._loaded_at < self.ttl:
+            return
+        cursor = self.db.get_db().cursor()
+        cursor.execute(f"SELECT {PART_COLUMNS} FROM part")
+        by_id = {row['partID']: dict(row) for row in cursor.fetchall()}
+        # bring the name index in line part by part (add() skips unchanged names)
+        if self._by_id is None:
+            self._names.clear()
+        for part_id in set(self._by_id or ()) - set(by_id):
+            self._names.remove(part_id)
+        for part_id, row in by_id.items():
+            self._names.add(part_id, row['name'])
+        self._by_id = by_id
+        self._loaded_at = time.monotonic()
+        self._rebuild()
+
+    def _rebuild(self):
+        # same order as ORDER BY name under the case-insensitive collation
+        self._sorted = sorted(
+            self._by_id.values(), key=lambda row: ((row['name'] or '').lower(), row['partID'])
+        )
+        # encoded like jsonify (sorted keys), once per change instead of once per GET
+        self._body = json.dumps(self._sorted, sort_keys=True, separators=(',', ':'), default=str).encode()
+        self._etag = hashlib.sha256(self._body).hexdigest()[:32]
+
+
+# shared by every blueprint in this worker
+inventory = PartsInventory(db)
@@ -0,0 +1,120 @@
+#------------------------------------------------------------
+# Part name index behind GET /employee/parts/search.
+#
+# Two inverted maps over normalized part names (lowercase words):
+#
+#   prefixes  every prefix of every word -> partIDs  ("fil" -> filters)
+#   trigrams  every 3-character run of the name -> partIDs (typos)
+#
+# A query is answered with a few set lookups instead of scanning every
+# name. The inventory cache (inventory.py) adds, replaces and removes
+# one part at a time as part rows change, so the index is never
+# rebuilt wholesale after the first load.
+#------------------------------------------------------------
+import re
+from collections import Counter, defaultdict
+
+
+WORD_RE = re.compile(r'[a-z0-9]+')
+# longest word prefix kept in the index; longer query words are checked against the name
+MAX_PREFIX = 16
+# share of a query's trigrams a name needs to count as a close spelling
+MIN_TRIGRAM_SIMILARITY = 0.4
+
+
+def normalize(text):
+    return ' '.join(WORD_RE.findall((text or '').lower()))
+
+
+def trigrams(normalized):
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PartNameIndex:
+
+    def __init__(self):
+        self._names = {}                    # partID -> normalized name
+        self._prefixes = defaultdict(set)
+        self._trigrams = defaultdict(set)
+
+    def __len__(self):
+        return len(self._names)
+
+    def clear(self):
+        self._names.clear()
+        self._prefixes.clear()
+        self._trigrams.clear()
+
+    def add(self, part_id, name):
+        """Index (or re-index) a part's name; a no-op when the name didn't change."""
+        normalized = normalize(name)
+        if self._names.get(part_id) == normalized:
+            return
+        self.remove(part_id)
+        self._names[part_id] = normalized
+        for key in self._prefix_keys(normalized):
+            self._prefixes[key].add(part_id)
+        for gram in trigrams(normalized):
+            self._trigrams[gram].add(part_id)
+
+    def remove(self, part_id):
+        normalized = self._names.pop(part_id, None)
+        if normalized is None:
+            return
+        for index, keys in ((self._prefixes, self._prefix_keys(normalized)),
+                            (self._trigrams, trigrams(normalized))):
+            for key in keys:
+                ids = index.get(key)
+                if ids is not None:
+                    ids.discard(part_id)
+                    if not ids:
+                        del index[key]
+
+    def search(self, query, limit):
+        """
+        partIDs matching query, best first: the whole name, then names starting
+        with it, then names with a word starting with every query word, then close
+        spellings by shared trigrams. Ties go to shorter names.
+        """
+        normalized = normalize(query)
+        if not normalized or limit <= 0:
+            return []
+        query_words = normalized.split()
+
+        candidates = None
+        for word in query_words:
+            ids = self._prefixes.get(word[:MAX_PREFIX], set())
+            candidates = set(ids) if candidates is None else candidates & ids
+        ranked = {}
+        for part_id in candidates:
+            name = self._names[part_id]
+            name_words = name.split()
+            if any(len(word) > MAX_PREFIX and not any(w.startswith(word) for w in name_words)
+                   for word in query_words):
+                continue
+            if name == normalized:
+                ranked[part_id] = (0, 0.0)
+            elif name.startswith(normalized):
+                ranked[part_id] = (1, 0.0)
+            else:
+                ranked[part_id] = (2, 0.0)
+
+        if len(ranked) < limit:
+            query_grams = trigrams(normalized)
+            shared = Counter()
+            for gram in query_grams:
+                shared.update(self._trigrams.get(gram, ()))
+            for part_id, count in shared.items():
+                similarity = count / len(query_grams)
+                if part_id not in ranked and similarity >= MIN_TRIGRAM_SIMILARITY:
+                    ranked[part_id] = (3, -similarity)
+
+        best = sorted(
+            ranked, key=lambda part_id: (ranked[part_id], len(self._names[part_id]), self._names[part_id], part_id)
+        )
+        return best[:limit]
+
+    @staticmethod
+    def _prefix_keys(normalized):
+        return {word[:end] for word in normalized.split() for end in range(1, min(len(word), MAX_PREFIX) + 1)}
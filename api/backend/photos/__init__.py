@@ -0,0 +1,4 @@
+from .storage import PhotoStore, photos
+from .photo_routes import photos_bp
+
+__all__ = ['PhotoStore', 'photos', 'photos_bp']
@@ -0,0 +1,73 @@
+from flask import Blueprint, send_file, abort
+import os
+
+from backend.photos.storage import HASH_RE, photos, sniff_content_type
+
+photos_bp = Blueprint('photos', __name__, url_prefix='/photos')
+
+# a stored photo never changes (its name is its SHA-256), so clients may keep it for a year
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+# how long to keep the full-size stand-in served while a thumbnail is still being made
+PENDING_THUMB_MAX_AGE = 60
+
+
+def send_photo(path, content_type, content_hash, immutable=True):
+    """
+    Serve a stored file. The content hash is the strong ETag; send_file handles
+    If-None-Match (304) and Range requests, and hands the open file to the
+    server's wsgi.file_wrapper (gunicorn uses sendfile) or X-Sendfile when
+    USE_X_SENDFILE is configured.
+    """
+    response = send_file(
+        path,
+        mimetype=content_type,
+        etag=content_hash,
+        max_age=IMMUTABLE_MAX_AGE if immutable else PENDING_THUMB_MAX_AGE,
+    )
+    response.cache_control.public = True
+    response.accept_ranges = 'bytes'
+    if immutable:
+        response.cache_control.immutable = True
+    return response
+
+
+def stored_photo(content_hash):
+    """(path, content type) of a stored photo, or 404."""
+    if not HASH_RE.match(content_hash):
+        abort(404)
+    path = photos.path(content_hash)
+    try:
+        with open(path, 'rb') as f:
+            content_type = sniff_content_type(f.read(16))
+    except FileNotFoundError:
+        abort(404)
+    return path, content_type or 'application/octet-stream'
+
+
+# -------------------------
+# GET /photos/<hash>
+# The uploaded file (see POST /requests/<id>/photos). Supports ETag/304 and Range.
+# -------------------------
+@photos_bp.get('/<content_hash>')
+def get_photo(content_hash):
+    path, content_type = stored_photo(content_hash)
+    return send_photo(path, content_type, content_hash)
+
+
+# -------------------------
+# GET /photos/<hash>/thumb
+# JPEG thumbnail (at most PHOTO_THUMB_SIZE pixels a side). Until the background
+# job has made it, the full-size photo is served with a short max-age instead.
+# -------------------------
+@photos_bp.get('/<content_hash>/thumb')
+def get_photo_thumb(content_hash):
+    path, content_type = stored_photo(content_hash)
+    thumb = photos.thumb_path(content_hash)
+    if os.path.exists(thumb):
+        # thumbnails are derived from immutable content, so they are immutable too
+        return send_photo(thumb, 'image/jpeg', content_hash + '-thumb')
+    try:
+        photos.schedule_thumbnail(content_hash)
+    except Exception:
+        pass
+    return send_photo(path, content_type, content_hash, immutable=False)
@@ -0,0 +1,194 @@
+#------------------------------------------------------------
+# Content-addressed photo storage on the API host.
+#
+# An upload is streamed into a temp file inside the store while its
+# SHA-256 is computed, then renamed to <root>/<hash[:2]>/<hash>. If
+# that file already exists the temp file is dropped, so a photo is
+# kept once however many times (or to however many requests) it is
+# uploaded. Thumbnails are made by a process pool after the upload
+# has returned.
+#------------------------------------------------------------
+import hashlib
+import logging
+import multiprocessing
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from backend.photos.thumbnails import make_thumbnail
+
+
+HASH_RE = re.compile(r'^[0-9a-f]{64}$')
+
+# leading bytes -> content type of the image formats we accept
+IMAGE_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', 'image/png'),
+    (b'\xff\xd8\xff', 'image/jpeg'),
+    (b'GIF87a', 'image/gif'),
+    (b'GIF89a', 'image/gif'),
+)
+
+
+def sniff_content_type(head):
+    """Image content type from a file's first bytes, or None if it isn't one we accept."""
+    for signature, content_type in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'image/webp'
+    return None
+
+
+class HashingFile:
+    """Temp file that hashes and counts what's written to it (a werkzeug stream_factory result)."""
+
+    def __init__(self, directory, max_bytes):
+        self.file = tempfile.NamedTemporaryFile(dir=directory, prefix='upload-', delete=False)
+        self.name = self.file.name
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+        self.head = b''
+        self.max_bytes = max_bytes
+
+    def write(self, data):
+        self.size += len(data)
+        if self.max_bytes and self.size > self.max_bytes:
+            raise RequestEntityTooLarge(f'photos are limited to {self.max_bytes} bytes each')
+        if len(self.head) < 16:
+            self.head += bytes(data[:16 - len(self.head)])
+        self.sha256.update(data)
+        return self.file.write(data)
+
+    def __getattr__(self, name):
+        # seek/read/flush/close... for werkzeug's FileStorage
+        return getattr(self.file, name)
+
+    def discard(self):
+        self.file.close()
+        try:
+            os.remove(self.name)
+        except FileNotFoundError:
+            pass
+
+
+class PhotoStore:
+
+    def __init__(self, root='uploads/photos', max_bytes=20 * 1024 * 1024, max_files=10,
+                 thumb_size=320, thumb_workers=2):
+        self.root = os.path.abspath(root)
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self.thumb_size = thumb_size
+        self.thumb_workers = thumb_workers
+        self.logger = logging.getLogger(__name__)
+        self._executor = None
+        self._pid = None
+        self._lock = threading.Lock()
+        # contentHash -> future of thumbnails being made, so each is made once
+        self._thumbs_pending = {}
+
+    def init_app(self, app):
+        app.config.setdefault('PHOTO_DIR', 'uploads/photos')
+        app.config.setdefault('PHOTO_MAX_BYTES', 20 * 1024 * 1024)
+        app.config.setdefault('PHOTO_MAX_FILES', 10)
+        app.config.setdefault('PHOTO_THUMB_SIZE', 320)
+        app.config.setdefault('PHOTO_THUMB_WORKERS', 2)
+        self.root = os.path.abspath(app.config['PHOTO_DIR'])
+        self.max_bytes = int(app.config['PHOTO_MAX_BYTES'])
+        self.max_files = int(app.config['PHOTO_MAX_FILES'])
+        self.thumb_size = int(app.config['PHOTO_THUMB_SIZE'])
+        self.thumb_workers = int(app.config['PHOTO_THUMB_WORKERS'])
+        self.logger = app.logger
+        os.makedirs(os.path.join(self.root, 'tmp'), exist_ok=True)
+
+    # -------------------------
+    # paths
+    # -------------------------
+    def path(self, content_hash):
+        return os.path.join(self.root, content_hash[:2], content_hash)
+
+    def thumb_path(self, content_hash):
+        return os.path.join(self.root, 'thumbs', content_hash[:2], content_hash + '.jpg')
+
+    # -------------------------
+    # uploads
+    # -------------------------
+    def stream_factory(self, uploads):
+        """
+        A werkzeug stream_factory writing each file part to a HashingFile.
+        Every file created is appended to uploads so the caller can discard
+        what it doesn't keep.
+        """
+        def factory(total_content_length, content_type, filename, content_length=None):
+            if len(uploads) >= self.max_files:
+                raise RequestEntityTooLarge(f'at most {self.max_files} photos per upload')
+            upload = HashingFile(os.path.join(self.root, 'tmp'), self.max_bytes)
+            uploads.append(upload)
+            return upload
+        return factory
+
+    def save(self, upload):
+        """Move a finished HashingFile into the store; returns (contentHash, newly stored)."""
+        upload.file.close()
+        content_hash = upload.sha256.hexdigest()
+        dest = self.path(content_hash)
+        if os.path.exists(dest):
+            upload.discard()
+            return content_hash, False
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        # same filesystem, so this is a rename, not a copy
+        os.replace(upload.name, dest)
+        return content_hash, True
+
+    # -------------------------
+    # thumbnails
+    # -------------------------
+    def schedule_thumbnail(self, content_hash):
+        """Make the thumbnail in the background unless it exists (or thumbnails are off)."""
+        if self.thumb_workers <= 0 or os.path.exists(self.thumb_path(content_hash)):
+            return None
+        pool = self._pool()
+        with self._lock:
+            future = self._thumbs_pending.get(content_hash)
+            if future is not None:
+                return future
+            future = pool.submit(
+                make_thumbnail, self.path(content_hash), self.thumb_path(content_hash), self.thumb_size
+            )
+            self._thumbs_pending[content_hash] = future
+        future.add_done_callback(lambda done: self._thumbnail_done(content_hash, done))
+        return future
+
+    def _thumbnail_done(self, content_hash, future):
+        with self._lock:
+            self._thumbs_pending.pop(content_hash, None)
+        error = future.exception()
+        if error is not None:
+            self.logger.warning("thumbnail failed: %r", error)
+
+    def _pool(self):
+        with self._lock:
+            pid = os.getpid()
+            if self._executor is None or self._pid != pid:
+                self._thumbs_pending = {}
+                # spawn, not fork: the API worker is multi-threaded
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.thumb_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+                self._pid = pid
+            return self._executor
+
+    def shutdown(self):
+        with self._lock:
+            if self._executor is not None and self._pid == os.getpid():
+                self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+# shared by every blueprint in this worker
+photos = PhotoStore()
@@ -0,0 +1,28 @@
+#------------------------------------------------------------
+# Thumbnail generation, run in a separate process.
+#
+# Importing this module runs backend/photos/__init__.py (and so
+# Flask), so a worker process pays that once when it starts. Pillow
+# is imported here only; without it uploads still work and no
+# thumbnails are made.
+#------------------------------------------------------------
+import os
+
+
+def make_thumbnail(source, dest, size):
+    """Write a JPEG no larger than size x size pixels; returns dest."""
+    from PIL import Image, ImageOps
+
+    if os.path.exists(dest):
+        return dest
+    with Image.open(source) as image:
+        image = ImageOps.exif_transpose(image)   # phone photos carry rotation in EXIF
+        image.thumbnail((size, size))
+        if image.mode not in ('RGB', 'L'):
+            image = image.convert('RGB')
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        tmp = f"{dest}.{os.getpid()}.tmp"
+        image.save(tmp, 'JPEG', quality=80, optimize=True)
+    # atomic, so a reader never sees half a thumbnail
+    os.replace(tmp, dest)
+    return dest
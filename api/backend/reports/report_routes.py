@@ -1,17 +1,21 @@
 from flask import Blueprint, jsonify, request
-from backend.db_connection import db
+from backend.db_connection import db, schema
+from backend.requests.statuses import COMPLETED
 from mysql.connector import Error
 from flask import current_app
 
 # Create a Blueprint for NGO routes
 report_bp = Blueprint("report", __name__)
 
-# get all active requests (i.e. not completed)
+# get all active requests (i.e. not completed or canceled)
+# active status codes are all below COMPLETED, so this is a range scan on idx_mr_status_requested
 @report_bp.route("/active_requests", methods=["GET"])
 def get_active_requests():
     cursor = db.get_db().cursor()
-    query = "SELECT * FROM maintenanceRequest WHERE activeStatus != 'completed'"
-    cursor.execute(query)
+    query = ("SELECT m.*, s.name AS activeStatus "
+             "FROM maintenanceRequest m JOIN requestStatus s ON m.statusCode = s.statusCode "
+             "WHERE m.statusCode < %s")
+    cursor.execute(query, (COMPLETED,))
     return jsonify(cursor.fetchall()), 200
 
 
@@ -61,8 +65,9 @@ def get_building_requests():
         params.append(building)
     only_active = request.args.get("active").lower() == "true"
     if only_active:
-        query += " AND m.activeStatus != 'Completed'"
-    query += "GROUP BY b.buildingID, b.address ORDER BY totalRequests"
+        query += " AND m.statusCode < %s"
+        params.append(COMPLETED)
+    query += " GROUP BY b.buildingID, b.address ORDER BY totalRequests"
     sort_desc = request.args.get("desc").lower() == "true"
     if sort_desc:
         query += " DESC"
@@ -105,10 +110,12 @@ def get_cost():
     by_build = request.args.get("by_build").lower() == "true"
     query = ""
     params = []
+    # each partUsed row is one part unless the table tracks quantities
+    cost = "p.cost * pu.quantity" if schema.has_column("partUsed", "quantity") else "p.cost"
     if by_build:
-        query += "SELECT b.address, SUM(p.cost) AS `Total Cost`"
+        query += f"SELECT b.address, SUM({cost}) AS `Total Cost`"
     else:
-        query += "SELECT SUM(p.cost) AS `Total Cost`"
+        query += f"SELECT SUM({cost}) AS `Total Cost`"
 
     query += (" FROM maintenanceRequest m JOIN partUsed pu ON m.requestID = pu.requestID "
               "JOIN part p ON pu.partID = p.partID JOIN building b ON b.buildingID = m.buildingID "
@@ -0,0 +1,234 @@
+#------------------------------------------------------------
+# In-process event bus for maintenance request changes.
+#
+# The request routes publish after they commit; GET /requests/stream
+# turns a subscription into Server-Sent Events. Each subscriber has a
+# bounded buffer, so a slow client can't make the API hold unbounded
+# memory: the oldest events are dropped and the client is told to
+# resync.
+#
+# Under gunicorn every worker has its own bus. So that a dashboard
+# connected to one worker still sees changes made through another,
+# a worker with subscribers also polls maintenanceRequest.lastModified
+# (one indexed query per interval, however many subscribers) and
+# publishes rows it didn't publish itself.
+#
+# Under the default threaded workers every open stream holds a worker
+# thread, so at most EVENTS_MAX_STREAMS streams are served per worker
+# and the rest are turned away (503 with Retry-After) before they can
+# starve the other routes.
+#------------------------------------------------------------
+import itertools
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+
+from backend.db_connection import db, schema
+from backend.requests.statuses import status_name
+
+
+POLL_SETTLE_SECONDS = 1
+
+
+class Subscription:
+    """One client's filters and bounded event buffer."""
+
+    def __init__(self, filters, maxsize):
+        self.filters = filters
+        self.buffer = deque(maxlen=maxsize)
+        self.overflowed = False
+        self.ready = threading.Condition()
+
+    def matches(self, event):
+        employee_id = self.filters.get('employee_id')
+        if employee_id is not None and employee_id not in event.get('employeeIDs', []):
+            return False
+        student_id = self.filters.get('student_id')
+        if student_id is not None and student_id != event.get('studentRequestingID'):
+            return False
+        building_id = self.filters.get('buildingID')
+        if building_id is not None and building_id != event.get('buildingID'):
+            return False
+        return True
+
+    def push(self, event):
+        with self.ready:
+            if len(self.buffer) == self.buffer.maxlen:
+                # deque drops the oldest entry; remember to tell the client
+                self.overflowed = True
+            self.buffer.append(event)
+            self.ready.notify()
+
+    def get(self, timeout):
+        """Next event, or None if nothing arrived within timeout seconds."""
+        with self.ready:
+            if not self.buffer:
+                self.ready.wait(timeout)
+            if self.overflowed:
+                self.overflowed = False
+                return {'type': 'resync', 'reason': 'events dropped, refetch the list'}
+            return self.buffer.popleft() if self.buffer else None
+
+
+class EventBus:
+
+    def __init__(self, buffer_size=100, poll_interval=1.0, max_streams=2):
+        self.buffer_size = buffer_size
+        self.poll_interval = poll_interval
+        self.max_streams = max_streams
+        self._subscribers = set()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        # (requestID, lastModified) pairs already published here, so the
+        # poller doesn't repeat this worker's own changes
+        self._recent = OrderedDict()
+        self._poller = None
+
+    def init_app(self, app):
+        app.config.setdefault('EVENTS_BUFFER_SIZE', 100)
+        app.config.setdefault('EVENTS_POLL_INTERVAL', 1.0)
+        app.config.setdefault('EVENTS_MAX_STREAMS', 2)
+        self.buffer_size = int(app.config['EVENTS_BUFFER_SIZE'])
+        self.poll_interval = float(app.config['EVENTS_POLL_INTERVAL'])
+        self.max_streams = int(app.config['EVENTS_MAX_STREAMS'])
+
+    # -------------------------
+    # subscribers
+    # -------------------------
+    def subscribe(self, **filters):
+        """A new Subscription, or None if this worker already serves max_streams."""
+        sub = Subscription(filters, self.buffer_size)
+        with self._lock:
+            if len(self._subscribers) >= self.max_streams:
+                return None
+            self._subscribers.add(sub)
+            self._start_poller()
+        return sub
+
+    def unsubscribe(self, sub):
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    def has_subscribers(self):
+        return bool(self._subscribers)
+
+    # -------------------------
+    # publishing
+    # -------------------------
+    def publish(self, event_type, rows):
+        """Publish one event per request row (as returned by load_event_rows)."""
+        for row in rows:
+            key = (row['requestID'], str(row.get('lastModified')))
+            with self._lock:
+                if key in self._recent:
+                    continue
+                self._recent[key] = True
+                while len(self._recent) > 1000:
+                    self._recent.popitem(last=False)
+                subscribers = list(self._subscribers)
+                event = dict(row, type=event_type, id=next(self._ids))
+            for sub in subscribers:
+                if sub.matches(event):
+                    sub.push(event)
+
+    def publish_requests(self, cursor, event_type, request_ids):
+        """
+        Publish changes to request_ids; call after the change is committed.
+        Skips the lookup entirely when nobody in this worker is listening.
+        """
+        if not request_ids or not self.has_subscribers():
+            return
+        try:
+            self.publish(event_type, load_event_rows(cursor, request_ids=request_ids))
+        except Exception:
+            # events are best effort; the write already succeeded
+            pass
+
+    # -------------------------
+    # cross-worker poller
+    # -------------------------
+    def _start_poller(self):
+        # called with self._lock held
+        if self.poll_interval <= 0 or self._poller is not None:
+            return
+        self._poller = threading.Thread(target=self._poll, name='request-events-poller', daemon=True)
+        self._poller.start()
+
+    def _poll(self):
+        watermark = None
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    self._poller = None
+                    return
+            time.sleep(self.poll_interval)
+            try:
+                if not schema.has_column('maintenanceRequest', 'lastModified'):
+                    continue
+                conn = db.pool.acquire()
+                try:
+                    cursor = conn.cursor()
+                    if watermark is None:
+                        cursor.execute("SELECT NOW(6) AS now")
+                        watermark = cursor.fetchone()['now']
+                        rows = []
+                    else:
+                        rows = load_event_rows(cursor, since=watermark)
+                    conn.commit()   # end the snapshot so the next poll sees new commits
+                finally:
+                    db.pool.release(conn)
+                if rows:
+                    watermark = rows[-1]['lastModified']
+                    self.publish('request.changed', rows)
+            except Exception:
+                time.sleep(self.poll_interval)
+
+
+def load_event_rows(cursor, request_ids=None, since=None):
+    """Request fields the stream filters and reports on, by id list or changed since a time."""
+    last_modified = 'r.lastModified' if schema.has_column('maintenanceRequest', 'lastModified') else 'NULL'
+    if request_ids is not None:
+        where = f"r.requestID IN ({', '.join(['%s'] * len(request_ids))})"
+        params = tuple(request_ids)
+    else:
+        # hold back the last second of changes, like GET /requests?updated_since=,
+        # so a transaction committing late isn't skipped by the watermark
+        where = (
+            f"r.lastModified > %s AND r.lastModified <= NOW(6) - INTERVAL {POLL_SETTLE_SECONDS} SECOND "
+            f"ORDER BY r.lastModified, r.requestID LIMIT 500"
+        )
+        params = (since,)
+    cursor.execute(
+        f"""
+        SELECT r.requestID, r.statusCode, r.priority, r.buildingID, r.aptNumber,
+               r.studentRequestingID, {last_modified} AS lastModified,
+               (SELECT GROUP_CONCAT(ea.employeeID) FROM employeeAssigned ea
+                WHERE ea.requestID = r.requestID) AS employeeIDs
+        FROM maintenanceRequest r
+        WHERE {where}
+        """,
+        params
+    )
+    rows = []
+    for row in cursor.fetchall():
+        row = dict(row)
+        row['activeStatus'] = status_name(row['statusCode'])
+        employees = row.get('employeeIDs')
+        row['employeeIDs'] = [int(e) for e in str(employees).split(',')] if employees else []
+        rows.append(row)
+    return rows
+
+
+def format_sse(event):
+    """Encode an event as a text/event-stream message."""
+    lines = []
+    if event.get('id') is not None:
+        lines.append(f"id: {event['id']}")
+    lines.append(f"event: {event.get('type', 'message')}")
+    lines.append("data: " + json.dumps(event, default=str))
+    return "\n".join(lines) + "\n\n"
+
+
+# shared by every blueprint in this worker
+bus = EventBus()
@@ -0,0 +1,215 @@
+#------------------------------------------------------------
+# Append-only requestHistory log.
+#
+# The request routes record status and assignment changes after
+# they commit. Entries are buffered in memory and written by a
+# background thread as one multi-row INSERT per flush, on a pooled
+# connection of its own, so an update doesn't pay an extra write
+# round trip. changedAt is taken when the change is recorded, not
+# when it is flushed.
+#
+# HISTORY_SYNC=True flushes on every record() instead (tests, or
+# when the timeline must be readable as soon as the route returns).
+# Unflushed entries are written at worker exit; if MySQL is down
+# they are kept (up to max_pending) and retried on the next flush.
+# Only connection errors are retried: a batch MySQL rejects for its
+# data is written row by row instead, and rows that still fail are
+# logged and dropped, so one bad entry can't hold up the rest.
+#------------------------------------------------------------
+import atexit
+import logging
+import os
+import threading
+from datetime import datetime
+
+import pymysql
+
+from backend.db_connection import PoolTimeout, db
+
+
+HISTORY_INSERT_SQL = """
+    INSERT INTO requestHistory
+        (requestID, eventType, oldStatus, newStatus, employeeID, changedBy, changedAt, note)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+"""
+# requestHistory.note is VARCHAR(255)
+NOTE_MAX_LENGTH = 255
+# errors caused by a row's values rather than the connection
+ROW_ERRORS = (pymysql.err.DataError, pymysql.err.IntegrityError)
+# MySQL unreachable or busy: keep the entries and try again next flush
+RETRY_ERRORS = (pymysql.err.OperationalError, pymysql.err.InterfaceError, PoolTimeout, OSError)
+
+
+def _int_or_none(value):
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class HistoryLog:
+
+    def __init__(self, db, flush_interval=1.0, batch_size=500, max_pending=50000, sync=False):
+        self.db = db
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+        self.sync = sync
+        self.logger = logging.getLogger(__name__)
+        self._pending = []
+        self._lock = threading.Lock()
+        # one flush at a time, so rows are inserted in the order they were recorded
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._flusher = None
+        self._pid = os.getpid()
+
+    def init_app(self, app):
+        app.config.setdefault('HISTORY_FLUSH_INTERVAL', 1.0)
+        app.config.setdefault('HISTORY_BATCH_SIZE', 500)
+        app.config.setdefault('HISTORY_SYNC', False)
+        self.flush_interval = float(app.config['HISTORY_FLUSH_INTERVAL'])
+        self.batch_size = int(app.config['HISTORY_BATCH_SIZE'])
+        self.sync = bool(app.config['HISTORY_SYNC'])
+        self.logger = app.logger
+        atexit.register(self.flush)
+
+    # -------------------------
+    # recording
+    # -------------------------
+    def record(self, request_id, event_type, old_status=None, new_status=None,
+               employee_id=None, changed_by=None, note=None):
+        """
+        Queue one entry. event_type is 'created', 'status', 'assigned' or
+        'unassigned'; statuses are requestStatus codes.
+        """
+        self.record_many([(request_id, event_type, old_status, new_status, employee_id, changed_by, note)])
+
+    def record_many(self, entries):
+        """Queue (requestID, eventType, oldStatus, newStatus, employeeID, changedBy, note) tuples."""
+        if not entries:
+            return
+        now = datetime.now()
+        # employeeID and changedBy are INT columns, and user_id / reason come
+        # straight from the request body
+        rows = [
+            (request_id, event_type, old_status, new_status,
+             _int_or_none(employee_id), _int_or_none(changed_by), now,
+             str(note)[:NOTE_MAX_LENGTH] if note is not None else None)
+            for request_id, event_type, old_status, new_status, employee_id, changed_by, note in entries
+        ]
+        with self._lock:
+            self._pending.extend(rows)
+            if len(self._pending) > self.max_pending:
+                dropped = len(self._pending) - self.max_pending
+                del self._pending[:dropped]
+                self.logger.error("requestHistory buffer full; dropped %s oldest entries", dropped)
+            full = len(self._pending) >= self.batch_size
+            if not self.sync:
+                self._start_flusher()
+        if self.sync:
+            self.flush()
+        elif full:
+            self._wakeup.set()
+
+    def pending(self):
+        with self._lock:
+            return len(self._pending)
+
+    # -------------------------
+    # flushing
+    # -------------------------
+    def flush(self):
+        """Write everything queued so far; returns the number of rows inserted."""
+        with self._flush_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+            if not rows:
+                return 0
+            dropped = 0
+            try:
+                conn = self.db.pool.acquire()
+                try:
+                    cursor = conn.cursor()
+                    for start in range(0, len(rows), self.batch_size):
+                        batch = rows[start:start + self.batch_size]
+                        try:
+                            # pymysql folds executemany INSERT ... VALUES into one multi-row statement
+                            cursor.executemany(HISTORY_INSERT_SQL, batch)
+                        except ROW_ERRORS:
+                            # the failed statement wrote nothing; find the bad rows
+                            dropped += self._insert_each(cursor, batch)
+                    conn.commit()
+                finally:
+                    self.db.pool.release(conn)
+            except RETRY_ERRORS:
+                self.logger.exception("requestHistory flush failed; %s entries kept for retry", len(rows))
+                with self._lock:
+                    self._pending[:0] = rows
+                return 0
+            except Exception:
+                # retrying wouldn't help (e.g. the table is missing)
+                self.logger.exception("requestHistory flush failed; %s entries dropped", len(rows))
+                return 0
+            return len(rows) - dropped
+
+    def _insert_each(self, cursor, batch):
+        """Insert batch one row at a time, dropping rows MySQL rejects; returns how many were dropped."""
+        dropped = 0
+        for row in batch:
+            try:
+                cursor.execute(HISTORY_INSERT_SQL, row)
+            except ROW_ERRORS as e:
+                dropped += 1
+                self.logger.error("requestHistory entry dropped (%s): %r", e, row)
+        return dropped
+
+    def _start_flusher(self):
+        # called with self._lock held; a forked worker starts its own thread
+        pid = os.getpid()
+        if self._flusher is not None and self._pid == pid:
+            return
+        self._pid = pid
+        self._flusher = threading.Thread(target=self._run, name='request-history-flusher', daemon=True)
+        self._flusher.start()
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+def load_request_state(cursor, request_ids, assignments=False):
+    """
+    Lock the requests' rows for this transaction and return
+    {requestID: (statusCode, set of assigned employeeIDs)} so the caller
+    can log what actually changed.
+    """
+    if not request_ids:
+        return {}
+    employees = (
+        "(SELECT GROUP_CONCAT(ea.employeeID) FROM employeeAssigned ea WHERE ea.requestID = r.requestID)"
+        if assignments else "NULL"
+    )
+    cursor.execute(
+        f"""
+        SELECT r.requestID, r.statusCode, {employees} AS employeeIDs
+        FROM maintenanceRequest r
+        WHERE r.requestID IN ({', '.join(['%s'] * len(request_ids))})
+        FOR UPDATE
+        """,
+        tuple(request_ids)
+    )
+    state = {}
+    for row in cursor.fetchall():
+        employee_ids = row.get('employeeIDs')
+        state[row['requestID']] = (
+            row['statusCode'],
+            {int(e) for e in str(employee_ids).split(',')} if employee_ids else set(),
+        )
+    return state
+
+
+# shared by every blueprint in this worker
+history = HistoryLog(db)
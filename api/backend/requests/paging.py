@@ -0,0 +1,27 @@
+#------------------------------------------------------------
+# Keyset paging cursors.
+#
+# A cursor is an opaque token over (value, requestID) of the last row
+# on a page, where value is the ordering column (dateRequested for
+# GET /requests and part usage, lastModified for delta sync); the
+# next page starts strictly after it.
+#------------------------------------------------------------
+import base64
+import json
+
+
+def encode_cursor(row, column='dateRequested'):
+    value = row.get(column)
+    key = [str(value) if value is not None else None, row.get('requestID')]
+    raw = json.dumps(key, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(token):
+    """(value, requestID) from a cursor token; raises ValueError."""
+    padded = token + '=' * (-len(token) % 4)
+    try:
+        value, request_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return value, int(request_id)
+    except Exception:
+        raise ValueError('invalid cursor')
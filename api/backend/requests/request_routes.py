@@ -1,7 +1,19 @@
 from flask import Blueprint, request, jsonify, make_response, current_app
-from backend.db_connection import db
+from backend.db_connection import db, ids, idempotency, schema
+from backend.employee.forecast import forecast
+from backend.employee.inventory import inventory
+from backend.photos import photos
+from backend.photos.storage import sniff_content_type
+from backend.requests.events import bus, format_sse
+from backend.requests.history import history, load_request_state
+from backend.requests.paging import decode_cursor, encode_cursor
+from backend.requests.statuses import CANCELED, OPEN, add_status_names, status_code, status_name
+from backend.requests.workload import workload
 from datetime import datetime
+import json
+import time
 import pymysql
+from werkzeug.formparser import parse_form_data
 
 requests_bp = Blueprint('requests', __name__, url_prefix='/requests')
 
@@ -41,24 +53,91 @@ def row_to_dict(cursor, row):
     return dict(zip(col_names, row))
 
 
-# -------------------------
-# GET /requests
-# Return list of requests, filterable by student, employee, status, date range, priority
-# Query params supported:
-#   student_id, employee_id, status, start_date, end_date, priority, limit, offset
-# -------------------------
-@requests_bp.get('')
-def list_requests():
+# delta sync (updated_since) ignores changes newer than this many seconds, so a
+# transaction that commits slightly late can't land behind a client's watermark
+DELTA_SETTLE_SECONDS = 1
+
+
+# Related data GET /requests can embed with ?expand=. Each is loaded for the whole
+# page with one IN (...) query and stitched onto the rows in Python.
+LIST_EXPANSIONS = ('assignedEmployees', 'parts', 'building')
+
+
+def in_placeholders(values):
+    return ', '.join(['%s'] * len(values))
+
+
+def expand_requests(cursor, results, expand):
+    if not results:
+        return
+    request_ids = [row['requestID'] for row in results]
+
+    if 'assignedEmployees' in expand:
+        cursor.execute(
+            f"""
+            SELECT ea.requestID, e.employeeID, e.firstName, e.lastName, e.employeeType
+            FROM employeeAssigned ea
+            JOIN employee e ON e.employeeID = ea.employeeID
+            WHERE ea.requestID IN ({in_placeholders(request_ids)})
+            """,
+            tuple(request_ids)
+        )
+        attach_children(results, rows_to_dicts(cursor, cursor.fetchall()), 'assignedEmployees')
+
+    if 'parts' in expand:
+        quantity = 'pu.quantity' if schema.has_column('partUsed', 'quantity') else '1'
+        cursor.execute(
+            f"""
+            SELECT pu.requestID, p.partID, p.name, {quantity} AS quantity, p.cost
+            FROM partUsed pu
+            JOIN part p ON p.partID = pu.partID
+            WHERE pu.requestID IN ({in_placeholders(request_ids)})
+            """,
+            tuple(request_ids)
+        )
+        attach_children(results, rows_to_dicts(cursor, cursor.fetchall()), 'parts')
+
+    if 'building' in expand:
+        building_ids = sorted({row['buildingID'] for row in results if row.get('buildingID') is not None})
+        buildings = {}
+        if building_ids:
+            cursor.execute(
+                f"""
+                SELECT buildingID, address, managerID
+                FROM building
+                WHERE buildingID IN ({in_placeholders(building_ids)})
+                """,
+                tuple(building_ids)
+            )
+            buildings = {b['buildingID']: b for b in rows_to_dicts(cursor, cursor.fetchall())}
+        for row in results:
+            row['building'] = buildings.get(row.get('buildingID'))
+
+
+def attach_children(results, children, key):
+    """Group child rows by requestID onto results[...][key] (dropping requestID)."""
+    by_request = {}
+    for child in children:
+        by_request.setdefault(child.pop('requestID'), []).append(child)
+    for row in results:
+        row[key] = by_request.get(row['requestID'], [])
+
+
+def request_filters(args):
+    """
+    WHERE fragments and parameters for the GET /requests filter query params.
+    Raises ValueError for an unknown status.
+    """
     params = []
     where_clauses = []
 
-    student_id = request.args.get('student_id')
+    student_id = args.get('student_id')
     if student_id:
         # schema uses studentRequestingID
         where_clauses.append("r.studentRequestingID = %s")
         params.append(student_id)
 
-    employee_id = request.args.get('employee_id')
+    employee_id = args.get('employee_id')
     if employee_id:
         # employeeAssigned is a join table: filter by existence
         where_clauses.append(
@@ -66,19 +145,24 @@ def list_requests():
         )
         params.append(employee_id)
 
-    status = request.args.get('status')
+    status = args.get('status')
     if status:
-        # schema uses activeStatus
-        where_clauses.append("r.activeStatus = %s")
-        params.append(status)
+        # names are translated to requestStatus codes (an equality seek on idx_mr_status_requested)
+        where_clauses.append("r.statusCode = %s")
+        params.append(status_code(status))
 
-    priority = request.args.get('priority')
+    priority = args.get('priority')
     if priority:
         where_clauses.append("r.priority = %s")
         params.append(priority)
 
-    start_date = request.args.get('start_date')
-    end_date = request.args.get('end_date')
+    building_id = args.get('buildingID')
+    if building_id:
+        where_clauses.append("r.buildingID = %s")
+        params.append(building_id)
+
+    start_date = args.get('start_date')
+    end_date = args.get('end_date')
     if start_date and end_date:
         where_clauses.append("r.dateRequested BETWEEN %s AND %s")
         params.append(start_date)
@@ -89,11 +173,46 @@ def list_requests():
     elif end_date:
         where_clauses.append("r.dateRequested <= %s")
         params.append(end_date)
+    return where_clauses, params
 
-    where_sql = ("WHERE " + " AND ".join(where_clauses)) if where_clauses else ""
+
+# -------------------------
+# GET /requests
+# Return list of requests, filterable by student, employee, status, date range, priority, building
+# Query params supported:
+#   student_id, employee_id, status, start_date, end_date, priority, buildingID, limit, offset,
+#   cursor, updated_since, sort, expand (comma separated: assignedEmployees, parts, building)
+# Paging:
+#   cursor  -> keyset paging; pass cursor= (empty) for the first page, then the
+#              returned next_cursor. Response is {"results": [...], "next_cursor": ...}
+#   offset  -> legacy paging, response is a plain list (X-Next-Cursor header is
+#              also set so clients can switch to cursors, except with sort=dispatch)
+# Delta sync:
+#   updated_since -> a timestamp/date for the first sync, then the returned watermark.
+#              Returns rows changed after it, oldest change first, as
+#              {"results": [...], "watermark": ..., "has_more": bool}. Changes from the
+#              last DELTA_SETTLE_SECONDS are held back so slow commits aren't skipped.
+# Sorting:
+#   sort=dispatch -> status (in progress, en route, blocked, open, completed), then
+#              priority high to low, then oldest request first; read straight off
+#              the idx_mr_dispatch index. Pages with limit/offset.
+# -------------------------
+@requests_bp.get('')
+def list_requests():
+    expand = [name.strip() for name in request.args.get('expand', '').split(',') if name.strip()]
+    unknown = [name for name in expand if name not in LIST_EXPANSIONS]
+    if unknown:
+        return make_response(
+            {'error': f"unknown expand {', '.join(unknown)}; use {', '.join(LIST_EXPANSIONS)}"}, 400
+        )
+
+    try:
+        where_clauses, params = request_filters(request.args)
+    except ValueError as e:
+        return make_response({'error': str(e)}, 400)
 
     try:
-        limit = int(request.args.get('limit', 100))
+        limit = max(int(request.args.get('limit', 100)), 1)
     except ValueError:
         limit = 100
     try:
@@ -101,39 +220,220 @@ def list_requests():
     except ValueError:
         offset = 0
 
+    sort = request.args.get('sort')
+    if sort not in (None, '', 'dispatch'):
+        return make_response({'error': 'sort must be dispatch'}, 400)
+    if sort and ('cursor' in request.args or 'updated_since' in request.args):
+        return make_response({'error': 'sort=dispatch pages with limit/offset only'}, 400)
+
+    has_last_modified = schema.has_column('maintenanceRequest', 'lastModified')
+    updated_since = request.args.get('updated_since')
+    if updated_since is not None:
+        if not has_last_modified:
+            return make_response(
+                {'error': 'updated_since needs maintenanceRequest.lastModified (see database-files/migrations)'}, 400
+            )
+        try:
+            since_ts, since_id = decode_cursor(updated_since)
+        except ValueError:
+            # a plain timestamp or date from the client's first sync
+            since_ts, since_id = updated_since, 0
+        where_clauses.append(
+            "(r.lastModified > %s OR (r.lastModified = %s AND r.requestID > %s))"
+        )
+        params.extend([since_ts, since_ts, since_id])
+        where_clauses.append(f"r.lastModified <= NOW(6) - INTERVAL {DELTA_SETTLE_SECONDS} SECOND")
+        order_sql = "ORDER BY r.lastModified, r.requestID"
+        offset = 0
+    elif sort == 'dispatch':
+        # status codes are numbered in board order
+        order_sql = "ORDER BY r.statusCode, r.priority DESC, r.dateRequested, r.requestID"
+    else:
+        order_sql = "ORDER BY r.dateRequested DESC, r.requestID DESC"
+
+    # keyset mode: seek past the last row seen instead of skipping OFFSET rows
+    use_cursor = 'cursor' in request.args and updated_since is None
+    page_token = request.args.get('cursor') if use_cursor else None
+    if page_token:
+        try:
+            after_date, after_id = decode_cursor(page_token)
+        except ValueError:
+            return make_response({'error': 'invalid cursor'}, 400)
+        if after_date is None:
+            # NULL dates sort last in DESC order, so only NULL-dated rows remain
+            where_clauses.append("(r.dateRequested IS NULL AND r.requestID < %s)")
+            params.append(after_id)
+        else:
+            where_clauses.append(
+                "(r.dateRequested < %s OR (r.dateRequested = %s AND r.requestID < %s) OR r.dateRequested IS NULL)"
+            )
+            params.extend([after_date, after_date, after_id])
+    if use_cursor:
+        offset = 0
+
+    where_sql = ("WHERE " + " AND ".join(where_clauses)) if where_clauses else ""
+
     cursor = db.get_db().cursor()
     query = f"""
         SELECT
             r.requestID,
             r.issueType,
             r.issueDescription,
-            r.activeStatus,
+            r.statusCode,
             r.priority,
             r.dateRequested,
             r.dateCompleted,
             r.buildingID,
             r.aptNumber,
-            r.studentRequestingID
+            r.studentRequestingID{", r.lastModified" if has_last_modified else ""}
         FROM maintenanceRequest r
         {where_sql}
-        ORDER BY r.dateRequested DESC
+        {order_sql}
         LIMIT %s OFFSET %s
     """
-    params.extend([limit, offset])
+    # fetch one extra row to learn whether another page exists
+    params.extend([limit + 1, offset])
     cursor.execute(query, tuple(params))
     rows = cursor.fetchall()
-    results = rows_to_dicts(cursor, rows)
-    return make_response(jsonify(results), 200)
+    results = add_status_names(rows_to_dicts(cursor, rows))
+
+    next_cursor = None
+    has_more = len(results) > limit
+    if has_more:
+        results = results[:limit]
+        next_cursor = encode_cursor(results[-1])
+
+    if expand:
+        expand_requests(cursor, results, expand)
+
+    if updated_since is not None:
+        if results:
+            watermark = encode_cursor(results[-1], 'lastModified')
+        else:
+            watermark = encode_cursor({'lastModified': since_ts, 'requestID': since_id}, 'lastModified')
+        return make_response(jsonify({'results': results, 'watermark': watermark, 'has_more': has_more}), 200)
+
+    if use_cursor:
+        return make_response(jsonify({'results': results, 'next_cursor': next_cursor}), 200)
+
+    response = make_response(jsonify(results), 200)
+    if next_cursor and not sort:
+        # cursors follow dateRequested order, so there is none for sort=dispatch
+        response.headers['X-Next-Cursor'] = next_cursor
+    return response
+
+
+# MySQL error for MATCH() without a matching FULLTEXT index
+ER_FT_MATCHING_KEY_NOT_FOUND = 1191
+# MySQL parse error, raised for a malformed BOOLEAN MODE search string
+ER_PARSE_ERROR = 1064
 
 
 # -------------------------
-# POST /requests
-# Create a new maintenance request (expects JSON body)
-# Accepts external fields 'description' and 'studentID' and maps to DB columns
+# GET /requests/search
+# Full-text search over issueDescription and completionNotes, best match first.
+# Query params:
+#   q       search text (required)
+#   mode    natural (default) or boolean (+must -exclude "phrase" word*)
+#   limit, offset, and every GET /requests filter (student_id, employee_id,
+#   status, priority, buildingID, start_date, end_date)
+# Response: {"results": [... with relevance], "next_offset": n or null}
+# Backed by the ft_mr_text FULLTEXT index.
 # -------------------------
-@requests_bp.post('')
-def create_request():
-    data = request.json or {}
+@requests_bp.get('/search')
+def search_requests():
+    q = (request.args.get('q') or '').strip()
+    if not q:
+        return make_response({'error': 'q is required'}, 400)
+    mode = request.args.get('mode', 'natural').lower()
+    if mode not in ('natural', 'boolean'):
+        return make_response({'error': 'mode must be natural or boolean'}, 400)
+    match_sql = (
+        "MATCH(r.issueDescription, r.completionNotes) AGAINST (%s IN "
+        + ("BOOLEAN MODE)" if mode == 'boolean' else "NATURAL LANGUAGE MODE)")
+    )
+
+    try:
+        limit = min(max(int(request.args.get('limit', 20)), 1), 100)
+    except ValueError:
+        limit = 20
+    try:
+        offset = max(int(request.args.get('offset', 0)), 0)
+    except ValueError:
+        offset = 0
+
+    try:
+        where_clauses, params = request_filters(request.args)
+    except ValueError as e:
+        return make_response({'error': str(e)}, 400)
+    where_clauses.insert(0, match_sql)
+    params.insert(0, q)
+
+    cursor = db.get_db().cursor()
+    try:
+        cursor.execute(
+            f"""
+            SELECT
+                r.requestID,
+                r.issueType,
+                r.issueDescription,
+                r.completionNotes,
+                r.statusCode,
+                r.priority,
+                r.dateRequested,
+                r.dateCompleted,
+                r.buildingID,
+                r.aptNumber,
+                r.studentRequestingID,
+                {match_sql} AS relevance
+            FROM maintenanceRequest r
+            WHERE {" AND ".join(where_clauses)}
+            ORDER BY relevance DESC, r.requestID DESC
+            LIMIT %s OFFSET %s
+            """,
+            tuple([q] + params + [limit + 1, offset])
+        )
+    except pymysql.MySQLError as e:
+        if e.args and e.args[0] == ER_FT_MATCHING_KEY_NOT_FOUND:
+            return make_response(
+                {'error': 'search index missing (see database-files/migrations/003_request_fulltext.sql)'}, 503
+            )
+        if e.args and e.args[0] == ER_PARSE_ERROR and mode == 'boolean':
+            return make_response(
+                {'error': 'q is not a valid boolean search (check +, -, *, quotes and parentheses)'}, 400
+            )
+        raise
+    results = add_status_names(rows_to_dicts(cursor, cursor.fetchall()))
+
+    next_offset = None
+    if len(results) > limit:
+        results = results[:limit]
+        next_offset = offset + limit
+    return make_response(jsonify({'results': results, 'next_offset': next_offset}), 200)
+
+
+REQUEST_INSERT_SQL = """
+    INSERT INTO maintenanceRequest
+        (requestID, issueType, issueDescription, buildingID, aptNumber,
+         priority, studentRequestingID, dateRequested, statusCode)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+# most rows sent to MySQL in one multi-row INSERT by POST /requests/batch
+BATCH_CHUNK_SIZE = 500
+# most items accepted by one POST /requests/batch call
+BATCH_MAX_ITEMS = 10000
+
+
+def parse_new_request(data):
+    """
+    Validate a new-request payload.
+
+    Returns (values, error): values is the insert parameter tuple without the
+    leading requestID, error is a message when the payload is invalid.
+    """
+    if not isinstance(data, dict):
+        return None, 'request must be a JSON object'
 
     issueType = data.get('issueType')
     description = data.get('description')
@@ -145,31 +445,14 @@ def create_request():
 
     # basic validation
     if not issueType or not description or not buildingID:
-        return make_response({'error': 'issueType, description and buildingID are required'}, 400)
+        return None, 'issueType, description and buildingID are required'
 
     try:
         aptNumber = int(aptNumber)
     except Exception:
-        return make_response({'error': 'aptNumber must be an integer'}, 400)
-
-    conn = db.get_db()
-    cursor = conn.cursor()
-
-    #tried to add auto increment but it broke db so we are doing this now.
-    cursor.execute("SELECT COALESCE(MAX(requestID), 0) + 1 FROM maintenanceRequest")
-    row = cursor.fetchone()
-    new_id = list(row.values())[0]
-
+        return None, 'aptNumber must be an integer'
 
-    insert_sql = """
-        INSERT INTO maintenanceRequest
-            (requestID, issueType, issueDescription, buildingID, aptNumber,
-             priority, studentRequestingID, dateRequested, activeStatus)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-    """
-
-    params = (
-        new_id,
+    return (
         issueType,
         description,
         buildingID,
@@ -177,12 +460,35 @@ def create_request():
         priority,
         studentID,
         dateRequested,
-        'open'
-    )
+        OPEN
+    ), None
+
+
+# -------------------------
+# POST /requests
+# Create a new maintenance request (expects JSON body)
+# Accepts external fields 'description' and 'studentID' and maps to DB columns
+# Send an Idempotency-Key header to make retries safe: a repeat returns the
+# first response instead of creating another request.
+# -------------------------
+@requests_bp.post('')
+@idempotency.idempotent
+def create_request():
+    values, error = parse_new_request(request.json or {})
+    if error:
+        return make_response({'error': error}, 400)
+
+    conn = db.get_db()
+    cursor = conn.cursor()
+
+    # ids come from a per-worker block reserved in idSequence (no MAX(requestID) scan)
+    new_id = ids.next_id('maintenanceRequest')
 
     try:
-        cursor.execute(insert_sql, params)
+        cursor.execute(REQUEST_INSERT_SQL, (new_id,) + values)
         conn.commit()
+        history.record(new_id, 'created', new_status=OPEN, changed_by=values[5])
+        bus.publish_requests(cursor, 'request.created', [new_id])
         return make_response({'requestID': new_id}, 201)
 
     except Exception as e:
@@ -191,141 +497,567 @@ def create_request():
         return make_response({'error': str(e)}, 500)
 
 
+def read_batch_items():
+    """Yield request payloads from a JSON array body or an NDJSON stream."""
+    if request.mimetype in ('application/x-ndjson', 'application/jsonl'):
+        # read line by line so large imports are never held as one string
+        for line in request.stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                yield ValueError('invalid JSON line')
+        return
+
+    items = request.get_json(silent=True)
+    if not isinstance(items, list):
+        raise ValueError('body must be a JSON array (or application/x-ndjson)')
+    yield from items
+
+
 # -------------------------
-# GET /requests/<id>
-# Return full details for a request (photos, notes, history, status, schedule/eta, completion, assigned employees, parts)
+# POST /requests/batch
+# Create many maintenance requests at once (JSON array or NDJSON, one request per line).
+# Every item is validated like POST /requests; valid ones get IDs from one
+# reserved block and are inserted with multi-row INSERTs in a single transaction.
+# Returns per-item results: {"index": i, "requestID": id} or {"index": i, "error": msg}
 # -------------------------
-@requests_bp.get('/<int:request_id>')
-def get_request_detail(request_id):
-    conn = db.get_db()
-    cursor = conn.cursor()
+@requests_bp.post('/batch')
+def create_requests_batch():
+    results = []
+    valid = []   # (result index, values)
+    try:
+        for index, item in enumerate(read_batch_items()):
+            if index >= BATCH_MAX_ITEMS:
+                return make_response({'error': f'at most {BATCH_MAX_ITEMS} requests per batch'}, 413)
+            if isinstance(item, Exception):
+                results.append({'index': index, 'error': str(item)})
+                continue
+            values, error = parse_new_request(item)
+            if error:
+                results.append({'index': index, 'error': error})
+            else:
+                results.append({'index': index})
+                valid.append((index, values))
+    except ValueError as e:
+        return make_response({'error': str(e)}, 400)
 
-    # primary request row (use actual column names)
-    cursor.execute(
-        """
-        SELECT r.*, b.address AS buildingAddress
+    if valid:
+        new_ids = ids.reserve('maintenanceRequest', len(valid))
+        rows = [(new_id,) + values for new_id, (_, values) in zip(new_ids, valid)]
+
+        conn = db.get_db()
+        cursor = conn.cursor()
+        try:
+            for start in range(0, len(rows), BATCH_CHUNK_SIZE):
+                # pymysql folds executemany INSERT ... VALUES into one multi-row statement
+                cursor.executemany(REQUEST_INSERT_SQL, rows[start:start + BATCH_CHUNK_SIZE])
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            current_app.logger.exception("Failed to create maintenance request batch")
+            for index, _ in valid:
+                results[index]['error'] = str(e)
+            valid = []
+        else:
+            for new_id, (index, _) in zip(new_ids, valid):
+                results[index]['requestID'] = new_id
+            history.record_many([
+                (new_id, 'created', None, OPEN, None, row[6], None)
+                for new_id, row in zip(new_ids, rows)
+            ])
+            bus.publish_requests(cursor, 'request.created', new_ids)
+
+    created = len(valid)
+    body = {'created': created, 'failed': len(results) - created, 'results': results}
+    return make_response(jsonify(body), 201 if created else 400)
+
+
+# seconds between SSE heartbeat comments on an idle stream
+STREAM_HEARTBEAT_SECONDS = 15
+# Retry-After for a stream turned away because the worker is full
+STREAM_RETRY_AFTER_SECONDS = 30
+
+
+# -------------------------
+# GET /requests/stream
+# Server-Sent Events of request changes (request.created / request.updated /
+# request.canceled / request.changed), published after each write commits.
+# Optional filters: employee_id, student_id, buildingID.
+# A "resync" event means events were dropped (slow client); refetch the list.
+# The stream holds no DB connection while idle. Each worker serves at most
+# EVENTS_MAX_STREAMS streams; past that the answer is 503 with Retry-After.
+# -------------------------
+@requests_bp.get('/stream')
+def stream_requests():
+    filters = {}
+    for arg in ('employee_id', 'student_id', 'buildingID'):
+        value = request.args.get(arg)
+        if value:
+            try:
+                filters[arg] = int(value)
+            except ValueError:
+                return make_response({'error': f'{arg} must be an integer'}, 400)
+
+    subscription = bus.subscribe(**filters)
+    if subscription is None:
+        response = make_response({'error': 'Too many open streams on this server, retry later'}, 503)
+        response.headers['Retry-After'] = str(STREAM_RETRY_AFTER_SECONDS)
+        return response
+
+    def events():
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                event = subscription.get(timeout=STREAM_HEARTBEAT_SECONDS)
+                if event is None:
+                    yield ": heartbeat\n\n"
+                else:
+                    yield format_sse(event)
+        finally:
+            bus.unsubscribe(subscription)
+
+    response = current_app.response_class(events(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
+# Child collections of a request detail, each folded into one JSON column of the
+# main query: key -> (required table, JSON_OBJECT fields, FROM/WHERE, sort key)
+DETAIL_COLLECTIONS = {
+    'photos': (
+        'requestPhotos',
+        "'photoID', x.photoID, 'filePath', x.filePath, 'thumbPath', CONCAT(x.filePath, '/thumb'), "
+        "'contentHash', x.contentHash, "
+        "'contentType', x.contentType, 'byteSize', x.byteSize, 'uploadedAt', x.uploadedAt",
+        "FROM requestPhotos x WHERE x.requestID = r.requestID",
+        'uploadedAt',
+    ),
+    'notes': (
+        'requestNotes',
+        "'noteID', x.noteID, 'authorID', x.authorID, 'text', x.text, 'createdAt', x.createdAt",
+        "FROM requestNotes x WHERE x.requestID = r.requestID",
+        'createdAt',
+    ),
+    'history': (
+        'requestHistory',
+        "'historyID', x.historyID, 'eventType', x.eventType, 'oldStatus', so.name, "
+        "'newStatus', sn.name, 'employeeID', x.employeeID, 'changedBy', x.changedBy, "
+        "'changedAt', x.changedAt, 'note', x.note",
+        "FROM requestHistory x "
+        "LEFT JOIN requestStatus so ON x.oldStatus = so.statusCode "
+        "LEFT JOIN requestStatus sn ON x.newStatus = sn.statusCode "
+        "WHERE x.requestID = r.requestID",
+        'historyID',
+    ),
+    'assignedEmployees': (
+        'employeeAssigned',
+        "'employeeID', e.employeeID, 'firstName', e.firstName, 'lastName', e.lastName, "
+        "'employeeType', e.employeeType",
+        "FROM employee e JOIN employeeAssigned ea ON e.employeeID = ea.employeeID "
+        "WHERE ea.requestID = r.requestID",
+        None,
+    ),
+    'parts': (
+        'partUsed',
+        "'partID', p.partID, 'name', p.name, 'quantity', {quantity}, 'cost', p.cost",
+        "FROM partUsed pu JOIN part p ON pu.partID = p.partID WHERE pu.requestID = r.requestID",
+        None,
+    ),
+}
+
+
+def request_detail_sql():
+    """Build the single-statement detail query for the tables this database has."""
+    selects = []
+    for key, (table, fields, source, _) in DETAIL_COLLECTIONS.items():
+        if not schema.has_table(table):
+            continue
+        if key == 'parts':
+            # each partUsed row is one part unless the table tracks quantities
+            fields = fields.format(
+                quantity='pu.quantity' if schema.has_column('partUsed', 'quantity') else '1'
+            )
+        selects.append(f"(SELECT JSON_ARRAYAGG(JSON_OBJECT({fields})) {source}) AS `{key}`")
+    extra = (",\n            " + ",\n            ".join(selects)) if selects else ""
+    return f"""
+        SELECT r.*, b.address AS buildingAddress{extra}
         FROM maintenanceRequest r
         LEFT JOIN building b ON r.buildingID = b.buildingID
         WHERE r.requestID = %s
-        """,
-        (request_id,)
-    )
+    """
+
+
+# -------------------------
+# GET /requests/<id>
+# Return full details for a request (photos, notes, history, status, schedule/eta, completion, assigned employees, parts)
+# Everything comes back from one statement: each collection is aggregated into a JSON
+# column, and collections whose table doesn't exist (see schema capabilities) are skipped.
+# The Server-Timing header reports the database time for the call.
+# -------------------------
+@requests_bp.get('/<int:request_id>')
+def get_request_detail(request_id):
+    started = time.perf_counter()
+    cursor = db.get_db().cursor()
+    cursor.execute(request_detail_sql(), (request_id,))
     request_row_raw = cursor.fetchone()
+    db_ms = (time.perf_counter() - started) * 1000
     if not request_row_raw:
         return make_response({'error': 'Request not found'}, 404)
-    request_row = row_to_dict(cursor, request_row_raw)
+    detail = dict(row_to_dict(cursor, request_row_raw))
+    detail['activeStatus'] = status_name(detail.get('statusCode'))
 
-    # photos: check if a requestPhotos table exists; if not fallback to issuePhotos text field
-    photos = []
-    try:
-        cursor.execute(
-            "SELECT photoID, filePath, uploadedAt FROM requestPhotos WHERE requestID = %s ORDER BY uploadedAt DESC",
-            (request_id,)
-        )
-        photos = rows_to_dicts(cursor, cursor.fetchall())
-    except Exception:
-        if 'issuePhotos' in (request_row or {}) and request_row.get('issuePhotos'):
-            photos = [{'embedded': request_row.get('issuePhotos')}]
+    for key, (_, _, _, sort_key) in DETAIL_COLLECTIONS.items():
+        raw = detail.pop(key, None)
+        items = json.loads(raw) if raw else []
+        if sort_key:
+            # newest first, as the per-table queries used to return them
+            items.sort(key=lambda item: item.get(sort_key) or '', reverse=True)
+        detail[key] = items
+
+    # fall back to the inline columns when the dedicated tables don't exist
+    # (or, for photos, nothing has been uploaded yet)
+    if not detail['photos'] and detail.get('issuePhotos'):
+        detail['photos'] = [{'embedded': detail.get('issuePhotos')}]
+    if not schema.has_table('requestNotes') and detail.get('completionNotes'):
+        detail['notes'] = [{'note': detail.get('completionNotes')}]
+
+    current_app.logger.debug("request detail %s: %.2f ms db", request_id, db_ms)
+    response = make_response(jsonify(detail), 200)
+    response.headers['Server-Timing'] = f'db;dur={db_ms:.2f}'
+    return response
 
-    # notes / comments (try table, else use completionNotes)
-    notes = []
+
+PHOTO_INSERT_SQL = """
+    INSERT IGNORE INTO requestPhotos
+        (requestID, contentHash, filePath, contentType, byteSize, originalName, uploadedBy)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+"""
+
+
+# -------------------------
+# POST /requests/<id>/photos
+# Attach photos to a request (multipart/form-data; any file field, the UI sends "photos").
+# Files are streamed to disk and hashed as they arrive (never held whole in memory)
+# before a DB connection is taken, so slow uploads don't tie up the pool,
+# and stored once per content hash; uploading the same photo to a request again
+# is a no-op (duplicate: true). Thumbnails are made in the background.
+# Optional form field user_id is stored as uploadedBy.
+# Returns 201 {"photos": [{photoID, contentHash, filePath, thumbPath, contentType, byteSize, duplicate}]}
+# -------------------------
+@requests_bp.post('/<int:request_id>/photos')
+def upload_request_photos(request_id):
+    if request.mimetype != 'multipart/form-data':
+        return make_response({'error': 'send photos as multipart/form-data'}, 400)
+    if not schema.has_table('requestPhotos'):
+        return make_response({'error': 'photo storage missing (see database-files/migrations)'}, 503)
+
+    uploads = []
     try:
-        cursor.execute(
-            "SELECT noteID, authorID, text, createdAt FROM requestNotes WHERE requestID = %s ORDER BY createdAt DESC",
-            (request_id,)
+        # read the whole body before taking a DB connection, so a slow upload
+        # doesn't hold one (and an open transaction) for the transfer
+        _, form, files = parse_form_data(
+            request.environ, stream_factory=photos.stream_factory(uploads), silent=False
         )
-        notes = rows_to_dicts(cursor, cursor.fetchall())
-    except Exception:
-        if 'completionNotes' in (request_row or {}) and request_row.get('completionNotes'):
-            notes = [{'note': request_row.get('completionNotes')}]
+        received = [
+            (storage.filename, storage.stream) for _, storage in files.items(multi=True)
+            if storage.stream.size
+        ]
+        if not received:
+            return make_response({'error': 'no photos in the upload'}, 400)
+        for filename, upload in received:
+            if sniff_content_type(upload.head) is None:
+                return make_response({'error': f'{filename} is not a PNG, JPEG, GIF or WebP image'}, 415)
 
-    # history / status timeline (try table; otherwise empty list)
-    history = []
+        conn = db.get_db()
+        cursor = conn.cursor()
+        cursor.execute("SELECT requestID FROM maintenanceRequest WHERE requestID = %s", (request_id,))
+        if not cursor.fetchone():
+            # nothing is in the store yet; the temp files are discarded below
+            return make_response({'error': 'Request not found'}, 404)
+
+        results = []
+        try:
+            for filename, upload in received:
+                content_hash, _ = photos.save(upload)
+                cursor.execute(PHOTO_INSERT_SQL, (
+                    request_id,
+                    content_hash,
+                    f'/photos/{content_hash}',
+                    sniff_content_type(upload.head),
+                    upload.size,
+                    (filename or '')[:255] or None,
+                    form.get('user_id') or None,
+                ))
+                results.append({
+                    'photoID': cursor.lastrowid if cursor.rowcount else None,
+                    'contentHash': content_hash,
+                    'filePath': f'/photos/{content_hash}',
+                    'thumbPath': f'/photos/{content_hash}/thumb',
+                    'contentType': sniff_content_type(upload.head),
+                    'byteSize': upload.size,
+                    'duplicate': not cursor.rowcount,
+                })
+            if any(not result['duplicate'] for result in results):
+                touch_requests(cursor, [request_id])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    finally:
+        # temp files that weren't moved into the store (duplicates are already gone)
+        for upload in uploads:
+            upload.discard()
+
+    for content_hash in dict.fromkeys(result['contentHash'] for result in results):
+        try:
+            photos.schedule_thumbnail(content_hash)
+        except Exception:
+            current_app.logger.exception("Could not queue thumbnail for %s", content_hash)
+    bus.publish_requests(cursor, 'request.updated', [request_id])
+    return make_response(jsonify({'photos': results}), 201)
+
+
+# most distinct parts reserved by one POST /requests/<id>/parts call
+PARTS_MAX_ITEMS = 100
+
+
+def read_part_reservations(data):
+    """
+    Units wanted per part from a body of {"parts": [{"partID", "quantity"}, ...]}, as
+    {partID: units} in partID order (repeated parts are added together). Every
+    reservation then locks part rows in the same order. Raises ValueError.
+    """
+    items = data.get('parts')
+    if not isinstance(items, list) or not items:
+        raise ValueError('parts must be a non-empty list')
+    wanted = {}
+    for item in items:
+        if not isinstance(item, dict):
+            raise ValueError('each part must be an object with partID and quantity')
+        try:
+            part_id = int(item.get('partID'))
+            units = int(item.get('quantity', 1))
+        except (TypeError, ValueError):
+            raise ValueError('partID and quantity must be integers')
+        if units < 1:
+            raise ValueError('quantity must be at least 1')
+        wanted[part_id] = wanted.get(part_id, 0) + units
+    return dict(sorted(wanted.items()))
+
+
+def part_shortfalls(cursor, wanted):
+    """
+    Lock the part rows in wanted (in partID order, until commit) and return the
+    parts that don't have enough units in stock (available is null for unknown parts).
+    """
+    cursor.execute(
+        f"SELECT partID, quantity FROM part WHERE partID IN ({in_placeholders(wanted)}) "
+        f"ORDER BY partID FOR UPDATE",
+        tuple(wanted)
+    )
+    stock = {row['partID']: row['quantity'] for row in rows_to_dicts(cursor, cursor.fetchall())}
+    return [
+        {'partID': part_id, 'requested': units, 'available': stock.get(part_id)}
+        for part_id, units in wanted.items()
+        if stock.get(part_id) is None or stock[part_id] < units
+    ]
+
+
+# -------------------------
+# POST /requests/<id>/parts
+# Reserve stock for a request: {"parts": [{"partID": 3, "quantity": 2}, ...]}.
+# All parts are reserved in one transaction or none are. The part rows are locked
+# in partID order and checked first, then every part is decremented by one
+# conditional UPDATE (quantity >= wanted), so concurrent reservations can't oversell
+# and don't wait on each other beyond the part rows they share. The transaction is
+# never rolled back part way, so the Idempotency-Key claim made on the same
+# connection stays in place. Reserved units are added to the request's partUsed rows.
+# Returns 201 {"requestID", "parts": [{partID, quantity}]}, or 409 with
+# {"shortfalls": [{partID, requested, available}]} when any part is short.
+# Send an Idempotency-Key header to make retries safe.
+# -------------------------
+@requests_bp.post('/<int:request_id>/parts')
+@idempotency.idempotent
+def reserve_request_parts(request_id):
     try:
-        cursor.execute(
-            "SELECT historyID, oldStatus, newStatus, changedBy, changedAt, note FROM requestHistory WHERE requestID = %s ORDER BY changedAt DESC",
-            (request_id,)
-        )
-        history = rows_to_dicts(cursor, cursor.fetchall())
-    except Exception:
-        history = []
+        wanted = read_part_reservations(request.json or {})
+    except ValueError as e:
+        return make_response({'error': str(e)}, 400)
+    if len(wanted) > PARTS_MAX_ITEMS:
+        return make_response({'error': f'at most {PARTS_MAX_ITEMS} parts per reservation'}, 413)
+    if not schema.has_column('partUsed', 'quantity'):
+        return make_response({'error': 'partUsed.quantity missing (see database-files/migrations)'}, 503)
+
+    conn = db.get_db()
+    cursor = conn.cursor()
+    cursor.execute("SELECT requestID FROM maintenanceRequest WHERE requestID = %s", (request_id,))
+    if not cursor.fetchone():
+        return make_response({'error': 'Request not found'}, 404)
 
-    # assigned employees (pull from employeeAssigned join table)
+    wanted_sql = ' UNION ALL '.join(['SELECT %s AS partID, %s AS units'] * len(wanted))
+    params = tuple(value for item in wanted.items() for value in item)
     try:
+        # nothing has been written yet, so a shortfall needs no rollback (which
+        # would also drop the Idempotency-Key claim); the 409 is stored like any
+        # other response
+        shortfalls = part_shortfalls(cursor, wanted)
+        if shortfalls:
+            return make_response(jsonify({
+                'error': 'not enough stock for every part; nothing was reserved',
+                'shortfalls': shortfalls,
+            }), 409)
+        # the rows are locked, so every part matches; the condition keeps
+        # stock from going negative regardless
         cursor.execute(
-            """
-            SELECT e.employeeID, e.firstName, e.lastName, e.employeeType
-            FROM employee e
-            JOIN employeeAssigned ea ON e.employeeID = ea.employeeID
-            WHERE ea.requestID = %s
+            f"""
+            UPDATE part p
+            JOIN ({wanted_sql}) w ON w.partID = p.partID
+            SET p.quantity = p.quantity - w.units
+            WHERE p.quantity >= w.units
             """,
-            (request_id,)
+            params
         )
-        assigned = rows_to_dicts(cursor, cursor.fetchall())
-    except Exception:
-        assigned = []
+        if cursor.rowcount != len(wanted):
+            raise RuntimeError('locked part stock changed during reservation')
 
-    # parts used / planned
-    parts = []
-    try:
         cursor.execute(
-            """
-            SELECT p.partID, p.name, pu.quantity, p.cost
-            FROM partUsed pu
-            JOIN part p ON pu.partID = p.partID
-            WHERE pu.requestID = %s
+            f"""
+            INSERT INTO partUsed (partID, requestID, quantity)
+            VALUES {', '.join(['(%s, %s, %s)'] * len(wanted))} AS new
+            ON DUPLICATE KEY UPDATE quantity = partUsed.quantity + new.quantity
             """,
-            (request_id,)
+            tuple(value for part_id, units in wanted.items() for value in (part_id, request_id, units))
         )
-        parts = rows_to_dicts(cursor, cursor.fetchall())
+        touch_requests(cursor, [request_id])
+        stock = inventory.read_rows(cursor, wanted)
+        conn.commit()
     except Exception:
-        parts = []
+        conn.rollback()
+        raise
+
+    inventory.put(stock)
+    forecast.mark_stale()
+    bus.publish_requests(cursor, 'request.updated', [request_id])
+    return make_response(jsonify({
+        'requestID': request_id,
+        'parts': [{'partID': part_id, 'quantity': units} for part_id, units in wanted.items()],
+    }), 201)
+
+
+def touch_requests(cursor, request_ids):
+    """
+    Bump lastModified for requests whose related rows changed (e.g. assignments).
+    Column updates bump it on their own through ON UPDATE CURRENT_TIMESTAMP.
+    """
+    if not request_ids or not schema.has_column('maintenanceRequest', 'lastModified'):
+        return
+    cursor.execute(
+        f"UPDATE maintenanceRequest SET lastModified = CURRENT_TIMESTAMP(6) "
+        f"WHERE requestID IN ({in_placeholders(request_ids)})",
+        tuple(request_ids)
+    )
+
+
+# mapping of accepted external keys to DB column names (PUT and PATCH /batch)
+UPDATABLE_FIELDS = {
+    'issueType': 'issueType',
+    'description': 'issueDescription',
+    'buildingID': 'buildingID',
+    'aptNumber': 'aptNumber',
+    'priority': 'priority',
+    'status': 'statusCode',          # external status name -> requestStatus code
+    'dateCompleted': 'dateCompleted',
+    'scheduledDate': 'scheduledDate',
+    'issuePhotos': 'issuePhotos',
+    'completionNotes': 'completionNotes'
+}
+
+
+def build_set_clause(data):
+    """
+    Return the "col = %s" SET fragments and their values for the supplied keys.
+    Raises ValueError for an unknown status.
+    """
+    fields = []
+    values = []
+    for ext_key, db_col in UPDATABLE_FIELDS.items():
+        if ext_key in data:
+            fields.append(f"{db_col} = %s")
+            values.append(status_code(data[ext_key]) if ext_key == 'status' else data[ext_key])
+    return fields, values
 
-    # combine into response
-    detail = dict(request_row) if request_row else {}
-    detail['photos'] = photos
-    detail['notes'] = notes
-    detail['history'] = history
-    detail['assignedEmployees'] = assigned
-    detail['parts'] = parts
 
-    return make_response(jsonify(detail), 200)
+def status_entries(state, new_status, changed_by, note=None):
+    """requestHistory entries for the requests in state whose status actually changes."""
+    return [
+        (request_id, 'status', old_status, new_status, None, changed_by, note)
+        for request_id, (old_status, _) in state.items()
+        if old_status != new_status
+    ]
+
+
+def assignment_entries(state, employee_id, replace, changed_by):
+    """requestHistory entries for assigning employee_id (optionally replacing others) to the requests in state."""
+    try:
+        employee_id = int(employee_id)
+    except (TypeError, ValueError):
+        pass
+    entries = []
+    for request_id, (_, assigned) in state.items():
+        if replace:
+            entries.extend(
+                (request_id, 'unassigned', None, None, old_id, changed_by, None)
+                for old_id in sorted(assigned) if old_id != employee_id
+            )
+        if employee_id not in assigned:
+            entries.append((request_id, 'assigned', None, None, employee_id, changed_by, None))
+    return entries
 
 
 # -------------------------
 # PUT /requests/<id>
 # Update request fields (maps external keys to DB column names; supports assigning employee)
+# Optional user_id is recorded as changedBy in requestHistory.
 # -------------------------
 @requests_bp.put('/<int:request_id>')
 def update_request(request_id):
     data = request.json or {}
 
-    # mapping of accepted external keys to DB column names
-    mapping = {
-        'issueType': 'issueType',
-        'description': 'issueDescription',
-        'buildingID': 'buildingID',
-        'aptNumber': 'aptNumber',
-        'priority': 'priority',
-        'status': 'activeStatus',        # external 'status' -> DB 'activeStatus'
-        'dateCompleted': 'dateCompleted',
-        'scheduledDate': 'scheduledDate',
-        'issuePhotos': 'issuePhotos',
-        'completionNotes': 'completionNotes'
-    }
-
-    fields = []
-    values = []
-    for ext_key, db_col in mapping.items():
-        if ext_key in data:
-            fields.append(f"{db_col} = %s")
-            values.append(data[ext_key])
+    try:
+        fields, values = build_set_clause(data)
+    except ValueError as e:
+        return make_response({'error': str(e)}, 400)
 
     if not fields and 'assignedEmployeeID' not in data:
         return make_response({'error': 'No updatable fields supplied'}, 400)
+    emp_id = None
+    if 'assignedEmployeeID' in data:
+        try:
+            emp_id = int(data['assignedEmployeeID'])
+        except (TypeError, ValueError):
+            return make_response({'error': 'assignedEmployeeID must be an integer'}, 400)
 
+    changed_by = data.get('user_id')
+    entries = []
+    state = {}
+    assigned = None
     cursor = db.get_db().cursor()
+    if emp_id is not None:
+        # INSERT IGNORE would turn an unknown employee's FK error into a warning
+        cursor.execute("SELECT employeeID FROM employee WHERE employeeID = %s", (emp_id,))
+        if not cursor.fetchone():
+            return make_response({'error': f'Employee {emp_id} not found'}, 400)
+    if {'status', 'dateCompleted', 'assignedEmployeeID'} & data.keys():
+        # the old status and assignments (row locked until commit) so history
+        # and the workload counters see the transition
+        state = load_request_state(cursor, [request_id], assignments=True)
     if fields:
+        if 'status' in data:
+            entries.extend(status_entries(state, status_code(data['status']), changed_by))
         values.append(request_id)
         cursor.execute(
             f"UPDATE maintenanceRequest SET {', '.join(fields)} WHERE requestID = %s",
@@ -333,20 +1065,146 @@ def update_request(request_id):
         )
 
     # handle assignedEmployeeID separately using employeeAssigned join table
-    if 'assignedEmployeeID' in data:
-        emp_id = data.get('assignedEmployeeID')
+    if emp_id is not None:
         try:
-            # optionally remove duplicates then insert
-            cursor.execute("DELETE FROM employeeAssigned WHERE requestID = %s AND employeeID = %s", (request_id, emp_id))
-            cursor.execute("INSERT INTO employeeAssigned (employeeID, requestID) VALUES (%s, %s)", (emp_id, request_id))
+            # INSERT IGNORE skips an existing (employee, request) pair in one statement
+            cursor.execute("INSERT IGNORE INTO employeeAssigned (employeeID, requestID) VALUES (%s, %s)", (emp_id, request_id))
+            if cursor.rowcount:
+                touch_requests(cursor, [request_id])
+                entries.append((request_id, 'assigned', None, None, emp_id, changed_by, None))
+                assigned = emp_id
         except Exception:
             # If schema differs, ignore but log
             current_app.logger.exception("Could not update employeeAssigned for request %s", request_id)
 
     db.get_db().commit()
+    history.record_many(entries)
+    workload.apply(
+        state,
+        new_status=status_code(data['status']) if 'status' in data else None,
+        assigned=assigned,
+        completed_on=data.get('dateCompleted'),
+    )
+    if 'dateCompleted' in data:
+        # completing a request is when its parts count as used
+        forecast.mark_stale()
+    bus.publish_requests(cursor, 'request.updated', [request_id])
     return make_response({'message': 'Request updated'}, 200)
 
 
+# -------------------------
+# PATCH /requests/batch
+# Apply the same changes to many requests in one transaction. JSON body:
+#   requestIDs          list of request ids (required)
+#   any PUT field       e.g. status, priority, dateCompleted (applied to every id)
+#   assignedEmployeeID  assign this employee to every request (400 if unknown)
+#   replaceAssignments  true -> remove existing assignments first (reassign)
+#   user_id             recorded as changedBy in requestHistory
+# Returns counts of rows changed (updated, unassigned, assigned).
+# -------------------------
+@requests_bp.patch('/batch')
+def update_requests_batch():
+    data = request.json or {}
+
+    request_ids = data.get('requestIDs')
+    if not isinstance(request_ids, list) or not request_ids:
+        return make_response({'error': 'requestIDs must be a non-empty list'}, 400)
+    try:
+        request_ids = sorted({int(rid) for rid in request_ids})
+    except (TypeError, ValueError):
+        return make_response({'error': 'requestIDs must be integers'}, 400)
+    if len(request_ids) > BATCH_MAX_ITEMS:
+        return make_response({'error': f'at most {BATCH_MAX_ITEMS} requests per batch'}, 413)
+
+    try:
+        fields, values = build_set_clause(data)
+    except ValueError as e:
+        return make_response({'error': str(e)}, 400)
+    assign = 'assignedEmployeeID' in data
+    if not fields and not assign:
+        return make_response({'error': 'No updatable fields supplied'}, 400)
+    employee_id = None
+    if assign:
+        try:
+            employee_id = int(data['assignedEmployeeID'])
+        except (TypeError, ValueError):
+            return make_response({'error': 'assignedEmployeeID must be an integer'}, 400)
+
+    in_sql = ', '.join(['%s'] * len(request_ids))
+    counts = {'requested': len(request_ids), 'updated': 0, 'unassigned': 0, 'assigned': 0}
+
+    changed_by = data.get('user_id')
+    entries = []
+    state = {}
+    conn = db.get_db()
+    cursor = conn.cursor()
+    if assign:
+        # INSERT IGNORE would turn an unknown employee's FK error into a warning
+        cursor.execute("SELECT employeeID FROM employee WHERE employeeID = %s", (employee_id,))
+        if not cursor.fetchone():
+            return make_response({'error': f'Employee {employee_id} not found'}, 400)
+    try:
+        if 'status' in data or 'dateCompleted' in data or assign:
+            # one locking read of the current status/assignments, so history and
+            # the workload counters see only the requests that actually change
+            state = load_request_state(cursor, request_ids, assignments=True)
+            if 'status' in data:
+                entries.extend(status_entries(state, status_code(data['status']), changed_by))
+            if assign:
+                entries.extend(assignment_entries(
+                    state, employee_id, data.get('replaceAssignments'), changed_by
+                ))
+
+        if fields:
+            cursor.execute(
+                f"UPDATE maintenanceRequest SET {', '.join(fields)} WHERE requestID IN ({in_sql})",
+                tuple(values) + tuple(request_ids)
+            )
+            counts['updated'] = cursor.rowcount
+
+        if assign:
+            if data.get('replaceAssignments'):
+                cursor.execute(
+                    f"DELETE FROM employeeAssigned WHERE requestID IN ({in_sql})",
+                    tuple(request_ids)
+                )
+                counts['unassigned'] = cursor.rowcount
+            # one set-based insert, limited to requests that exist
+            cursor.execute(
+                f"""
+                INSERT IGNORE INTO employeeAssigned (employeeID, requestID)
+                SELECT %s, r.requestID
+                FROM maintenanceRequest r
+                WHERE r.requestID IN ({in_sql})
+                """,
+                (employee_id,) + tuple(request_ids)
+            )
+            counts['assigned'] = cursor.rowcount
+            if counts['unassigned'] or counts['assigned']:
+                touch_requests(cursor, request_ids)
+
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        current_app.logger.exception("Failed to batch update requests")
+        return make_response({'error': str(e)}, 500)
+
+    history.record_many(entries)
+    workload.apply(
+        state,
+        new_status=status_code(data['status']) if 'status' in data else None,
+        # only an employee the INSERT actually added (replacing still removes the others)
+        assigned=employee_id if counts['assigned'] else None,
+        replace=assign and bool(data.get('replaceAssignments')),
+        completed_on=data.get('dateCompleted'),
+    )
+    if 'dateCompleted' in data:
+        # completing a request is when its parts count as used
+        forecast.mark_stale()
+    bus.publish_requests(cursor, 'request.updated', request_ids)
+    return make_response(jsonify(counts), 200)
+
+
 # -------------------------
 # DELETE /requests/<id>
 # Soft-delete / cancel a request (mark canceled or archived)
@@ -358,18 +1216,12 @@ def cancel_request(request_id):
     user_id = data.get('user_id')
 
     cursor = db.get_db().cursor()
-    # set activeStatus to 'canceled' (matches schema)
-    cursor.execute("UPDATE maintenanceRequest SET activeStatus = %s WHERE requestID = %s", ('canceled', request_id))
-
-    # try to add a row to requestHistory if table exists
-    try:
-        cursor.execute(
-            "INSERT INTO requestHistory (requestID, oldStatus, newStatus, changedBy, changedAt, note) VALUES (%s, %s, %s, %s, NOW(), %s)",
-            (request_id, 'any', 'canceled', user_id, reason)
-        )
-    except Exception:
-        # non-fatal if history table doesn't exist or columns differ
-        current_app.logger.debug("requestHistory insert failed (table may be missing or schema differs)")
+    state = load_request_state(cursor, [request_id], assignments=True)
+    cursor.execute("UPDATE maintenanceRequest SET statusCode = %s WHERE requestID = %s", (CANCELED, request_id))
 
     db.get_db().commit()
+    # the reason is kept as the history note
+    history.record_many(status_entries(state, CANCELED, user_id, reason))
+    workload.apply(state, new_status=CANCELED)
+    bus.publish_requests(cursor, 'request.canceled', [request_id])
     return make_response({'message': 'Request canceled'}, 200)
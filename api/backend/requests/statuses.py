@@ -0,0 +1,61 @@
+#------------------------------------------------------------
+# Request status codes.
+#
+# maintenanceRequest.statusCode is a small integer from the
+# requestStatus lookup table; the API still takes and returns the
+# names. Codes are numbered in technician-board order and every
+# active status is below COMPLETED, so "active" is the index range
+# statusCode < COMPLETED. Keep in sync with the requestStatus rows
+# in database-files/huskyFixDDL.sql.
+#------------------------------------------------------------
+IN_PROGRESS = 1
+EN_ROUTE = 2
+BLOCKED = 3
+OPEN = 4
+COMPLETED = 5
+CANCELED = 6
+
+STATUS_NAMES = {
+    IN_PROGRESS: 'In Progress',
+    EN_ROUTE: 'En Route',
+    BLOCKED: 'Blocked',
+    OPEN: 'Open',
+    COMPLETED: 'Completed',
+    CANCELED: 'Canceled',
+}
+
+# lower-cased spellings seen from the UI and older rows
+_CODES = {name.lower(): code for code, name in STATUS_NAMES.items()}
+_CODES.update({
+    'enroute': EN_ROUTE,
+    'complete': COMPLETED,
+    'closed': COMPLETED,
+    'cancelled': CANCELED,
+})
+
+
+def status_code(value):
+    """
+    Code for a status name (any case, '-'/'_' for spaces) or an existing code.
+    Raises ValueError for anything else.
+    """
+    if isinstance(value, int) and not isinstance(value, bool):
+        code = value
+    else:
+        text = ' '.join(str(value or '').lower().replace('-', ' ').replace('_', ' ').split())
+        code = int(text) if text.isdigit() else _CODES.get(text)
+    if code not in STATUS_NAMES:
+        raise ValueError(f"unknown status '{value}'; use one of {', '.join(STATUS_NAMES.values())}")
+    return code
+
+
+def status_name(code):
+    return STATUS_NAMES.get(code)
+
+
+def add_status_names(rows):
+    """Set activeStatus (the name) on rows selected with statusCode."""
+    for row in rows:
+        if 'statusCode' in row:
+            row['activeStatus'] = status_name(row['statusCode'])
+    return rows
@@ -0,0 +1,240 @@
+#------------------------------------------------------------
+# Per-employee job counters behind GET /employee/workload.
+#
+# For every employee the worker keeps the requests assigned to them
+# that are still active or were completed this week, plus running
+# counts per bucket (open, inProgress, enRoute, blocked,
+# completedThisWeek). The request routes pass the state they locked
+# before a write (load_request_state) and what they changed to
+# apply() after commit, so reading the counts never aggregates
+# maintenanceRequest.
+#
+# A background job re-reads the assignments every
+# WORKLOAD_RECONCILE_INTERVAL seconds. This picks up writes made
+# through other workers or directly in MySQL, and it is the first
+# load. Changes applied while it reads are replayed onto its result,
+# so it can't roll back a newer update. Applying a change is
+# idempotent (it sets where a request is, rather than adding one),
+# so a replay that repeats what the read already saw is harmless.
+#------------------------------------------------------------
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from datetime import date, timedelta
+
+from backend.db_connection import db, schema
+from backend.requests.statuses import BLOCKED, COMPLETED, EN_ROUTE, IN_PROGRESS, OPEN
+
+
+# status code -> counter name for the active statuses
+ACTIVE_BUCKETS = {OPEN: 'open', IN_PROGRESS: 'inProgress', EN_ROUTE: 'enRoute', BLOCKED: 'blocked'}
+COUNTER_NAMES = ('open', 'inProgress', 'enRoute', 'blocked', 'completedThisWeek')
+
+
+def week_start(day=None):
+    """Monday of the week containing day (default today)."""
+    day = day or date.today()
+    return day - timedelta(days=day.weekday())
+
+
+def parse_day(value):
+    """A date from a date/datetime or an ISO string, or None."""
+    if value is None or isinstance(value, date):
+        return value.date() if hasattr(value, 'date') else value
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+class WorkloadCounters:
+
+    def __init__(self, db, schema, reconcile_interval=60):
+        self.db = db
+        self.schema = schema
+        self.reconcile_interval = reconcile_interval
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        # one reconciliation at a time
+        self._reconcile_lock = threading.Lock()
+        self._jobs = None       # employeeID -> {requestID: (statusCode, completed on)}; None until loaded
+        self._counts = {}       # employeeID -> Counter of COUNTER_NAMES
+        self._week = None       # week_start() the counts were made for
+        self._journal = None    # changes applied while a reconciliation is reading
+        self._thread = None
+        self._pid = os.getpid()
+
+    def init_app(self, app):
+        app.config.setdefault('WORKLOAD_RECONCILE_INTERVAL', 60)
+        self.reconcile_interval = float(app.config['WORKLOAD_RECONCILE_INTERVAL'])
+        self.logger = app.logger
+
+    # -------------------------
+    # reads
+    # -------------------------
+    def counts(self):
+        """
+        {employeeID: {counter: n}} for employees with any counted job, or None
+        if the counters have never been loaded and MySQL can't be read.
+        """
+        self._start_reconciler()
+        with self._lock:
+            loaded = self._jobs is not None
+        if not loaded and not self.reconcile():
+            return None
+        with self._lock:
+            if self._week != week_start():
+                # a new week: last week's completions no longer count
+                self._recount()
+            return {
+                employee_id: {name: counter[name] for name in COUNTER_NAMES}
+                for employee_id, counter in self._counts.items() if any(counter.values())
+            }
+
+    # -------------------------
+    # incremental updates
+    # -------------------------
+    def apply(self, state, new_status=None, assigned=None, replace=False, completed_on=None):
+        """
+        Record a committed change to the requests in state, the
+        load_request_state(..., assignments=True) result read before it:
+        a new status, an employee assigned (replacing the others if replace)
+        and/or a completion date.
+        """
+        if assigned is not None:
+            try:
+                assigned = int(assigned)
+            except (TypeError, ValueError):
+                assigned = None
+        completed_on = parse_day(completed_on)
+        changes = []
+        for request_id, (old_status, employees) in state.items():
+            status = old_status if new_status is None else new_status
+            kept = set() if replace else set(employees)
+            if assigned is not None:
+                kept.add(assigned)
+            changes.extend((employee_id, request_id, None, None) for employee_id in employees - kept)
+            changes.extend((employee_id, request_id, status, completed_on) for employee_id in kept)
+        if not changes:
+            return
+        with self._lock:
+            if self._journal is not None:
+                self._journal.extend(changes)
+            if self._jobs is not None:
+                self._apply_changes(changes)
+
+    # -------------------------
+    # reconciliation
+    # -------------------------
+    def reconcile(self):
+        """Rebuild the counters from MySQL; returns False if the read failed."""
+        with self._reconcile_lock:
+            with self._lock:
+                self._journal = []
+            monday = week_start()
+            completed = (
+                "COALESCE(m.dateCompleted, DATE(m.lastModified))"
+                if self.schema.has_column('maintenanceRequest', 'lastModified') else "m.dateCompleted"
+            )
+            try:
+                conn = self.db.pool.acquire()
+                try:
+                    cursor = conn.cursor()
+                    # active statuses are the codes below COMPLETED (idx_mr_status_requested)
+                    cursor.execute(
+                        f"""
+                        SELECT ea.employeeID, ea.requestID, m.statusCode, {completed} AS completedOn
+                        FROM maintenanceRequest m
+                        JOIN employeeAssigned ea ON ea.requestID = m.requestID
+                        WHERE m.statusCode < %s OR (m.statusCode = %s AND {completed} >= %s)
+                        """,
+                        (COMPLETED, COMPLETED, monday)
+                    )
+                    rows = cursor.fetchall()
+                finally:
+                    self.db.pool.release(conn)
+            except Exception:
+                self.logger.exception("workload reconciliation failed")
+                with self._lock:
+                    self._journal = None
+                return False
+
+            jobs = {}
+            for row in rows:
+                jobs.setdefault(row['employeeID'], {})[row['requestID']] = (
+                    row['statusCode'], parse_day(row['completedOn'])
+                )
+            with self._lock:
+                journal, self._journal = self._journal, None
+                self._jobs = jobs
+                self._recount()
+                self._apply_changes(journal)
+            return True
+
+    def _start_reconciler(self):
+        # a forked worker starts its own thread
+        if self.reconcile_interval <= 0:
+            return
+        with self._lock:
+            pid = os.getpid()
+            if self._thread is not None and self._pid == pid:
+                return
+            self._pid = pid
+            self._thread = threading.Thread(target=self._run, name='workload-reconciler', daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.reconcile_interval)
+            self.reconcile()
+
+    # -------------------------
+    # internals (self._lock held)
+    # -------------------------
+    def _apply_changes(self, changes):
+        monday = self._week or week_start()
+        for employee_id, request_id, status, completed_on in changes:
+            jobs = self._jobs.setdefault(employee_id, {})
+            old = jobs.pop(request_id, None)
+            new = None
+            if status in ACTIVE_BUCKETS:
+                new = (status, None)
+            elif status == COMPLETED:
+                if completed_on is None and old is not None and old[0] == COMPLETED:
+                    completed_on = old[1]
+                new = (COMPLETED, completed_on or date.today())
+                if new[1] < monday:
+                    new = None
+            if new is not None:
+                jobs[request_id] = new
+            counter = self._counts.setdefault(employee_id, Counter())
+            if self._bucket(old, monday):
+                counter[self._bucket(old, monday)] -= 1
+            if self._bucket(new, monday):
+                counter[self._bucket(new, monday)] += 1
+
+    def _recount(self):
+        self._week = week_start()
+        self._counts = {}
+        for employee_id, jobs in self._jobs.items():
+            for request_id, job in list(jobs.items()):
+                bucket = self._bucket(job, self._week)
+                if bucket is None:
+                    del jobs[request_id]
+                else:
+                    self._counts.setdefault(employee_id, Counter())[bucket] += 1
+
+    @staticmethod
+    def _bucket(job, monday):
+        if job is None:
+            return None
+        status, completed_on = job
+        if status == COMPLETED:
+            return 'completedThisWeek' if completed_on and completed_on >= monday else None
+        return ACTIVE_BUCKETS.get(status)
+
+
+# shared by every blueprint in this worker
+workload = WorkloadCounters(db, schema)
@@ -4,9 +4,13 @@ import os
 import logging
 from logging.handlers import RotatingFileHandler
 
-from backend.employee import employee_bp
+from backend.employee import directory, employee_bp, forecast, inventory
 from backend.requests import requests_bp
-from backend.db_connection import db
+from backend.requests.events import bus
+from backend.requests.history import history
+from backend.requests.workload import workload
+from backend.db_connection import db, ids, idempotency, schema
+from backend.photos import photos, photos_bp
 from backend.simple.simple_routes import simple_routes
 from backend.reports.report_routes import report_bp
 from backend.buildings import building_bp
@@ -43,9 +47,80 @@ def create_app():
     app.config["MYSQL_DATABASE_PORT"] = int(os.getenv("DB_PORT").strip())
     app.config["MYSQL_DATABASE_DB"] = os.getenv("DB_NAME", "husky-fix").strip()  # Change this to your DB name
 
+    # connection pool sizing (see backend/db_connection/pool.py)
+    app.config["MYSQL_POOL_MIN_SIZE"] = int(os.getenv("DB_POOL_MIN_SIZE", "2"))
+    app.config["MYSQL_POOL_MAX_SIZE"] = int(os.getenv("DB_POOL_MAX_SIZE", "12"))
+    app.config["MYSQL_POOL_IDLE_TIMEOUT"] = float(os.getenv("DB_POOL_IDLE_TIMEOUT", "300"))
+    app.config["MYSQL_POOL_PING_AFTER"] = float(os.getenv("DB_POOL_PING_AFTER", "5"))
+    app.config["MYSQL_POOL_TIMEOUT"] = float(os.getenv("DB_POOL_TIMEOUT", "10"))
+
+    # how many primary keys each worker reserves at once (see db_connection/ids.py)
+    app.config["ID_BLOCK_SIZE"] = int(os.getenv("DB_ID_BLOCK_SIZE", "20"))
+
+    # GET /requests/stream: per-subscriber buffer, and how often a worker with
+    # subscribers polls for changes made through other workers (0 = off)
+    app.config["EVENTS_BUFFER_SIZE"] = int(os.getenv("EVENTS_BUFFER_SIZE", "100"))
+    app.config["EVENTS_POLL_INTERVAL"] = float(os.getenv("EVENTS_POLL_INTERVAL", "1"))
+    # open streams per worker: each holds a thread under gthread, so the
+    # default leaves half of API_THREADS for other routes; gevent workers
+    # hold only a greenlet per stream
+    if os.getenv("API_WORKER_CLASS", "gthread").strip() == "gevent":
+        default_streams = 1000
+    else:
+        default_streams = max(int(os.getenv("API_THREADS", "4")) // 2, 1)
+    app.config["EVENTS_MAX_STREAMS"] = int(os.getenv("EVENTS_MAX_STREAMS", str(default_streams)))
+
+    # requestHistory writes are buffered and flushed in batches every
+    # HISTORY_FLUSH_INTERVAL seconds; HISTORY_SYNC=true writes on every change
+    app.config["HISTORY_FLUSH_INTERVAL"] = float(os.getenv("HISTORY_FLUSH_INTERVAL", "1"))
+    app.config["HISTORY_BATCH_SIZE"] = int(os.getenv("HISTORY_BATCH_SIZE", "500"))
+    app.config["HISTORY_SYNC"] = os.getenv("HISTORY_SYNC", "false").strip().lower() == "true"
+
+    # uploaded photos: where they're stored, size limits, and the
+    # thumbnail process pool (0 workers = no thumbnails)
+    app.config["PHOTO_DIR"] = os.getenv("PHOTO_DIR", "uploads/photos")
+    app.config["PHOTO_MAX_BYTES"] = int(os.getenv("PHOTO_MAX_BYTES", str(20 * 1024 * 1024)))
+    app.config["PHOTO_MAX_FILES"] = int(os.getenv("PHOTO_MAX_FILES", "10"))
+    app.config["PHOTO_THUMB_SIZE"] = int(os.getenv("PHOTO_THUMB_SIZE", "320"))
+    app.config["PHOTO_THUMB_WORKERS"] = int(os.getenv("PHOTO_THUMB_WORKERS", "2"))
+
+    # Idempotency-Key: how long keys are remembered, and how many
+    # responses each worker keeps in memory
+    app.config["IDEMPOTENCY_TTL"] = int(os.getenv("IDEMPOTENCY_TTL", str(24 * 3600)))
+    app.config["IDEMPOTENCY_CACHE_SIZE"] = int(os.getenv("IDEMPOTENCY_CACHE_SIZE", "1000"))
+
+    # GET /employee/parts is served from memory; changes made through other
+    # workers show up after at most PARTS_CACHE_TTL seconds
+    app.config["PARTS_CACHE_TTL"] = float(os.getenv("PARTS_CACHE_TTL", "10"))
+
+    # GET /employee/directory is served from memory; employee changes made
+    # outside this worker show up after at most EMPLOYEE_DIRECTORY_TTL seconds
+    app.config["EMPLOYEE_DIRECTORY_TTL"] = float(os.getenv("EMPLOYEE_DIRECTORY_TTL", "300"))
+
+    # GET /employee/workload counters are rebuilt from MySQL this often
+    # (picks up changes made through other workers); 0 = only on first use
+    app.config["WORKLOAD_RECONCILE_INTERVAL"] = float(os.getenv("WORKLOAD_RECONCILE_INTERVAL", "60"))
+
+    # GET /employee/parts/reorder: days of usage to learn from, supplier lead
+    # time, service level for the safety stock, and how often to check for new usage
+    app.config["PARTS_FORECAST_WINDOW"] = int(os.getenv("PARTS_FORECAST_WINDOW", "90"))
+    app.config["PARTS_LEAD_TIME_DAYS"] = float(os.getenv("PARTS_LEAD_TIME_DAYS", "7"))
+    app.config["PARTS_SERVICE_LEVEL"] = float(os.getenv("PARTS_SERVICE_LEVEL", "0.95"))
+    app.config["PARTS_FORECAST_REFRESH"] = float(os.getenv("PARTS_FORECAST_REFRESH", "30"))
+
     # Initialize the database object with the settings above.
     app.logger.info("current_app(): starting the database connection")
     db.init_app(app)
+    ids.init_app(app)
+    schema.init_app(app)
+    idempotency.init_app(app)
+    bus.init_app(app)
+    history.init_app(app)
+    photos.init_app(app)
+    inventory.init_app(app)
+    forecast.init_app(app)
+    directory.init_app(app)
+    workload.init_app(app)
 
     # Register the routes from each Blueprint with the app object
     # and give a url prefix to each
@@ -55,6 +130,7 @@ def create_app():
     app.register_blueprint(requests_bp)
     app.register_blueprint(report_bp, url_prefix="/report")
     app.register_blueprint(building_bp)
+    app.register_blueprint(photos_bp)
 
 
     # Don't forget to return the app object
@@ -76,6 +76,17 @@ def getData():
     return response
 
 
+# ------------------------------------------------------------
+# /pool_stats reports how the DB connection pool is being used
+# (open/in-use/idle connections and checkout wait times)
+@simple_routes.route("/pool_stats", methods=["GET"])
+def get_pool_stats():
+    current_app.logger.info("GET /pool_stats handler")
+    response = make_response(jsonify(db.stats()))
+    response.status_code = 200
+    return response
+
+
 @simple_routes.route("/prediction/<var_01>/<var_02>", methods=["GET"])
 def get_prediction(var_01, var_02):
     current_app.logger.info("GET /prediction handler")
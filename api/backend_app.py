@@ -1,17 +1,43 @@
 ###
 # Main application interface
 ###
+import os
+import sys
 
-# import the create app function 
+from dotenv import load_dotenv
+
+# import the create app function
 # that lives in src/__init__.py
 from backend.rest_entry import create_app
 
-# create the app object
-app = create_app()
+
+def serve():
+    # Production mode: hand the process over to gunicorn, which forks
+    # workers that each build their own app with create_app().
+    # Settings live in gunicorn.conf.py next to this file.
+    here = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(here)
+    os.execvp("gunicorn", [
+        "gunicorn",
+        "--config", os.path.join(here, "gunicorn.conf.py"),
+        "backend.rest_entry:create_app()",
+    ])
+
+
+load_dotenv()
+if __name__ == '__main__' and (
+        sys.argv[1:2] == ['serve'] or os.getenv('API_MODE', '').lower() == 'serve'):
+    serve()
+
+# create the app object (not in the photo thumbnail processes, which
+# are spawned and re-import this file as __mp_main__)
+if __name__ != '__mp_main__':
+    app = create_app()
 
 if __name__ == '__main__':
-    # we want to run in debug mode (for hot reloading) 
-    # this app will be bound to port 4000. 
-    # Take a look at the docker-compose.yml to see 
-    # what port this might be mapped to... 
+    # we want to run in debug mode (for hot reloading)
+    # this app will be bound to port 4000.
+    # Take a look at the docker-compose.yml to see
+    # what port this might be mapped to...
+    # Use `python backend_app.py serve` (or API_MODE=serve) for production.
     app.run(debug = True, host = '0.0.0.0', port = 4000)
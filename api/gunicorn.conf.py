@@ -0,0 +1,69 @@
+###
+# Production server settings (gunicorn)
+#
+# Used by `python backend_app.py serve`. Every value can be
+# overridden from the environment (e.g. in api/.env).
+###
+import multiprocessing
+import os
+
+
+def _env_int(name, default):
+    value = os.getenv(name)
+    return int(value) if value and value.strip() else default
+
+
+bind = os.getenv("API_BIND", "0.0.0.0:4000")
+
+# pre-fork workers, each running a pool of threads.
+# Keep DB_POOL_MAX_SIZE >= 2 * API_THREADS + 3 so threads don't queue for
+# connections: a request can hold its own connection while taking a second
+# one (ID blocks, NDJSON streams), and the request stream poller, the
+# requestHistory flusher and the workload reconciler each use one more.
+# Every open GET /requests/stream holds a thread, so gthread workers serve
+# at most EVENTS_MAX_STREAMS streams each (default API_THREADS // 2) and turn
+# the rest away with 503. For many idle dashboards set API_WORKER_CLASS=gevent,
+# where a stream holds only a greenlet.
+worker_class = os.getenv("API_WORKER_CLASS", "gthread")
+workers = _env_int("API_WORKERS", multiprocessing.cpu_count() * 2 + 1)
+threads = _env_int("API_THREADS", 4)
+
+# recycle each worker after a number of requests (jitter avoids
+# every worker restarting at once); in-flight requests get
+# graceful_timeout seconds to finish.
+max_requests = _env_int("API_MAX_REQUESTS", 1000)
+max_requests_jitter = _env_int("API_MAX_REQUESTS_JITTER", 100)
+graceful_timeout = _env_int("API_GRACEFUL_TIMEOUT", 30)
+timeout = _env_int("API_TIMEOUT", 60)
+keepalive = _env_int("API_KEEPALIVE", 5)
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("API_LOG_LEVEL", "info")
+
+
+def post_worker_init(worker):
+    # runs in the worker after fork, once the app is loaded: open min_size
+    # connections (the pool drops anything inherited from the master itself)
+    from backend.db_connection import db
+
+    if db.pool is None:
+        return
+    try:
+        opened = db.pool.warm_up()
+        worker.log.info("DB pool warmed up with %s connection(s)", opened)
+    except Exception:
+        # the pool will connect lazily on the first request instead
+        worker.log.exception("DB pool warm-up failed")
+
+
+def worker_exit(server, worker):
+    from backend.db_connection import db
+    from backend.photos import photos
+    from backend.requests.history import history
+
+    # write buffered requestHistory entries before the pool closes
+    history.flush()
+    photos.shutdown()
+    if db.pool is not None:
+        db.pool.close_all()
@@ -24,11 +24,19 @@ def load_requests():
 
 
 def load_employees():
-    """Load employees list for assignment"""
+    """Load employees list for assignment (revalidated with its ETag, so reruns don't download it again)"""
     try:
-        res = requests.get(f"{API_BASE}/employee")
+        cached = st.session_state.get("employee_directory")
+        headers = {"If-None-Match": cached["etag"]} if cached else None
+        res = requests.get(f"{API_BASE}/employee/directory", params={"fields": "employeeID,firstName,lastName"},
+                           headers=headers)
+        if res.status_code == 304 and cached:
+            return cached["employees"]
         if res.status_code == 200:
-            return res.json()
+            employees = res.json()
+            if res.headers.get("ETag"):
+                st.session_state["employee_directory"] = {"etag": res.headers["ETag"], "employees": employees}
+            return employees
         else:
             st.error("Failed to load employees.")
             return []
@@ -18,9 +18,18 @@ default_emp = st.session_state.get("employee_id", 7)
 # Try to fetch employee list from API (non-fatal). If not available, fall back to small list.
 employees = None
 try:
-    resp = requests.get(f"{API_BASE}/employee", timeout=3)
-    if resp.status_code == 200:
+    # the directory rarely changes: revalidate the cached copy with its ETag
+    cached = st.session_state.get("employee_directory")
+    headers = {"If-None-Match": cached["etag"]} if cached else None
+    resp = requests.get(f"{API_BASE}/employee/directory", params={"fields": "employeeID,firstName,lastName"},
+                        headers=headers, timeout=3)
+    if resp.status_code == 304 and cached:
+        employees = cached["employees"]
+    elif resp.status_code == 200:
         employees = resp.json()
+        if resp.headers.get("ETag"):
+            st.session_state["employee_directory"] = {"etag": resp.headers["ETag"], "employees": employees}
+    if employees is not None:
         # if the API returns objects, map to display strings
         if isinstance(employees, list) and employees and isinstance(employees[0], dict):
             emp_options = {str(e.get("employeeID")): f"{e.get('firstName','')} {e.get('lastName','')} (#{e.get('employeeID')})" for e in employees}
@@ -87,7 +96,10 @@ def api_get(path, params=None):
         return []
 
 # Build params to ask the backend to filter by assigned employee
-params = {"limit": 500, "employee_id": employee_id}
+# expand embeds assigned employees for the whole page (no per-job detail calls);
+# sort=dispatch returns jobs in board order: status (in progress, en route,
+# blocked, open, completed), then higher priority, then oldest request first
+params = {"limit": 500, "employee_id": employee_id, "expand": "assignedEmployees", "sort": "dispatch"}
 
 # Only include date range params if the user requested a specific date (i.e., all_dates is False)
 if not all_dates and date_filter is not None:
@@ -95,64 +107,15 @@ if not all_dates and date_filter is not None:
     params["start_date"] = date_filter.isoformat()
     params["end_date"] = (date_filter + timedelta(days=1)).isoformat()
 
-# Add server-side status filter if user selected one
+# Server-side status and priority filters
 if status_filter != "All":
     # normalize small variations: backend compares exact value, so we send the selected label
     params["status"] = status_filter
-
-# Get jobs from API (backend will check employeeAssigned via employee_id param)
-jobs = api_get("/requests", params=params)
-
-# Helper ranking functions (status order & priority)
-def status_rank(status):
-    s = (status or "").lower()
-    if s in ("in progress", "in-progress"):
-        return 0
-    if s in ("en route", "enroute", "en route"):
-        return 1
-    if s == "blocked":
-        return 2
-    if s == "open":
-        return 3
-    if s in ("completed", "closed", "complete"):
-        return 4
-    return 5
-
-def priority_rank(p):
-    if p is None:
-        return 2
-    p_low = str(p).lower()
-    if p_low in ("high", "5", "4"):
-        return 0
-    if p_low in ("medium", "3"):
-        return 1
-    return 2
-
-# Client-side priority filter (if user asked)
 if priority_filter != "All":
-    pf = priority_filter.lower()
-    jobs = [j for j in (jobs or []) if pf in str(j.get("priority", "")).lower() or pf in (str(j.get("priority", "")) or "").lower()]
-
-# If the backend didn't apply status (because it didn't accept it), attempt client-side filter too
-if status_filter != "All":
-    sf = status_filter.lower()
-    jobs = [j for j in (jobs or []) if sf == (j.get("activeStatus") or "").lower()]
+    params["priority"] = int(priority_filter)
 
-# Final sort: status (desired order), then higher priority, then most recent dateRequested first
-def date_key(d):
-    # return string (ISO) or empty so sorting is stable
-    return d or ""
-
-jobs_sorted = sorted(
-    jobs or [],
-    key=lambda j: (
-        status_rank(j.get("activeStatus")),
-        priority_rank(j.get("priority")),
-    ),
-)
-
-# To make dateRequested descending inside groups, we'll stable-sort again by dateRequested desc
-jobs_sorted = sorted(jobs_sorted, key=lambda j: date_key(j.get("dateRequested")), reverse=True)
+# Get jobs from API (backend will check employeeAssigned via employee_id param)
+jobs_sorted = api_get("/requests", params=params) or []
 
 st.write(f"Showing {len(jobs_sorted)} jobs assigned to employee {employee_id}")
 
@@ -170,7 +133,10 @@ for job in jobs_sorted:
             st.markdown(f"**Description:** {job.get('issueDescription') or '—'}")
             st.markdown(f"**Requested:** {job.get('dateRequested')}")
             st.markdown(f"**Student ID:** {job.get('studentRequestingID')}")
-            # show assigned employees if backend included them in detail (it doesn't in list endpoint by default)
+            assigned = job.get("assignedEmployees") or []
+            if assigned:
+                names = ", ".join(f"{e.get('firstName', '')} {e.get('lastName', '')}".strip() for e in assigned)
+                st.markdown(f"**Assigned:** {names}")
         with c2:
             if st.button("Open Job Detail", key=f"open_{job.get('requestID')}"):
                 # store selected id and go to detail page
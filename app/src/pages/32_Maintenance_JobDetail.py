@@ -34,6 +34,21 @@ def api_put(path, payload):
         st.error(f"API PUT failed: {e}")
         return None
 
+def load_photo(path):
+    """
+    Photo bytes from the API. /photos/ URLs never change content (they are named
+    by hash and served as immutable), so they are kept for the session and not
+    downloaded again on every rerun.
+    """
+    cache = st.session_state.setdefault("photo_cache", {})
+    if path in cache:
+        return cache[path]
+    resp = requests.get(f"{API_BASE}{path}", timeout=6)
+    resp.raise_for_status()
+    if "immutable" in resp.headers.get("Cache-Control", ""):
+        cache[path] = resp.content
+    return resp.content
+
 # Load request detail
 detail = api_get(f"/requests/{request_id}")
 if not detail:
@@ -56,9 +71,15 @@ with col2:
     photos = detail.get('photos', [])
     if photos:
         for p in photos:
-            # expecting either filePath or embedded
-            file_path = p.get("filePath") or p.get("embedded")
-            if file_path:
+            # uploaded photos have an API path (/photos/<hash>); older rows an embedded URL.
+            # Show the thumbnail rather than pulling the full-size file.
+            file_path = p.get("thumbPath") or p.get("filePath") or p.get("embedded")
+            if file_path and file_path.startswith("/"):
+                try:
+                    st.image(load_photo(file_path), width=250)
+                except Exception as e:
+                    st.warning(f"Could not load photo: {e}")
+            elif file_path:
                 st.image(file_path, width=250)
     else:
         st.info("No photos attached")
@@ -94,20 +115,22 @@ if st.button("Save Completion Info"):
     put_payload["completionNotes"] = (f"Time spent: {time_spent} minutes\n\n" + (completion_notes or ""))
     r = api_put(f"/requests/{request_id}", put_payload)
     if r is not None:
-        # If you want to upload files, you may need a dedicated upload route:
-        # Suggested route:
-        # POST /requests/{id}/photos  --> form-data with file inputs. Backend should save and return file paths.
-        # Below is an attempt; if backend lacks this endpoint it'll warn in except.
+        # POST /requests/{id}/photos stores each file once (by content) and thumbnails it
         if uploaded:
             try:
                 files = []
                 for f in uploaded:
                     files.append(("photos", (f.name, f.getvalue(), f.type)))
-                resp = requests.post(f"{API_BASE}/requests/{request_id}/photos", files=files, timeout=10)
+                resp = requests.post(
+                    f"{API_BASE}/requests/{request_id}/photos",
+                    files=files,
+                    data={"user_id": st.session_state.get("employee_id", 7)},
+                    timeout=30,
+                )
                 resp.raise_for_status()
                 st.success("Photos uploaded")
             except Exception as e:
-                st.warning(f"Photo upload failed (route may be missing): {e}")
+                st.warning(f"Photo upload failed: {e}")
         st.success("Completion notes saved")
 
 # Cancel request (soft-delete)
@@ -1,5 +1,6 @@
 import streamlit as st
 import requests
+import uuid
 from modules.nav import SideBarLinks
 from streamlit_extras.app_logo import add_logo
 
@@ -19,9 +20,25 @@ def api_get(path, params=None):
         st.error(f"GET failed: {e}")
         return []
 
-def api_post(path, payload):
+def idempotency_key(action, payload):
+    """
+    Idempotency-Key for an action: reused while the same payload is retried
+    (double click, rerun), so the API applies it once; new after a change.
+    """
+    pending = st.session_state.setdefault("idempotency_keys", {})
+    entry = pending.get(action)
+    if not entry or entry["payload"] != payload:
+        entry = {"payload": payload, "key": str(uuid.uuid4())}
+        pending[action] = entry
+    return entry["key"]
+
+def done_action(action):
+    st.session_state.get("idempotency_keys", {}).pop(action, None)
+
+def api_post(path, payload, key=None):
     try:
-        r = requests.post(f"{API_BASE}{path}", json=payload, timeout=6)
+        headers = {"Idempotency-Key": key} if key else None
+        r = requests.post(f"{API_BASE}{path}", json=payload, headers=headers, timeout=6)
         r.raise_for_status()
         # Some endpoints return JSON, some return empty body — handle both.
         try:
@@ -32,9 +49,10 @@ def api_post(path, payload):
         st.error(f"POST failed: {e}")
         return None
 
-def api_put(path, payload):
+def api_put(path, payload, key=None):
     try:
-        r = requests.put(f"{API_BASE}{path}", json=payload, timeout=6)
+        headers = {"Idempotency-Key": key} if key else None
+        r = requests.put(f"{API_BASE}{path}", json=payload, headers=headers, timeout=6)
         r.raise_for_status()
         try:
             return r.json()
@@ -49,7 +67,27 @@ def api_put(path, payload):
 # LOAD PARTS INVENTORY
 # -----------------------------
 st.subheader("Parts Inventory")
-parts = api_get("/employee/parts")
+
+
+def load_parts():
+    """Parts list, revalidated with its ETag so an unchanged list isn't downloaded again."""
+    cached = st.session_state.get("parts_cache")
+    headers = {"If-None-Match": cached["etag"]} if cached else None
+    try:
+        r = requests.get(f"{API_BASE}/employee/parts", headers=headers, timeout=6)
+        if r.status_code == 304 and cached:
+            return cached["parts"]
+        r.raise_for_status()
+        parts = r.json()
+        if r.headers.get("ETag"):
+            st.session_state["parts_cache"] = {"etag": r.headers["ETag"], "parts": parts}
+        return parts
+    except Exception as e:
+        st.error(f"GET failed: {e}")
+        return cached["parts"] if cached else []
+
+
+parts = load_parts()
 if not parts:
     st.info("No parts loaded.")
 
@@ -63,7 +101,13 @@ if isinstance(parts, dict):
         parts = list(parts.values())
 
 q = st.text_input("Search parts")
-filtered = [p for p in parts if q.lower() in p.get("name", "").lower()]
+# matching happens on the API, so only the matches are sent
+filtered = api_get("/employee/parts/search", {"q": q.strip(), "limit": 50}) if q.strip() else parts
+# no default, so stock is never booked against a request nobody picked
+request_id = st.number_input("Reserve parts for request ID", min_value=1, value=None, step=1,
+                             placeholder="Enter a request ID")
+if request_id is None:
+    st.caption("Enter a request ID to reserve parts.")
 
 for p in filtered:
     cols = st.columns([3, 1, 1, 2])
@@ -71,19 +115,50 @@ for p in filtered:
     cols[1].markdown(f"Qty: {p.get('quantity', 0)}")
     cols[2].markdown(f"Cost: {p.get('cost', 0)}")
 
-    # Request a part = subtract 1 quantity using the ACTUAL backend endpoint
+    # Request a part = reserve 1 unit for the request (takes it from stock and records it as used)
     if p.get('quantity', 0) > 0:
         with cols[3]:
-            if st.button("Request Part", key=f"req_{p.get('partID')}"):
-                payload = {"quantity_delta": -1}
-                resp = api_put(f"/employee/parts/{int(p.get('partID'))}/status", payload)
+            if st.button("Request Part", key=f"req_{p.get('partID')}", disabled=request_id is None):
+                payload = {"parts": [{"partID": int(p.get('partID')), "quantity": 1}]}
+                action = f"request_part_{int(request_id)}_{p.get('partID')}"
+                resp = api_post(f"/requests/{int(request_id)}/parts", payload,
+                                key=idempotency_key(action, payload))
                 if resp:
-                    st.success(f"Requested part '{p.get('name')}' (quantity -1)")
+                    done_action(action)
+                    st.success(f"Reserved part '{p.get('name')}' for request {int(request_id)}")
                     st.rerun()
     else:
         cols[3].markdown("Out of stock")
 
 
+# -----------------------------
+# REORDER SOON
+# -----------------------------
+st.markdown("---")
+st.subheader("Reorder Soon")
+reorder = api_get("/employee/parts/reorder")
+if isinstance(reorder, dict) and reorder.get("parts"):
+    st.caption(
+        f"At or below the reorder point: {reorder.get('leadTimeDays')} day lead time, "
+        f"usage over the last {reorder.get('windowDays')} days"
+    )
+    st.dataframe(
+        [
+            {
+                "Part": r["name"],
+                "Qty": r["quantity"],
+                "Reorder point": r["reorderPoint"],
+                "Days of stock": r["daysOfStock"],
+                "Suggested order": r["suggestedOrder"],
+            }
+            for r in reorder["parts"]
+        ],
+        use_container_width=True,
+    )
+else:
+    st.info("Nothing needs reordering.")
+
+
 # -----------------------------
 # ADD NEW PART
 # -----------------------------
@@ -101,23 +176,17 @@ with st.form("add_part"):
         if not name:
             st.error("Part name is required")
         else:
-            # compute next partID on client side to avoid DB NOT NULL / no-default error
-            try:
-                existing_ids = [int(p.get("partID", 0)) for p in parts if p.get("partID") is not None]
-            except Exception:
-                existing_ids = []
-            new_id = (max(existing_ids) + 1) if existing_ids else 1
-
+            # the API assigns the new partID
             payload = {
-                "partID": int(new_id),
                 "name": name,
                 "quantity": int(qty),
                 "cost": int(cost)
             }
-            result = api_post("/employee/parts", payload)
+            result = api_post("/employee/parts", payload, key=idempotency_key("add_part", payload))
 
             if result:
-                st.success(f"Part added (ID {new_id}).")
+                done_action("add_part")
+                st.success(f"Part added (ID {result.get('partID')}).")
                 st.rerun()
 
 
@@ -134,10 +203,13 @@ adjust = st.number_input(
 )
 
 if st.button("Apply Adjustment"):
+    payload = {"quantity_delta": int(adjust)}
     resp = api_put(
         f"/employee/parts/{int(part_id)}/status",
-        {"quantity_delta": int(adjust)}
+        payload,
+        key=idempotency_key(f"adjust_part_{int(part_id)}", payload),
     )
     if resp:
+        done_action(f"adjust_part_{int(part_id)}")
         st.success("Quantity adjustment applied.")
         st.rerun()
@@ -1,4 +1,5 @@
 import logging
+import uuid
 from datetime import date
 
 import requests
@@ -50,7 +51,27 @@ if submitted:
         "dateRequested": date_requested.isoformat(),
     }
     st.write("Sending:", payload)
-    resp = handle_response(requests.post(API_BASE, json=payload))
+    # one Idempotency-Key per request being submitted: a double click, rerun or
+    # retry after a timeout sends the same key, and the API returns the request
+    # it already created instead of making another one. Editing the form starts
+    # a new key.
+    pending = st.session_state.get("new_request_pending")
+    if not pending or pending["payload"] != payload:
+        pending = {"payload": payload, "key": str(uuid.uuid4())}
+        st.session_state["new_request_pending"] = pending
+    resp = None
+    for attempt in range(2):
+        try:
+            resp = handle_response(
+                requests.post(API_BASE, json=payload, headers={"Idempotency-Key": pending["key"]}, timeout=10)
+            )
+            break
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            logger.warning("Create request attempt %s failed: %s", attempt + 1, exc)
+    else:
+        st.error("Could not reach the API; press Submit again to retry safely.")
     if resp:
+        if resp.headers.get("Idempotent-Replayed"):
+            st.info("This request was already submitted; showing the original result.")
         st.success("Request created successfully.")
-        st.json(resp.json())
\ No newline at end of file
+        st.json(resp.json())
@@ -27,18 +27,23 @@ def handle_response(resp: requests.Response):
 
 with st.form("attach_photo"):
     request_id = st.number_input("Request ID", min_value=1, step=1)
-    photo_url = st.text_input("Photo URL", help="https://example.com/photos/request1001.jpg")
+    uploaded = st.file_uploader("Photos", accept_multiple_files=True, type=["png", "jpg", "jpeg", "gif", "webp"])
     submitted = st.form_submit_button("Attach photo")
 
 if submitted:
-    url = f"{API_BASE}/{int(request_id)}"
-
-    # Make sure update_request in Flask maps 'issuePhotos' -> issuePhotos column
-    payload = {"issuePhotos": photo_url}
-
-    st.write("Sending:", payload)
-    resp = handle_response(requests.put(url, json=payload))
-    if resp:
-        st.success("Photo attached / issuePhotos updated.")
-        if resp.content:
-            st.json(resp.json())
\ No newline at end of file
+    if not uploaded:
+        st.warning("Choose at least one photo.")
+    else:
+        url = f"{API_BASE}/{int(request_id)}/photos"
+
+        # the API stores each file once (by content) and makes a thumbnail in the background
+        files = [("photos", (f.name, f.getvalue(), f.type)) for f in uploaded]
+        data = {}
+        if st.session_state.get("student_id"):
+            data["user_id"] = st.session_state["student_id"]
+
+        resp = handle_response(requests.post(url, files=files, data=data, timeout=30))
+        if resp:
+            stored = resp.json().get("photos", [])
+            added = sum(1 for p in stored if not p.get("duplicate"))
+            st.success(f"Attached {added} photo(s)" + (f", {len(stored) - added} already attached" if added < len(stored) else ""))
\ No newline at end of file
@@ -31,37 +31,46 @@ def handle_response(resp: requests.Response):
 with st.form("recent_requests"):
     student_id = st.text_input("Student ID", value=st.session_state.get("student_id", ""))
     target_date = st.date_input(
-        "Updated on date",
+        "Updated since",
         value=date.today(),
-        help="Matches dateCompleted or scheduledDate",
+        help="Shows requests created or changed on or after this date",
     )
     limit = st.number_input("Max rows", min_value=1, max_value=500, value=200, step=1)
     submitted = st.form_submit_button("Load recent")
 
+# The API returns only rows changed after a watermark, so after the first load
+# "Refresh" asks for the delta and merges it into what we already have.
+sync = st.session_state.get("recent_requests_sync")
 if submitted:
-    day_str = target_date.isoformat()
-    params = {
+    sync = {
         "student_id": student_id,
-        "start_date": day_str,
-        "end_date": day_str,
+        "watermark": target_date.isoformat(),
+        "rows": {},
+    }
+    st.session_state["recent_requests_sync"] = sync
+
+refresh = st.button("Refresh") if sync else False
+if sync and (submitted or refresh):
+    params = {
+        "updated_since": sync["watermark"],
         "limit": int(limit),
-        "offset": 0,
     }
-    st.write("Query params:", params)
+    if sync["student_id"]:
+        params["student_id"] = sync["student_id"]
 
     resp = handle_response(requests.get(API_BASE, params=params))
     if resp:
-        rows = resp.json()
-        if not rows:
-            st.info("No requests found.")
-        else:
-            df = pd.DataFrame(rows)
-            # Keep only rows where completed or scheduled exactly equals target_date
-            mask = (df["dateCompleted"] == day_str) | (df["scheduledDate"] == day_str)
-            recent_df = df.loc[mask].sort_values(
-                ["dateCompleted", "scheduledDate"], ascending=False
-            )
-            if recent_df.empty:
-                st.info("No requests updated on that date.")
-            else:
-                st.dataframe(recent_df, use_container_width=True)
\ No newline at end of file
+        body = resp.json()
+        for row in body.get("results", []):
+            sync["rows"][row["requestID"]] = row
+        sync["watermark"] = body.get("watermark", sync["watermark"])
+        if body.get("has_more"):
+            st.info("More changes are waiting; press Refresh to load them.")
+
+if sync:
+    if not sync["rows"]:
+        st.info("No requests updated since that date.")
+    else:
+        df = pd.DataFrame(list(sync["rows"].values()))
+        df["lastModified"] = pd.to_datetime(df["lastModified"])
+        st.dataframe(df.sort_values("lastModified", ascending=False), use_container_width=True)
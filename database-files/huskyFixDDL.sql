@@ -47,6 +47,27 @@ CREATE TABLE apartment
 );
 
 
+-- request statuses; maintenanceRequest stores the code. Codes follow the
+-- technician board order and every active status is below Completed (5), so
+-- "active" is the index range statusCode < 5. Keep in sync with
+-- api/backend/requests/statuses.py
+DROP TABLE IF EXISTS requestStatus;
+CREATE TABLE requestStatus
+(
+    statusCode TINYINT PRIMARY KEY,
+    name       VARCHAR(50) UNIQUE NOT NULL,
+    isActive   BOOLEAN NOT NULL
+);
+
+insert into requestStatus (statusCode, name, isActive) values
+    (1, 'In Progress', TRUE),
+    (2, 'En Route', TRUE),
+    (3, 'Blocked', TRUE),
+    (4, 'Open', TRUE),
+    (5, 'Completed', FALSE),
+    (6, 'Canceled', FALSE);
+
+
 DROP TABLE IF EXISTS maintenanceRequest;
 CREATE TABLE maintenanceRequest
 (
@@ -56,7 +77,7 @@ CREATE TABLE maintenanceRequest
     aptNumber           INT NOT NULL,
     issueType           VARCHAR(50),
     issueDescription    TINYTEXT,
-    activeStatus        VARCHAR(50),   -- "En route", "In progress", "Blocked", "Completed"
+    statusCode          TINYINT NOT NULL DEFAULT 4, -- requestStatus code (4 = Open)
     dateRequested       DATE,
     dateCompleted       DATE,
 
@@ -64,9 +85,25 @@ CREATE TABLE maintenanceRequest
     scheduledDate       DATE,          -- day the job is scheduled
     issuePhotos         TEXT,          -- using text to reference path to photo? Idk what to put here
     completionNotes     TINYTEXT,
+    lastModified        TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6)
+                            ON UPDATE CURRENT_TIMESTAMP(6), -- delta sync watermark (GET /requests?updated_since=)
 
     FOREIGN KEY (studentRequestingID) REFERENCES student (studentID),
-    FOREIGN KEY (buildingID, aptNumber) REFERENCES apartment (buildingID, aptNumber)
+    FOREIGN KEY (buildingID, aptNumber) REFERENCES apartment (buildingID, aptNumber),
+    FOREIGN KEY (statusCode) REFERENCES requestStatus (statusCode),
+
+    -- access paths for GET /requests (newest first, requestID breaks ties for cursors)
+    -- and the /report routes; keep in sync with backend/db_tools/index_advisor.py
+    INDEX idx_mr_requested (dateRequested, requestID),
+    INDEX idx_mr_student_requested (studentRequestingID, dateRequested, requestID),
+    INDEX idx_mr_status_requested (statusCode, dateRequested, requestID),
+    INDEX idx_mr_priority_requested (priority, dateRequested, requestID),
+    INDEX idx_mr_building_requested (buildingID, dateRequested),
+    INDEX idx_mr_completed (dateCompleted, buildingID),
+    INDEX idx_mr_last_modified (lastModified, requestID),
+    -- GET /requests?sort=dispatch: status codes are in board order
+    INDEX idx_mr_dispatch (statusCode, priority DESC, dateRequested, requestID),
+    FULLTEXT INDEX ft_mr_text (issueDescription, completionNotes) -- GET /requests/search
 );
 
 DROP TABLE IF EXISTS tool;
@@ -93,9 +130,11 @@ CREATE TABLE partUsed
 (
     partID    INT,
     requestID INT,
+    quantity  INT NOT NULL DEFAULT 1, -- units of the part reserved for the request
     PRIMARY KEY (partID, requestID),
     FOREIGN KEY (partID) REFERENCES part (partID),
-    FOREIGN KEY (requestID) REFERENCES maintenanceRequest (requestID)
+    FOREIGN KEY (requestID) REFERENCES maintenanceRequest (requestID),
+    INDEX idx_pu_request (requestID, partID) -- PK leads with partID; reports join by request
 );
 
 DROP TABLE IF EXISTS toolUsed;
@@ -115,7 +154,69 @@ CREATE TABLE employeeAssigned
     requestID  INT,
     PRIMARY KEY (employeeID, requestID),
     FOREIGN KEY (employeeID) REFERENCES employee (employeeID),
-    FOREIGN KEY (requestID) REFERENCES maintenanceRequest (requestID)
+    FOREIGN KEY (requestID) REFERENCES maintenanceRequest (requestID),
+    INDEX idx_ea_request (requestID, employeeID) -- EXISTS probes by requestID
+);
+
+-- Photos uploaded through POST /requests/<id>/photos. Files live on the API
+-- host, stored once per content hash (api/backend/photos/storage.py).
+DROP TABLE IF EXISTS requestPhotos;
+CREATE TABLE requestPhotos
+(
+    photoID      INT AUTO_INCREMENT PRIMARY KEY,
+    requestID    INT NOT NULL,
+    contentHash  CHAR(64) NOT NULL,     -- SHA-256 of the file
+    filePath     VARCHAR(255) NOT NULL, -- URL path the API serves it from
+    contentType  VARCHAR(50) NOT NULL,
+    byteSize     INT NOT NULL,
+    originalName VARCHAR(255),
+    uploadedBy   INT,
+    uploadedAt   DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    FOREIGN KEY (requestID) REFERENCES maintenanceRequest (requestID),
+    UNIQUE KEY uq_rp_request_hash (requestID, contentHash), -- same photo twice on a request is a no-op
+    INDEX idx_rp_hash (contentHash)
+);
+
+-- Append-only timeline of status and assignment changes, written in batches
+-- by the API (api/backend/requests/history.py)
+DROP TABLE IF EXISTS requestHistory;
+CREATE TABLE requestHistory
+(
+    historyID  BIGINT AUTO_INCREMENT PRIMARY KEY,
+    requestID  INT NOT NULL,
+    eventType  VARCHAR(20) NOT NULL, -- 'created', 'status', 'assigned', 'unassigned'
+    oldStatus  TINYINT,              -- requestStatus codes ('status' events)
+    newStatus  TINYINT,
+    employeeID INT,                  -- employee assigned/unassigned
+    changedBy  INT,                  -- user_id sent with the change, if any
+    changedAt  DATETIME(6) NOT NULL,
+    note       VARCHAR(255),
+    FOREIGN KEY (requestID) REFERENCES maintenanceRequest (requestID),
+    FOREIGN KEY (oldStatus) REFERENCES requestStatus (statusCode),
+    FOREIGN KEY (newStatus) REFERENCES requestStatus (statusCode),
+    INDEX idx_rh_request (requestID, historyID)
+);
+
+-- Idempotency-Key results for retried POST/PUT calls
+-- (api/backend/db_connection/idempotency.py); rows expire after IDEMPOTENCY_TTL
+DROP TABLE IF EXISTS idempotencyKey;
+CREATE TABLE idempotencyKey
+(
+    keyHash      BINARY(32) PRIMARY KEY, -- SHA-256 of route + Idempotency-Key
+    requestHash  BINARY(32) NOT NULL,    -- SHA-256 of the request, to reject a reused key
+    statusCode   SMALLINT,               -- NULL while the first attempt is running
+    responseBody MEDIUMTEXT,
+    expiresAt    DATETIME NOT NULL,
+    INDEX idx_ik_expires (expiresAt)
+);
+
+-- Next free primary key per table, handed out in blocks by the API
+-- (backend/db_connection/ids.py); seeded at the bottom of this file.
+DROP TABLE IF EXISTS idSequence;
+CREATE TABLE idSequence
+(
+    name   VARCHAR(50) PRIMARY KEY,
+    nextID INT NOT NULL
 );
 
 insert into employee (employeeID, firstName, lastName, employeeType, email, salary) values (1, 'Lorelle', 'Glisenan', 'Mechanic', 'lglisenan0@elpais.com', 120688);
@@ -265,56 +366,56 @@ insert into apartment (buildingID, aptNumber, rentalCost, dateRented, renterID)
 insert into apartment (buildingID, aptNumber, rentalCost, dateRented, renterID) values (10, 5, 1177, '2025-02-15 08:28:52', 6);
 
 
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (1, 5, 2, 1, 'Plumbing', 'lorem ipsum dolor sit amet consectetuer adipiscing elit proin interdum mauris non ligula pellentesque ultrices phasellus id sapien', 'Completed', '2025-05-21 09:10:49', '2025-07-31 17:48:24', 3, '2025-06-02 13:25:58', 'http://dummyimage.com/229x100.png/5fa2dd/ffffff', 'donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien');
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (2, 7, 10, 4, 'Electrical', 'non mi integer ac neque duis bibendum morbi non quam nec dui luctus rutrum nulla tellus in sagittis', 'Blocked', '2025-11-27 07:12:17', NULL, 0, '2024-12-19 03:21:46', 'http://dummyimage.com/222x100.png/ff4444/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (3, 8, 10, 2, 'Structural', 'ipsum dolor sit amet consectetuer adipiscing elit proin risus praesent lectus vestibulum quam sapien varius ut', 'Completed', '2025-09-21 04:57:37', '2025-08-02 20:09:55', 1, '2025-05-19 22:52:39', 'http://dummyimage.com/193x100.png/5fa2dd/ffffff', 'orci nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate luctus cum sociis');
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (4, 16, 9, 1, 'Electrical', 'ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo etiam pretium iaculis', 'In progress', '2025-05-22 09:48:42', NULL, 3, '2025-10-12 18:53:28', 'http://dummyimage.com/163x100.png/ff4444/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (5, 8, 3, 2, 'Structural', 'donec odio justo sollicitudin ut suscipit a feugiat et eros vestibulum ac est', 'Blocked', '2025-08-19 18:36:21', NULL, 1, '2025-02-08 18:46:17', 'http://dummyimage.com/134x100.png/5fa2dd/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (6, 15, 9, 4, 'Structural', 'dolor morbi vel lectus in quam fringilla rhoncus mauris enim leo rhoncus', 'Completed', '2025-01-23 03:08:34', '2025-01-11 11:56:57', 4, '2025-07-02 13:26:36', 'http://dummyimage.com/170x100.png/ff4444/ffffff', 'donec ut dolor morbi vel lectus in quam fringilla rhoncus mauris enim leo rhoncus');
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (7, 23, 3, 5, 'Other', 'vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae duis faucibus accumsan', 'In progress', '2025-03-10 09:39:56', NULL, 4, '2025-02-27 16:24:42', 'http://dummyimage.com/126x100.png/ff4444/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (8, 25, 8, 3, 'Structural', 'a libero nam dui proin leo odio porttitor id consequat in consequat ut nulla', 'En Route', '2025-08-23 03:23:31', NULL, 3, '2025-07-05 16:42:13', 'http://dummyimage.com/215x100.png/ff4444/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (9, 30, 4, 2, 'Plumbing', 'consequat dui nec nisi volutpat eleifend donec ut dolor morbi vel', 'En Route', '2025-10-18 20:34:58', NULL, 1, '2025-08-26 05:38:14', 'http://dummyimage.com/182x100.png/cc0000/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (10, 39, 3, 5, 'Other', 'metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean lectus pellentesque eget nunc donec quis orci eget', 'Completed', '2025-01-05 06:54:19', '2025-09-06 09:20:54', 0, '2025-02-13 02:03:34', 'http://dummyimage.com/172x100.png/cc0000/ffffff', 'donec vitae nisi nam ultrices libero non mattis pulvinar nulla pede ullamcorper augue a suscipit nulla elit');
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (11, 26, 4, 2, 'Other', 'donec dapibus duis at velit eu est congue elementum in hac habitasse', 'Blocked', '2025-04-10 22:28:53', NULL, 4, '2025-01-19 20:46:24', 'http://dummyimage.com/243x100.png/5fa2dd/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (12, 8, 4, 5, 'Other', 'aliquet pulvinar sed nisl nunc rhoncus dui vel sem sed sagittis nam congue risus semper porta volutpat quam', 'In progress', '2025-02-08 01:37:16', NULL, 1, '2025-09-13 15:17:09', 'http://dummyimage.com/218x100.png/dddddd/000000', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (13, 25, 5, 4, 'Plumbing', 'morbi non lectus aliquam sit amet diam in magna bibendum', 'Completed', '2025-06-28 00:51:14', '2025-11-23 14:00:15', 0, '2025-03-02 22:06:33', 'http://dummyimage.com/206x100.png/dddddd/000000', 'donec ut mauris eget massa tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu');
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (14, 19, 6, 4, 'Other', 'nisl venenatis lacinia aenean sit amet justo morbi ut odio cras mi pede malesuada in imperdiet', 'En Route', '2025-11-15 01:39:59', NULL, 1, '2025-05-04 01:09:07', 'http://dummyimage.com/171x100.png/dddddd/000000', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (15, 32, 2, 5, 'Structural', 'tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu', 'In progress', '2025-01-03 11:27:14', NULL, 4, '2025-11-25 17:00:42', 'http://dummyimage.com/208x100.png/ff4444/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (16, 28, 3, 2, 'Electrical', 'condimentum curabitur in libero ut massa volutpat convallis morbi odio odio elementum eu interdum eu tincidunt', 'Blocked', '2025-06-25 23:35:05', NULL, 4, '2025-08-07 10:41:47', 'http://dummyimage.com/147x100.png/dddddd/000000', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (17, 30, 10, 3, 'Other', 'facilisi cras non velit nec nisi vulputate nonummy maecenas tincidunt lacus', 'En Route', '2025-02-07 09:28:32', NULL, 3, '2025-08-25 13:33:50', 'http://dummyimage.com/108x100.png/5fa2dd/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (18, 24, 8, 4, 'Other', 'tempus vel pede morbi porttitor lorem id ligula suspendisse ornare', 'Blocked', '2024-12-13 10:26:20', NULL, 1, '2025-09-19 06:33:57', 'http://dummyimage.com/186x100.png/dddddd/000000', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (19, 4, 6, 5, 'Other', 'diam cras pellentesque volutpat dui maecenas tristique est et tempus semper est quam pharetra magna ac consequat metus', 'En Route', '2025-01-31 12:51:25', NULL, 1, '2025-02-18 04:04:09', 'http://dummyimage.com/156x100.png/cc0000/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (20, 6, 5, 4, 'Plumbing', 'amet eros suspendisse accumsan tortor quis turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum', 'Blocked', '2025-07-09 21:43:22', NULL, 3, '2025-02-20 13:10:59', 'http://dummyimage.com/210x100.png/dddddd/000000', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (21, 10, 4, 5, 'Electrical', 'at vulputate vitae nisl aenean lectus pellentesque eget nunc donec quis orci eget orci vehicula condimentum', 'In progress', '2025-07-19 17:26:53', NULL, 0, '2025-03-27 10:01:48', 'http://dummyimage.com/226x100.png/ff4444/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (22, 39, 3, 2, 'Other', 'duis bibendum morbi non quam nec dui luctus rutrum nulla', 'In progress', '2025-02-22 08:26:12', NULL, 2, '2025-02-05 08:46:21', 'http://dummyimage.com/167x100.png/ff4444/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (23, 12, 5, 1, 'Electrical', 'praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget tempus vel pede', 'En Route', '2025-09-28 01:42:39', NULL, 1, '2025-04-13 21:27:48', 'http://dummyimage.com/108x100.png/5fa2dd/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (24, 32, 1, 3, 'Electrical', 'quisque ut erat curabitur gravida nisi at nibh in hac habitasse platea dictumst aliquam', 'Blocked', '2025-05-23 03:23:18', NULL, 3, '2024-12-29 08:35:30', 'http://dummyimage.com/249x100.png/5fa2dd/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (25, 14, 6, 4, 'Plumbing', 'amet cursus id turpis integer aliquet massa id lobortis convallis tortor', 'In progress', '2025-02-25 22:02:17', NULL, 2, '2025-06-24 07:50:31', 'http://dummyimage.com/235x100.png/cc0000/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (26, 14, 6, 3, 'Structural', 'vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel est donec', 'Blocked', '2025-02-09 08:40:23', NULL, 4, '2025-07-01 23:27:35', 'http://dummyimage.com/140x100.png/cc0000/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (27, 37, 9, 4, 'Electrical', 'justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat', 'Completed', '2025-02-12 12:35:54', '2025-07-21 20:04:20', 3, '2025-05-31 00:47:18', 'http://dummyimage.com/154x100.png/ff4444/ffffff', 'commodo vulputate justo in blandit ultrices enim lorem ipsum dolor sit amet consectetuer adipiscing elit proin interdum mauris');
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (28, 24, 6, 5, 'Electrical', 'lorem ipsum dolor sit amet consectetuer adipiscing elit proin interdum mauris non ligula pellentesque ultrices phasellus id sapien in', 'Blocked', '2025-09-04 03:33:02', NULL, 2, '2025-11-13 17:12:22', 'http://dummyimage.com/115x100.png/cc0000/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (29, 30, 1, 2, 'Other', 'nam dui proin leo odio porttitor id consequat in consequat ut nulla sed accumsan felis ut', 'Completed', '2025-02-08 00:21:54', '2025-09-29 10:50:35', 5, '2025-05-15 00:36:22', 'http://dummyimage.com/226x100.png/dddddd/000000', 'in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit');
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (30, 29, 8, 4, 'Structural', 'mattis nibh ligula nec sem duis aliquam convallis nunc proin at', 'Completed', '2025-04-08 09:07:40', '2025-03-29 19:52:17', 1, '2025-10-19 15:25:52', 'http://dummyimage.com/106x100.png/dddddd/000000', 'nam ultrices libero non mattis pulvinar nulla pede ullamcorper augue a suscipit');
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (31, 21, 2, 4, 'Structural', 'fusce consequat nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis', 'Completed', '2024-12-09 23:01:03', '2025-08-14 10:48:30', 0, '2025-11-29 05:45:01', 'http://dummyimage.com/213x100.png/ff4444/ffffff', 'facilisi cras non velit nec nisi vulputate nonummy maecenas tincidunt lacus at velit vivamus vel');
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (32, 6, 7, 5, 'Electrical', 'ut blandit non interdum in ante vestibulum ante ipsum primis in faucibus', 'Completed', '2025-07-02 20:25:06', '2025-10-23 02:49:17', 3, '2025-02-03 01:48:10', 'http://dummyimage.com/220x100.png/ff4444/ffffff', 'nisl duis bibendum felis sed interdum venenatis turpis enim blandit mi in porttitor pede justo eu massa');
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (33, 40, 1, 4, 'Electrical', 'quisque ut erat curabitur gravida nisi at nibh in hac habitasse platea dictumst aliquam augue quam', 'Blocked', '2025-02-19 18:11:23', NULL, 4, '2025-06-10 10:26:08', 'http://dummyimage.com/146x100.png/ff4444/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (34, 27, 10, 3, 'Electrical', 'neque vestibulum eget vulputate ut ultrices vel augue vestibulum ante ipsum primis in', 'En Route', '2024-12-17 01:38:14', NULL, 5, '2025-11-16 08:02:13', 'http://dummyimage.com/166x100.png/ff4444/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (35, 4, 7, 3, 'Structural', 'sapien varius ut blandit non interdum in ante vestibulum ante ipsum', 'En Route', '2025-09-26 16:23:47', NULL, 3, '2025-04-27 13:57:16', 'http://dummyimage.com/107x100.png/5fa2dd/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (36, 26, 2, 5, 'Plumbing', 'massa quis augue luctus tincidunt nulla mollis molestie lorem quisque', 'In progress', '2025-11-15 14:07:38', NULL, 4, '2025-10-30 07:40:57', 'http://dummyimage.com/193x100.png/5fa2dd/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (37, 16, 5, 4, 'Other', 'nunc proin at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum eget vulputate ut', 'Blocked', '2025-03-01 17:25:36', NULL, 0, '2025-10-29 04:13:10', 'http://dummyimage.com/177x100.png/cc0000/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (38, 2, 2, 1, 'Structural', 'sit amet diam in magna bibendum imperdiet nullam orci pede venenatis non', 'In progress', '2025-07-29 00:14:55', NULL, 0, '2025-11-01 17:08:36', 'http://dummyimage.com/207x100.png/5fa2dd/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (39, 37, 6, 1, 'Electrical', 'libero convallis eget eleifend luctus ultricies eu nibh quisque id justo sit amet sapien dignissim vestibulum', 'Completed', '2025-10-25 22:11:35', '2025-03-26 09:33:31', 4, '2025-03-16 23:21:05', 'http://dummyimage.com/218x100.png/cc0000/ffffff', 'amet turpis elementum ligula vehicula consequat morbi a ipsum integer a nibh in quis justo');
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (40, 21, 3, 4, 'Structural', 'molestie sed justo pellentesque viverra pede ac diam cras pellentesque volutpat dui maecenas', 'En Route', '2025-08-26 22:55:31', NULL, 5, '2025-08-20 14:41:21', 'http://dummyimage.com/116x100.png/cc0000/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (41, 22, 4, 1, 'Electrical', 'non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing', 'Blocked', '2025-01-14 17:16:20', NULL, 3, '2025-02-02 19:21:13', 'http://dummyimage.com/135x100.png/cc0000/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (42, 4, 6, 3, 'Electrical', 'odio consequat varius integer ac leo pellentesque ultrices mattis odio donec vitae nisi nam', 'In progress', '2025-01-06 05:48:23', NULL, 5, '2025-08-22 04:09:51', 'http://dummyimage.com/210x100.png/ff4444/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (43, 31, 2, 5, 'Other', 'in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat id mauris', 'Completed', '2025-02-21 03:36:41', '2025-10-03 22:17:38', 4, '2024-12-14 18:21:30', 'http://dummyimage.com/210x100.png/ff4444/ffffff', 'risus semper porta volutpat quam pede lobortis ligula sit amet eleifend pede libero quis orci nullam molestie nibh in lectus');
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (44, 30, 5, 5, 'Plumbing', 'aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia sapien quis', 'Blocked', '2024-12-04 03:03:06', NULL, 3, '2025-03-30 09:27:23', 'http://dummyimage.com/113x100.png/5fa2dd/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (45, 10, 7, 5, 'Other', 'erat nulla tempus vivamus in felis eu sapien cursus vestibulum proin eu mi nulla ac enim in', 'In progress', '2025-06-26 07:49:58', NULL, 4, '2025-06-16 04:40:49', 'http://dummyimage.com/192x100.png/5fa2dd/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (46, 17, 5, 2, 'Plumbing', 'congue risus semper porta volutpat quam pede lobortis ligula sit amet eleifend pede libero quis orci', 'In progress', '2025-06-23 14:38:46', NULL, 1, '2024-12-19 18:26:54', 'http://dummyimage.com/170x100.png/5fa2dd/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (47, 14, 7, 3, 'Plumbing', 'quisque ut erat curabitur gravida nisi at nibh in hac habitasse platea dictumst aliquam augue quam', 'Blocked', '2024-12-07 02:54:21', NULL, 0, '2025-06-05 23:01:16', 'http://dummyimage.com/199x100.png/cc0000/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (48, 31, 1, 1, 'Electrical', 'in faucibus orci luctus et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis', 'In progress', '2025-06-01 23:31:28', NULL, 3, '2025-11-12 19:50:10', 'http://dummyimage.com/215x100.png/cc0000/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (49, 20, 9, 4, 'Structural', 'luctus ultricies eu nibh quisque id justo sit amet sapien dignissim vestibulum', 'Blocked', '2025-04-28 09:06:34', NULL, 1, '2025-06-18 09:15:43', 'http://dummyimage.com/124x100.png/ff4444/ffffff', NULL);
-insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, activeStatus, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (50, 6, 8, 4, 'Structural', 'in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at', 'Blocked', '2024-12-24 00:33:03', NULL, 1, '2025-04-19 06:34:39', 'http://dummyimage.com/161x100.png/5fa2dd/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (1, 5, 2, 1, 'Plumbing', 'lorem ipsum dolor sit amet consectetuer adipiscing elit proin interdum mauris non ligula pellentesque ultrices phasellus id sapien', 5, '2025-05-21 09:10:49', '2025-07-31 17:48:24', 3, '2025-06-02 13:25:58', 'http://dummyimage.com/229x100.png/5fa2dd/ffffff', 'donec pharetra magna vestibulum aliquet ultrices erat tortor sollicitudin mi sit amet lobortis sapien');
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (2, 7, 10, 4, 'Electrical', 'non mi integer ac neque duis bibendum morbi non quam nec dui luctus rutrum nulla tellus in sagittis', 3, '2025-11-27 07:12:17', NULL, 0, '2024-12-19 03:21:46', 'http://dummyimage.com/222x100.png/ff4444/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (3, 8, 10, 2, 'Structural', 'ipsum dolor sit amet consectetuer adipiscing elit proin risus praesent lectus vestibulum quam sapien varius ut', 5, '2025-09-21 04:57:37', '2025-08-02 20:09:55', 1, '2025-05-19 22:52:39', 'http://dummyimage.com/193x100.png/5fa2dd/ffffff', 'orci nullam molestie nibh in lectus pellentesque at nulla suspendisse potenti cras in purus eu magna vulputate luctus cum sociis');
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (4, 16, 9, 1, 'Electrical', 'ut volutpat sapien arcu sed augue aliquam erat volutpat in congue etiam justo etiam pretium iaculis', 1, '2025-05-22 09:48:42', NULL, 3, '2025-10-12 18:53:28', 'http://dummyimage.com/163x100.png/ff4444/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (5, 8, 3, 2, 'Structural', 'donec odio justo sollicitudin ut suscipit a feugiat et eros vestibulum ac est', 3, '2025-08-19 18:36:21', NULL, 1, '2025-02-08 18:46:17', 'http://dummyimage.com/134x100.png/5fa2dd/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (6, 15, 9, 4, 'Structural', 'dolor morbi vel lectus in quam fringilla rhoncus mauris enim leo rhoncus', 5, '2025-01-23 03:08:34', '2025-01-11 11:56:57', 4, '2025-07-02 13:26:36', 'http://dummyimage.com/170x100.png/ff4444/ffffff', 'donec ut dolor morbi vel lectus in quam fringilla rhoncus mauris enim leo rhoncus');
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (7, 23, 3, 5, 'Other', 'vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae duis faucibus accumsan', 1, '2025-03-10 09:39:56', NULL, 4, '2025-02-27 16:24:42', 'http://dummyimage.com/126x100.png/ff4444/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (8, 25, 8, 3, 'Structural', 'a libero nam dui proin leo odio porttitor id consequat in consequat ut nulla', 2, '2025-08-23 03:23:31', NULL, 3, '2025-07-05 16:42:13', 'http://dummyimage.com/215x100.png/ff4444/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (9, 30, 4, 2, 'Plumbing', 'consequat dui nec nisi volutpat eleifend donec ut dolor morbi vel', 2, '2025-10-18 20:34:58', NULL, 1, '2025-08-26 05:38:14', 'http://dummyimage.com/182x100.png/cc0000/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (10, 39, 3, 5, 'Other', 'metus arcu adipiscing molestie hendrerit at vulputate vitae nisl aenean lectus pellentesque eget nunc donec quis orci eget', 5, '2025-01-05 06:54:19', '2025-09-06 09:20:54', 0, '2025-02-13 02:03:34', 'http://dummyimage.com/172x100.png/cc0000/ffffff', 'donec vitae nisi nam ultrices libero non mattis pulvinar nulla pede ullamcorper augue a suscipit nulla elit');
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (11, 26, 4, 2, 'Other', 'donec dapibus duis at velit eu est congue elementum in hac habitasse', 3, '2025-04-10 22:28:53', NULL, 4, '2025-01-19 20:46:24', 'http://dummyimage.com/243x100.png/5fa2dd/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (12, 8, 4, 5, 'Other', 'aliquet pulvinar sed nisl nunc rhoncus dui vel sem sed sagittis nam congue risus semper porta volutpat quam', 1, '2025-02-08 01:37:16', NULL, 1, '2025-09-13 15:17:09', 'http://dummyimage.com/218x100.png/dddddd/000000', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (13, 25, 5, 4, 'Plumbing', 'morbi non lectus aliquam sit amet diam in magna bibendum', 5, '2025-06-28 00:51:14', '2025-11-23 14:00:15', 0, '2025-03-02 22:06:33', 'http://dummyimage.com/206x100.png/dddddd/000000', 'donec ut mauris eget massa tempor convallis nulla neque libero convallis eget eleifend luctus ultricies eu');
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (14, 19, 6, 4, 'Other', 'nisl venenatis lacinia aenean sit amet justo morbi ut odio cras mi pede malesuada in imperdiet', 2, '2025-11-15 01:39:59', NULL, 1, '2025-05-04 01:09:07', 'http://dummyimage.com/171x100.png/dddddd/000000', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (15, 32, 2, 5, 'Structural', 'tristique fusce congue diam id ornare imperdiet sapien urna pretium nisl ut volutpat sapien arcu', 1, '2025-01-03 11:27:14', NULL, 4, '2025-11-25 17:00:42', 'http://dummyimage.com/208x100.png/ff4444/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (16, 28, 3, 2, 'Electrical', 'condimentum curabitur in libero ut massa volutpat convallis morbi odio odio elementum eu interdum eu tincidunt', 3, '2025-06-25 23:35:05', NULL, 4, '2025-08-07 10:41:47', 'http://dummyimage.com/147x100.png/dddddd/000000', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (17, 30, 10, 3, 'Other', 'facilisi cras non velit nec nisi vulputate nonummy maecenas tincidunt lacus', 2, '2025-02-07 09:28:32', NULL, 3, '2025-08-25 13:33:50', 'http://dummyimage.com/108x100.png/5fa2dd/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (18, 24, 8, 4, 'Other', 'tempus vel pede morbi porttitor lorem id ligula suspendisse ornare', 3, '2024-12-13 10:26:20', NULL, 1, '2025-09-19 06:33:57', 'http://dummyimage.com/186x100.png/dddddd/000000', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (19, 4, 6, 5, 'Other', 'diam cras pellentesque volutpat dui maecenas tristique est et tempus semper est quam pharetra magna ac consequat metus', 2, '2025-01-31 12:51:25', NULL, 1, '2025-02-18 04:04:09', 'http://dummyimage.com/156x100.png/cc0000/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (20, 6, 5, 4, 'Plumbing', 'amet eros suspendisse accumsan tortor quis turpis sed ante vivamus tortor duis mattis egestas metus aenean fermentum', 3, '2025-07-09 21:43:22', NULL, 3, '2025-02-20 13:10:59', 'http://dummyimage.com/210x100.png/dddddd/000000', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (21, 10, 4, 5, 'Electrical', 'at vulputate vitae nisl aenean lectus pellentesque eget nunc donec quis orci eget orci vehicula condimentum', 1, '2025-07-19 17:26:53', NULL, 0, '2025-03-27 10:01:48', 'http://dummyimage.com/226x100.png/ff4444/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (22, 39, 3, 2, 'Other', 'duis bibendum morbi non quam nec dui luctus rutrum nulla', 1, '2025-02-22 08:26:12', NULL, 2, '2025-02-05 08:46:21', 'http://dummyimage.com/167x100.png/ff4444/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (23, 12, 5, 1, 'Electrical', 'praesent blandit nam nulla integer pede justo lacinia eget tincidunt eget tempus vel pede', 2, '2025-09-28 01:42:39', NULL, 1, '2025-04-13 21:27:48', 'http://dummyimage.com/108x100.png/5fa2dd/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (24, 32, 1, 3, 'Electrical', 'quisque ut erat curabitur gravida nisi at nibh in hac habitasse platea dictumst aliquam', 3, '2025-05-23 03:23:18', NULL, 3, '2024-12-29 08:35:30', 'http://dummyimage.com/249x100.png/5fa2dd/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (25, 14, 6, 4, 'Plumbing', 'amet cursus id turpis integer aliquet massa id lobortis convallis tortor', 1, '2025-02-25 22:02:17', NULL, 2, '2025-06-24 07:50:31', 'http://dummyimage.com/235x100.png/cc0000/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (26, 14, 6, 3, 'Structural', 'vestibulum ante ipsum primis in faucibus orci luctus et ultrices posuere cubilia curae nulla dapibus dolor vel est donec', 3, '2025-02-09 08:40:23', NULL, 4, '2025-07-01 23:27:35', 'http://dummyimage.com/140x100.png/cc0000/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (27, 37, 9, 4, 'Electrical', 'justo etiam pretium iaculis justo in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat', 5, '2025-02-12 12:35:54', '2025-07-21 20:04:20', 3, '2025-05-31 00:47:18', 'http://dummyimage.com/154x100.png/ff4444/ffffff', 'commodo vulputate justo in blandit ultrices enim lorem ipsum dolor sit amet consectetuer adipiscing elit proin interdum mauris');
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (28, 24, 6, 5, 'Electrical', 'lorem ipsum dolor sit amet consectetuer adipiscing elit proin interdum mauris non ligula pellentesque ultrices phasellus id sapien in', 3, '2025-09-04 03:33:02', NULL, 2, '2025-11-13 17:12:22', 'http://dummyimage.com/115x100.png/cc0000/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (29, 30, 1, 2, 'Other', 'nam dui proin leo odio porttitor id consequat in consequat ut nulla sed accumsan felis ut', 5, '2025-02-08 00:21:54', '2025-09-29 10:50:35', 5, '2025-05-15 00:36:22', 'http://dummyimage.com/226x100.png/dddddd/000000', 'in lacus curabitur at ipsum ac tellus semper interdum mauris ullamcorper purus sit');
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (30, 29, 8, 4, 'Structural', 'mattis nibh ligula nec sem duis aliquam convallis nunc proin at', 5, '2025-04-08 09:07:40', '2025-03-29 19:52:17', 1, '2025-10-19 15:25:52', 'http://dummyimage.com/106x100.png/dddddd/000000', 'nam ultrices libero non mattis pulvinar nulla pede ullamcorper augue a suscipit');
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (31, 21, 2, 4, 'Structural', 'fusce consequat nulla nisl nunc nisl duis bibendum felis sed interdum venenatis turpis', 5, '2024-12-09 23:01:03', '2025-08-14 10:48:30', 0, '2025-11-29 05:45:01', 'http://dummyimage.com/213x100.png/ff4444/ffffff', 'facilisi cras non velit nec nisi vulputate nonummy maecenas tincidunt lacus at velit vivamus vel');
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (32, 6, 7, 5, 'Electrical', 'ut blandit non interdum in ante vestibulum ante ipsum primis in faucibus', 5, '2025-07-02 20:25:06', '2025-10-23 02:49:17', 3, '2025-02-03 01:48:10', 'http://dummyimage.com/220x100.png/ff4444/ffffff', 'nisl duis bibendum felis sed interdum venenatis turpis enim blandit mi in porttitor pede justo eu massa');
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (33, 40, 1, 4, 'Electrical', 'quisque ut erat curabitur gravida nisi at nibh in hac habitasse platea dictumst aliquam augue quam', 3, '2025-02-19 18:11:23', NULL, 4, '2025-06-10 10:26:08', 'http://dummyimage.com/146x100.png/ff4444/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (34, 27, 10, 3, 'Electrical', 'neque vestibulum eget vulputate ut ultrices vel augue vestibulum ante ipsum primis in', 2, '2024-12-17 01:38:14', NULL, 5, '2025-11-16 08:02:13', 'http://dummyimage.com/166x100.png/ff4444/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (35, 4, 7, 3, 'Structural', 'sapien varius ut blandit non interdum in ante vestibulum ante ipsum', 2, '2025-09-26 16:23:47', NULL, 3, '2025-04-27 13:57:16', 'http://dummyimage.com/107x100.png/5fa2dd/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (36, 26, 2, 5, 'Plumbing', 'massa quis augue luctus tincidunt nulla mollis molestie lorem quisque', 1, '2025-11-15 14:07:38', NULL, 4, '2025-10-30 07:40:57', 'http://dummyimage.com/193x100.png/5fa2dd/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (37, 16, 5, 4, 'Other', 'nunc proin at turpis a pede posuere nonummy integer non velit donec diam neque vestibulum eget vulputate ut', 3, '2025-03-01 17:25:36', NULL, 0, '2025-10-29 04:13:10', 'http://dummyimage.com/177x100.png/cc0000/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (38, 2, 2, 1, 'Structural', 'sit amet diam in magna bibendum imperdiet nullam orci pede venenatis non', 1, '2025-07-29 00:14:55', NULL, 0, '2025-11-01 17:08:36', 'http://dummyimage.com/207x100.png/5fa2dd/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (39, 37, 6, 1, 'Electrical', 'libero convallis eget eleifend luctus ultricies eu nibh quisque id justo sit amet sapien dignissim vestibulum', 5, '2025-10-25 22:11:35', '2025-03-26 09:33:31', 4, '2025-03-16 23:21:05', 'http://dummyimage.com/218x100.png/cc0000/ffffff', 'amet turpis elementum ligula vehicula consequat morbi a ipsum integer a nibh in quis justo');
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (40, 21, 3, 4, 'Structural', 'molestie sed justo pellentesque viverra pede ac diam cras pellentesque volutpat dui maecenas', 2, '2025-08-26 22:55:31', NULL, 5, '2025-08-20 14:41:21', 'http://dummyimage.com/116x100.png/cc0000/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (41, 22, 4, 1, 'Electrical', 'non ligula pellentesque ultrices phasellus id sapien in sapien iaculis congue vivamus metus arcu adipiscing', 3, '2025-01-14 17:16:20', NULL, 3, '2025-02-02 19:21:13', 'http://dummyimage.com/135x100.png/cc0000/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (42, 4, 6, 3, 'Electrical', 'odio consequat varius integer ac leo pellentesque ultrices mattis odio donec vitae nisi nam', 1, '2025-01-06 05:48:23', NULL, 5, '2025-08-22 04:09:51', 'http://dummyimage.com/210x100.png/ff4444/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (43, 31, 2, 5, 'Other', 'in hac habitasse platea dictumst etiam faucibus cursus urna ut tellus nulla ut erat id mauris', 5, '2025-02-21 03:36:41', '2025-10-03 22:17:38', 4, '2024-12-14 18:21:30', 'http://dummyimage.com/210x100.png/ff4444/ffffff', 'risus semper porta volutpat quam pede lobortis ligula sit amet eleifend pede libero quis orci nullam molestie nibh in lectus');
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (44, 30, 5, 5, 'Plumbing', 'aliquet massa id lobortis convallis tortor risus dapibus augue vel accumsan tellus nisi eu orci mauris lacinia sapien quis', 3, '2024-12-04 03:03:06', NULL, 3, '2025-03-30 09:27:23', 'http://dummyimage.com/113x100.png/5fa2dd/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (45, 10, 7, 5, 'Other', 'erat nulla tempus vivamus in felis eu sapien cursus vestibulum proin eu mi nulla ac enim in', 1, '2025-06-26 07:49:58', NULL, 4, '2025-06-16 04:40:49', 'http://dummyimage.com/192x100.png/5fa2dd/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (46, 17, 5, 2, 'Plumbing', 'congue risus semper porta volutpat quam pede lobortis ligula sit amet eleifend pede libero quis orci', 1, '2025-06-23 14:38:46', NULL, 1, '2024-12-19 18:26:54', 'http://dummyimage.com/170x100.png/5fa2dd/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (47, 14, 7, 3, 'Plumbing', 'quisque ut erat curabitur gravida nisi at nibh in hac habitasse platea dictumst aliquam augue quam', 3, '2024-12-07 02:54:21', NULL, 0, '2025-06-05 23:01:16', 'http://dummyimage.com/199x100.png/cc0000/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (48, 31, 1, 1, 'Electrical', 'in faucibus orci luctus et ultrices posuere cubilia curae duis faucibus accumsan odio curabitur convallis', 1, '2025-06-01 23:31:28', NULL, 3, '2025-11-12 19:50:10', 'http://dummyimage.com/215x100.png/cc0000/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (49, 20, 9, 4, 'Structural', 'luctus ultricies eu nibh quisque id justo sit amet sapien dignissim vestibulum', 3, '2025-04-28 09:06:34', NULL, 1, '2025-06-18 09:15:43', 'http://dummyimage.com/124x100.png/ff4444/ffffff', NULL);
+insert into maintenanceRequest (requestID, studentRequestingID, buildingID, aptNumber, issueType, issueDescription, statusCode, dateRequested, dateCompleted, priority, scheduledDate, issuePhotos, completionNotes) values (50, 6, 8, 4, 'Structural', 'in sapien iaculis congue vivamus metus arcu adipiscing molestie hendrerit at', 3, '2024-12-24 00:33:03', NULL, 1, '2025-04-19 06:34:39', 'http://dummyimage.com/161x100.png/5fa2dd/ffffff', NULL);
 
 insert into part (partID, name, cost, quantity) values (1, 'Wall Art', 98, 5);
 insert into part (partID, name, cost, quantity) values (2, 'Protein Bar Variety Pack', 92, 64);
@@ -759,3 +860,7 @@ insert into employeeAssigned (employeeID, requestID) values (5, 16);
 insert into employeeAssigned (employeeID, requestID) values (7, 22);
 insert into employeeAssigned (employeeID, requestID) values (18, 38);
 
+-- continue id sequences after the sample data
+insert into idSequence (name, nextID) select 'maintenanceRequest', COALESCE(MAX(requestID), 0) + 1 from maintenanceRequest;
+insert into idSequence (name, nextID) select 'part', COALESCE(MAX(partID), 0) + 1 from part;
+insert into idSequence (name, nextID) select 'building', COALESCE(MAX(buildingID), 0) + 1 from building;
@@ -0,0 +1,15 @@
+-- Adds the idSequence table to an existing husky-fix database.
+-- New databases get it from huskyFixDDL.sql; only run this by hand, e.g.
+--   docker exec -i mysql_db mysql -uroot -p husky-fix < database-files/migrations/001_id_sequence.sql
+-- Files in this folder are NOT run automatically when the db container is created.
+USE `husky-fix`;
+
+CREATE TABLE IF NOT EXISTS idSequence
+(
+    name   VARCHAR(50) PRIMARY KEY,
+    nextID INT NOT NULL
+);
+
+insert ignore into idSequence (name, nextID) select 'maintenanceRequest', COALESCE(MAX(requestID), 0) + 1 from maintenanceRequest;
+insert ignore into idSequence (name, nextID) select 'part', COALESCE(MAX(partID), 0) + 1 from part;
+insert ignore into idSequence (name, nextID) select 'building', COALESCE(MAX(buildingID), 0) + 1 from building;
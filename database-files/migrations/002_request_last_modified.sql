@@ -0,0 +1,8 @@
+-- Adds maintenanceRequest.lastModified (delta sync for GET /requests?updated_since=)
+-- to an existing husky-fix database. Existing rows start at the migration time.
+USE `husky-fix`;
+
+ALTER TABLE maintenanceRequest
+    ADD COLUMN lastModified TIMESTAMP(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6)
+        ON UPDATE CURRENT_TIMESTAMP(6),
+    ADD INDEX idx_mr_last_modified (lastModified, requestID);
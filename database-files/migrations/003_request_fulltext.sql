@@ -0,0 +1,5 @@
+-- Adds the FULLTEXT index behind GET /requests/search to an existing husky-fix database.
+USE `husky-fix`;
+
+ALTER TABLE maintenanceRequest
+    ADD FULLTEXT INDEX ft_mr_text (issueDescription, completionNotes);
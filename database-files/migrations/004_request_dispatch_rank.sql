@@ -0,0 +1,10 @@
+-- Adds the precomputed dispatch sort key (GET /requests?sort=dispatch) to an
+-- existing husky-fix database. statusRank is a stored generated column, so MySQL
+-- keeps it current on every insert/update.
+USE `husky-fix`;
+
+ALTER TABLE maintenanceRequest
+    ADD COLUMN statusRank TINYINT AS (CASE LOWER(activeStatus)
+        WHEN 'in progress' THEN 0 WHEN 'en route' THEN 1 WHEN 'blocked' THEN 2
+        WHEN 'open' THEN 3 WHEN 'completed' THEN 4 ELSE 5 END) STORED,
+    ADD INDEX idx_mr_dispatch (statusRank, priority DESC, dateRequested, requestID);
@@ -0,0 +1,118 @@
+-- Replaces the free-text maintenanceRequest.activeStatus with a small integer
+-- statusCode backed by the requestStatus lookup table. Existing spellings
+-- ('open', 'Open', 'In progress', 'completed', 'canceled', ...) are folded onto
+-- one code each; anything unrecognised becomes Open (4).
+-- Run after 004 (its statusRank column depends on activeStatus and is replaced
+-- by ordering on statusCode directly).
+-- Every step checks information_schema first, so the script works whether or
+-- not the database has the huskyFixDDL.sql indexes (idx_mr_status_requested),
+-- and it can be re-run after a partial failure.
+USE `husky-fix`;
+
+CREATE TABLE IF NOT EXISTS requestStatus
+(
+    statusCode TINYINT PRIMARY KEY,
+    name       VARCHAR(50) UNIQUE NOT NULL,
+    isActive   BOOLEAN NOT NULL
+);
+
+INSERT IGNORE INTO requestStatus (statusCode, name, isActive) VALUES
+    (1, 'In Progress', TRUE),
+    (2, 'En Route', TRUE),
+    (3, 'Blocked', TRUE),
+    (4, 'Open', TRUE),
+    (5, 'Completed', FALSE),
+    (6, 'Canceled', FALSE);
+
+-- statusCode, filled from activeStatus while that column is still there
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'maintenanceRequest' AND COLUMN_NAME = 'statusCode') = 0,
+    'ALTER TABLE maintenanceRequest ADD COLUMN statusCode TINYINT NOT NULL DEFAULT 4 AFTER issueDescription',
+    'DO 0'
+);
+PREPARE stmt FROM @ddl; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'maintenanceRequest' AND COLUMN_NAME = 'activeStatus') > 0,
+    'UPDATE maintenanceRequest
+     SET statusCode = CASE REPLACE(REPLACE(LOWER(TRIM(activeStatus)), ''-'', '' ''), ''_'', '' '')
+         WHEN ''in progress'' THEN 1
+         WHEN ''en route'' THEN 2
+         WHEN ''enroute'' THEN 2
+         WHEN ''blocked'' THEN 3
+         WHEN ''open'' THEN 4
+         WHEN ''completed'' THEN 5
+         WHEN ''complete'' THEN 5
+         WHEN ''closed'' THEN 5
+         WHEN ''canceled'' THEN 6
+         WHEN ''cancelled'' THEN 6
+         ELSE 4 END',
+    'DO 0'
+);
+PREPARE stmt FROM @ddl; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- the old indexes, only where they are still on statusRank / activeStatus
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.STATISTICS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'maintenanceRequest'
+       AND INDEX_NAME = 'idx_mr_dispatch' AND COLUMN_NAME = 'statusRank') > 0,
+    'ALTER TABLE maintenanceRequest DROP INDEX idx_mr_dispatch',
+    'DO 0'
+);
+PREPARE stmt FROM @ddl; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.STATISTICS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'maintenanceRequest'
+       AND INDEX_NAME = 'idx_mr_status_requested' AND COLUMN_NAME = 'activeStatus') > 0,
+    'ALTER TABLE maintenanceRequest DROP INDEX idx_mr_status_requested',
+    'DO 0'
+);
+PREPARE stmt FROM @ddl; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- statusRank is generated from activeStatus, so it goes first
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'maintenanceRequest' AND COLUMN_NAME = 'statusRank') > 0,
+    'ALTER TABLE maintenanceRequest DROP COLUMN statusRank',
+    'DO 0'
+);
+PREPARE stmt FROM @ddl; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.COLUMNS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'maintenanceRequest' AND COLUMN_NAME = 'activeStatus') > 0,
+    'ALTER TABLE maintenanceRequest DROP COLUMN activeStatus',
+    'DO 0'
+);
+PREPARE stmt FROM @ddl; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+-- the statusCode indexes (before the foreign key, which then reuses one)
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.STATISTICS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'maintenanceRequest'
+       AND INDEX_NAME = 'idx_mr_status_requested') = 0,
+    'ALTER TABLE maintenanceRequest ADD INDEX idx_mr_status_requested (statusCode, dateRequested, requestID)',
+    'DO 0'
+);
+PREPARE stmt FROM @ddl; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.STATISTICS
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'maintenanceRequest'
+       AND INDEX_NAME = 'idx_mr_dispatch') = 0,
+    'ALTER TABLE maintenanceRequest ADD INDEX idx_mr_dispatch (statusCode, priority DESC, dateRequested, requestID)',
+    'DO 0'
+);
+PREPARE stmt FROM @ddl; EXECUTE stmt; DEALLOCATE PREPARE stmt;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.KEY_COLUMN_USAGE
+     WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'maintenanceRequest'
+       AND COLUMN_NAME = 'statusCode' AND REFERENCED_TABLE_NAME = 'requestStatus') = 0,
+    'ALTER TABLE maintenanceRequest ADD FOREIGN KEY (statusCode) REFERENCES requestStatus (statusCode)',
+    'DO 0'
+);
+PREPARE stmt FROM @ddl; EXECUTE stmt; DEALLOCATE PREPARE stmt;
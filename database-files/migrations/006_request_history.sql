@@ -0,0 +1,20 @@
+-- Adds the requestHistory timeline (status and assignment changes, written in
+-- batches by the API) to an existing husky-fix database. Run after 005.
+USE `husky-fix`;
+
+CREATE TABLE IF NOT EXISTS requestHistory
+(
+    historyID  BIGINT AUTO_INCREMENT PRIMARY KEY,
+    requestID  INT NOT NULL,
+    eventType  VARCHAR(20) NOT NULL,
+    oldStatus  TINYINT,
+    newStatus  TINYINT,
+    employeeID INT,
+    changedBy  INT,
+    changedAt  DATETIME(6) NOT NULL,
+    note       VARCHAR(255),
+    FOREIGN KEY (requestID) REFERENCES maintenanceRequest (requestID),
+    FOREIGN KEY (oldStatus) REFERENCES requestStatus (statusCode),
+    FOREIGN KEY (newStatus) REFERENCES requestStatus (statusCode),
+    INDEX idx_rh_request (requestID, historyID)
+);
@@ -0,0 +1,19 @@
+-- Adds requestPhotos (uploads through POST /requests/<id>/photos) to an
+-- existing husky-fix database.
+USE `husky-fix`;
+
+CREATE TABLE IF NOT EXISTS requestPhotos
+(
+    photoID      INT AUTO_INCREMENT PRIMARY KEY,
+    requestID    INT NOT NULL,
+    contentHash  CHAR(64) NOT NULL,
+    filePath     VARCHAR(255) NOT NULL,
+    contentType  VARCHAR(50) NOT NULL,
+    byteSize     INT NOT NULL,
+    originalName VARCHAR(255),
+    uploadedBy   INT,
+    uploadedAt   DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    FOREIGN KEY (requestID) REFERENCES maintenanceRequest (requestID),
+    UNIQUE KEY uq_rp_request_hash (requestID, contentHash),
+    INDEX idx_rp_hash (contentHash)
+);
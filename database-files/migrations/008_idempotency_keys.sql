@@ -0,0 +1,14 @@
+-- Adds the idempotencyKey table (Idempotency-Key header on POST /requests,
+-- POST /employee/parts and PUT /employee/parts/<id>/status) to an existing
+-- husky-fix database.
+USE `husky-fix`;
+
+CREATE TABLE IF NOT EXISTS idempotencyKey
+(
+    keyHash      BINARY(32) PRIMARY KEY,
+    requestHash  BINARY(32) NOT NULL,
+    statusCode   SMALLINT,
+    responseBody MEDIUMTEXT,
+    expiresAt    DATETIME NOT NULL,
+    INDEX idx_ik_expires (expiresAt)
+);
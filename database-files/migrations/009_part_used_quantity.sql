@@ -0,0 +1,7 @@
+-- Adds partUsed.quantity (POST /requests/<id>/parts reserves several units of a
+-- part per request) to an existing husky-fix database. Existing rows count as
+-- one unit each, which is what they meant before.
+USE `husky-fix`;
+
+ALTER TABLE partUsed
+    ADD COLUMN quantity INT NOT NULL DEFAULT 1 AFTER requestID;